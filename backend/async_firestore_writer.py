@@ -0,0 +1,141 @@
+"""Async Firestore writer for puzzle storage (firebase_admin.firestore_async client)"""
+import asyncio
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from firebase_admin import firestore
+
+from firestore_writer import DELETE_PAGE_SIZE, MAX_CONCURRENT_DELETE_COMMITS, PuzzleDocuments
+from instrumentation import metrics
+
+
+class AsyncFirestoreWriter(PuzzleDocuments):
+    """
+    Writes puzzles with the async Firestore client.
+
+    Same documents and semantics as FirestoreWriter, but every call is a
+    coroutine so the request pipeline can overlap them: old puzzles are
+    deleted concurrently with each other and with the new write, and the
+    batch commits deleting a puzzle's results run while its next page of
+    keys is read. It shares only the document building with FirestoreWriter,
+    so no sync method is ever called on the async client.
+    """
+
+    def __init__(self, db, payload_versions: Dict[str, int] = None):
+        """
+        Initialize writer with an async Firestore database instance.
+
+        Args:
+            db: firebase_admin.firestore_async.client() instance
+            payload_versions: Payload encoding per game type (see payload_codec)
+        """
+        super().__init__(db, payload_versions)
+        self._commit_slots = asyncio.Semaphore(MAX_CONCURRENT_DELETE_COMMITS)
+
+    async def write_puzzle(self, game_type: str, date_str: str, payload: Dict[str, Any]) -> str:
+        """
+        Write a puzzle to Firestore.
+
+        Returns:
+            puzzle_id: The document ID that was created
+        """
+        puzzle_id, puzzle_doc = self._puzzle_doc(game_type, date_str, payload)
+        await self.db.collection("puzzles").document(puzzle_id).set(puzzle_doc)
+
+        print(f"✅ Puzzle written to Firestore: {puzzle_id}")
+        return puzzle_id
+
+    async def get_puzzle_hashes(self, game_type: str) -> List[int]:
+        """Read the canonical puzzle hashes stored in the game type's index doc"""
+        doc = await self.db.collection("puzzleIndex").document(game_type).get()
+        if not doc.exists:
+            return []
+        return doc.to_dict().get("hashes", [])
+
+    async def add_puzzle_hash(self, game_type: str, puzzle_hash: int) -> None:
+        """Append a canonical puzzle hash to the game type's index doc (atomic)"""
+        doc_ref = self.db.collection("puzzleIndex").document(game_type)
+        await doc_ref.set({"hashes": firestore.ArrayUnion([puzzle_hash])}, merge=True)
+
+    async def puzzle_exists(self, game_type: str, date_str: str) -> bool:
+        """Check if a puzzle already exists for the given game type and date"""
+        doc = await self.db.collection("puzzles").document(f"{game_type}_{date_str}").get()
+        return doc.exists
+
+    async def delete_old_puzzles(self, game_type: str, keep_date: str, before: Optional[str] = None) -> int:
+        """
+        Delete all puzzles for a game type except the one for keep_date,
+        with their user results. Old puzzles are deleted concurrently, with
+        keys-only paged queries and batch commits as in FirestoreWriter.
+
+        Returns:
+            Number of puzzles deleted
+        """
+        start = time.perf_counter()
+        keep_puzzle_id = f"{game_type}_{keep_date}"
+
+        puzzles_query = self.db.collection("puzzles").where("gameType", "==", game_type)
+        old_puzzles = [
+            puzzle_ref
+            async for page in self._key_pages(puzzles_query)
+            for puzzle_ref in page
+            if self._is_old(puzzle_ref.id, keep_puzzle_id, before)
+        ]
+        deletes = await asyncio.gather(*(self._delete_puzzle(puzzle_ref) for puzzle_ref in old_puzzles))
+        results_deleted = sum(results for results, _ in deletes)
+
+        self.last_delete = {
+            "puzzlesDeleted": len(old_puzzles),
+            "resultsDeleted": results_deleted,
+            "batchCommits": sum(commits for _, commits in deletes),
+            "seconds": round(time.perf_counter() - start, 4)
+        }
+        metrics.count("puzzlesDeleted", len(old_puzzles))
+        metrics.count("resultsDeleted", results_deleted)
+        metrics.count("deleteCommits", self.last_delete["batchCommits"])
+        if old_puzzles:
+            print(f"✅ Deleted {len(old_puzzles)} old puzzle(s) and {results_deleted} result(s) "
+                  f"in {self.last_delete['batchCommits']} batch commit(s), {self.last_delete['seconds']:.2f}s, "
+                  f"kept: {keep_puzzle_id}")
+        else:
+            print(f"ℹ️  No old puzzles to delete")
+
+        return len(old_puzzles)
+
+    async def _delete_puzzle(self, puzzle_ref) -> Tuple[int, int]:
+        """
+        Delete a puzzle after its results, a batch commit per page of result keys.
+
+        Returns:
+            (results deleted, batch commits)
+        """
+        results_query = self.db.collection("results").where("puzzleId", "==", puzzle_ref.id)
+        commits = [
+            asyncio.ensure_future(self._commit_deletes(page))
+            async for page in self._key_pages(results_query)
+        ]
+        results_deleted = sum(await asyncio.gather(*commits))
+        await self._commit_deletes([puzzle_ref])
+        print(f"🗑️  Deleted old puzzle: {puzzle_ref.id} ({results_deleted} results)")
+        return results_deleted, len(commits) + 1
+
+    async def _key_pages(self, query) -> AsyncIterator[List[Any]]:
+        """Document references matching a query, in keys-only pages of DELETE_PAGE_SIZE"""
+        query = query.select([]).order_by(firestore.FieldPath.document_id()).limit(DELETE_PAGE_SIZE)
+        page_query = query
+        while True:
+            snapshots = [snapshot async for snapshot in page_query.stream()]
+            if snapshots:
+                yield [snapshot.reference for snapshot in snapshots]
+            if len(snapshots) < DELETE_PAGE_SIZE:
+                return
+            page_query = query.start_after(snapshots[-1])
+
+    async def _commit_deletes(self, doc_refs: List[Any]) -> int:
+        """Delete documents in one batch commit, keeping at most MAX_CONCURRENT_DELETE_COMMITS in flight"""
+        batch = self.db.batch()
+        for doc_ref in doc_refs:
+            batch.delete(doc_ref)
+        async with self._commit_slots:
+            await batch.commit()
+        return len(doc_refs)
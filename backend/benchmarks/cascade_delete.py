@@ -0,0 +1,71 @@
+"""
+Cascading delete benchmark.
+
+Seeds the in-memory Firestore fake (fake_firestore.py) with old puzzles and
+their user results, then times FirestoreWriter.delete_old_puzzles: wall
+time, Firestore round trips and batch commits. For comparison it prints the
+round trips of deleting every result with its own call, which the cascade
+did before it used keys-only pages and batch commits.
+
+Usage:
+    python benchmarks/cascade_delete.py [--results 50000] [--puzzles 1] [--latency-ms 50]
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fake_firestore import FakeFirestore  # noqa: E402
+from firestore_writer import FirestoreWriter  # noqa: E402
+
+
+def seed(db, game_type, puzzles, results):
+    """Old puzzles (one per day before 2025-02-01) with results each, plus the kept puzzle"""
+    dates = [f"2025-01-{day:02d}" for day in range(1, puzzles + 1)] + ["2025-02-01"]
+    for date_str in dates:
+        puzzle_id = f"{game_type}_{date_str}"
+        db.data.setdefault("puzzles", {})[puzzle_id] = {"gameType": game_type, "date": date_str}
+        for user in range(results):
+            db.data.setdefault("results", {})[f"{puzzle_id}_user{user:06d}"] = {"puzzleId": puzzle_id}
+    return dates[-1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cascading delete benchmark")
+    parser.add_argument("--results", type=int, default=50000, help="Results per old puzzle")
+    parser.add_argument("--puzzles", type=int, default=1, help="Old puzzles to delete")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="Simulated Firestore round trip")
+    args = parser.parse_args()
+
+    db = FakeFirestore(latency=args.latency_ms / 1000)
+    keep_date = seed(db, "ZIP", args.puzzles, args.results)
+    writer = FirestoreWriter(db)
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        writer.delete_old_puzzles("ZIP", keep_date)
+    seconds = time.perf_counter() - start
+
+    # Per-document cascade: one puzzle query, then per puzzle a results query,
+    # a delete per result and the puzzle delete
+    serial_round_trips = 1 + args.puzzles * (args.results + 2)
+    remaining = len(db.data["results"]) - args.results
+    print(f"Deleted {writer.last_delete['puzzlesDeleted']} puzzle(s) and "
+          f"{writer.last_delete['resultsDeleted']} result(s) at {args.latency_ms:.0f} ms per round trip")
+    print(f"   {'wall time':<22}{seconds:>10.2f} s")
+    print(f"   {'round trips':<22}{db.round_trips:>10}")
+    print(f"   {'batch commits':<22}{db.commits:>10}")
+    print(f"   {'per-document cascade':<22}{serial_round_trips:>10} round trips, "
+          f"~{serial_round_trips * args.latency_ms / 1000:.0f} s serial")
+    if remaining:
+        print(f"❌ {remaining} result(s) of deleted puzzles left behind")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
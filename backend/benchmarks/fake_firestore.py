@@ -0,0 +1,179 @@
+"""
+In-memory stand-in for the Firestore client, for benchmarks.
+
+Implements the subset of google.cloud.firestore the backend uses:
+collection/document references, get/set(merge)/delete, equality where()
+queries with select/order_by/limit/start_after, get_all, write batches and
+ArrayUnion transforms. Every call can be given a simulated round-trip
+latency so request-path benchmarks see I/O cost without a network. Calls
+may come from several threads (e.g. concurrent batch commits).
+"""
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+
+class FakeSnapshot:
+    def __init__(self, reference: "FakeDocument", data: Optional[Dict[str, Any]]):
+        self.reference = reference
+        self.id = reference.id
+        self.exists = data is not None
+        self._data = data
+
+    def to_dict(self) -> Optional[Dict[str, Any]]:
+        return dict(self._data) if self._data is not None else None
+
+    def get(self, field: str) -> Any:
+        return self._data.get(field)
+
+
+class FakeDocument:
+    def __init__(self, db: "FakeFirestore", collection: str, doc_id: str):
+        self.db = db
+        self.collection_name = collection
+        self.id = doc_id
+
+    def get(self) -> FakeSnapshot:
+        self.db._round_trip()
+        return self._snapshot()
+
+    def set(self, doc: Dict[str, Any], merge: bool = False) -> None:
+        self.db._round_trip()
+        self._apply_set(doc, merge)
+
+    def delete(self) -> None:
+        self.db._round_trip()
+        self._apply_delete()
+
+    def _snapshot(self) -> FakeSnapshot:
+        return FakeSnapshot(self, self.db.data.get(self.collection_name, {}).get(self.id))
+
+    def _apply_set(self, doc: Dict[str, Any], merge: bool) -> None:
+        collection = self.db.data.setdefault(self.collection_name, {})
+        current = dict(collection.get(self.id) or {}) if merge else {}
+        for field, value in doc.items():
+            if type(value).__name__ == "ArrayUnion":
+                array = list(current.get(field, []))
+                array.extend(item for item in value.values if item not in array)
+                current[field] = array
+            else:
+                current[field] = value
+        collection[self.id] = current
+
+    def _apply_delete(self) -> None:
+        self.db.data.get(self.collection_name, {}).pop(self.id, None)
+
+
+class FakeQuery:
+    def __init__(self, db: "FakeFirestore", collection: str, filters=(), limit_count=None, after=None):
+        self.db = db
+        self.collection_name = collection
+        self.filters = list(filters)
+        self.limit_count = limit_count
+        self.after = after
+
+    def where(self, field_path=None, op_string=None, value=None, filter=None) -> "FakeQuery":
+        if filter is not None:
+            field_path, op_string, value = filter.field_path, filter.op_string, filter.value
+        if op_string != "==":
+            raise NotImplementedError(f"FakeFirestore only supports == filters, got {op_string}")
+        return self._copy(filters=self.filters + [(field_path, value)])
+
+    def select(self, field_paths: Iterable[str]) -> "FakeQuery":
+        return self._copy()
+
+    def order_by(self, field_path: str, direction: Any = None) -> "FakeQuery":
+        # Results are always in document ID order
+        return self._copy()
+
+    def limit(self, count: int) -> "FakeQuery":
+        return self._copy(limit_count=count)
+
+    def start_after(self, snapshot: FakeSnapshot) -> "FakeQuery":
+        return self._copy(after=snapshot.id)
+
+    def stream(self):
+        self.db._round_trip()
+        matches = []
+        with self.db.lock:
+            documents = sorted(self.db.data.get(self.collection_name, {}).items())
+        for doc_id, data in documents:
+            if self.after is not None and doc_id <= self.after:
+                continue
+            if all(data.get(field) == value for field, value in self.filters):
+                matches.append(FakeSnapshot(FakeDocument(self.db, self.collection_name, doc_id), data))
+                if self.limit_count is not None and len(matches) >= self.limit_count:
+                    break
+        return iter(matches)
+
+    def get(self) -> List[FakeSnapshot]:
+        return list(self.stream())
+
+    def _copy(self, **changes) -> "FakeQuery":
+        fields = dict(filters=self.filters, limit_count=self.limit_count, after=self.after)
+        fields.update(changes)
+        return type(self)(self.db, self.collection_name, **fields)
+
+
+class FakeCollection(FakeQuery):
+    def document(self, doc_id: str) -> FakeDocument:
+        return FakeDocument(self.db, self.collection_name, doc_id)
+
+
+class FakeBatch:
+    """WriteBatch: queued writes applied in one round trip on commit()"""
+
+    def __init__(self, db: "FakeFirestore"):
+        self.db = db
+        self._writes = []
+
+    def set(self, reference: FakeDocument, doc: Dict[str, Any], merge: bool = False) -> None:
+        self._writes.append(lambda: reference._apply_set(doc, merge))
+
+    def delete(self, reference: FakeDocument) -> None:
+        self._writes.append(reference._apply_delete)
+
+    def commit(self) -> None:
+        if len(self._writes) > 500:
+            raise ValueError("Batches may contain at most 500 writes")
+        self.db._round_trip()
+        with self.db.lock:
+            for write in self._writes:
+                write()
+            self.db.commits += 1
+        self._writes = []
+
+    def __len__(self) -> int:
+        return len(self._writes)
+
+
+class FakeFirestore:
+    """
+    In-memory Firestore client.
+
+    Args:
+        latency: Seconds slept per simulated round trip (0 = none)
+    """
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.data: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.round_trips = 0
+        self.commits = 0
+        self.lock = threading.Lock()
+
+    def collection(self, name: str) -> FakeCollection:
+        return FakeCollection(self, name)
+
+    def batch(self) -> FakeBatch:
+        return FakeBatch(self)
+
+    def get_all(self, references: Iterable[FakeDocument]) -> List[FakeSnapshot]:
+        self._round_trip()
+        return [reference._snapshot() for reference in references]
+
+    def _round_trip(self) -> None:
+        with self.lock:
+            self.round_trips += 1
+        if self.latency:
+            time.sleep(self.latency)
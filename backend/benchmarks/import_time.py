@@ -0,0 +1,93 @@
+"""
+Cold-start import profile of main.py.
+
+Imports main in a fresh interpreter under `python -X importtime` (best of
+--runs), prints the slowest imports and fails when startup regresses:
+when a module that main must load lazily is imported at startup, or when
+the import takes longer than --budget-ms.
+
+Usage:
+    python benchmarks/import_time.py [--runs 5] [--budget-ms 1500] [--top 15]
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules main.py only loads on first use; importing any of them at startup
+# is a cold-start regression
+LAZY_MODULES = [
+    "openai",
+    "firebase_admin.firestore",
+    "google.cloud.firestore",
+    "grpc",
+    "numpy",
+    "asyncio",
+    "multiprocessing",
+    "firestore_writer",
+    "async_firestore_writer",
+    "puzzle_bank",
+    "generators.sudoku_generator",
+    "generators.zip_generator",
+    "validators.sudoku_validator",
+    "validators.zip_validator",
+]
+
+PROBE = "import sys; import main; print('\\n'.join(sys.modules))"
+
+
+def profile_import():
+    """
+    Import main once in a fresh interpreter.
+
+    Returns:
+        (cumulative_us per module, total_us of main, modules loaded)
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE],
+        cwd=BACKEND_DIR, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import main failed:\n{result.stderr}")
+
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        # "import time: <self us> | <cumulative us> | <indented module name>"
+        _, cumulative_us, name = line.split("|")
+        cumulative[name.strip()] = int(cumulative_us)
+    return cumulative, cumulative.get("main", 0), set(result.stdout.split())
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Profile the cold-start import of main.py')
+    parser.add_argument('--runs', type=int, default=5, help='Fresh interpreters to time (best is kept)')
+    parser.add_argument('--budget-ms', type=float, default=1500.0, help='Fail above this import time')
+    parser.add_argument('--top', type=int, default=15, help='Slowest imports to list')
+    args = parser.parse_args()
+
+    runs = [profile_import() for _ in range(args.runs)]
+    cumulative, total_us, modules = min(runs, key=lambda run: run[1])
+
+    print(f"\n⏱️  import main: {total_us / 1000:.1f} ms (best of {args.runs})\n")
+    for name, us in sorted(cumulative.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"   {us / 1000:8.1f} ms  {name}")
+
+    eager = [name for name in LAZY_MODULES if name in modules]
+    failed = False
+    if eager:
+        print(f"\n❌ Imported at startup, should load on first use: {', '.join(eager)}")
+        failed = True
+    if total_us / 1000 > args.budget_ms:
+        print(f"\n❌ Import took {total_us / 1000:.1f} ms, budget is {args.budget_ms:.0f} ms")
+        failed = True
+    if failed:
+        sys.exit(1)
+    print(f"\n✅ No eager heavy imports, within the {args.budget_ms:.0f} ms budget")
+
+
+if __name__ == "__main__":
+    main()
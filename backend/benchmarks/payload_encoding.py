@@ -0,0 +1,99 @@
+"""
+Payload encoding benchmark.
+
+Compares the legacy JSON payload (version 1) with the compact encoding
+(version 2) for every game type: payloadJson size and client-side parse
+time (json.loads alone, and json.loads followed by decoding back to the
+generator format).
+
+Usage:
+    python benchmarks/payload_encoding.py [--puzzles 50] [--repeat 200] [--seed 1]
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from generators import SudokuGenerator, ZipGenerator  # noqa: E402
+from payload_codec import (  # noqa: E402
+    COMPACT_PAYLOAD_VERSION,
+    LEGACY_PAYLOAD_VERSION,
+    decode_payload,
+    encode_payload,
+)
+
+GAME_TYPES = {
+    "MINI_SUDOKU_6X6": lambda: SudokuGenerator(),
+    "SUDOKU_9X9": lambda: SudokuGenerator(size=9, block_rows=3, block_cols=3),
+    "ZIP": lambda: ZipGenerator(),
+}
+
+
+def _sort_walls(payload):
+    """Walls come back in bitmask order, so compare them as sorted lists"""
+    if "walls" not in payload:
+        return payload
+    walls = sorted(payload["walls"], key=lambda wall: (wall["row"], wall["col"], wall["side"]))
+    return dict(payload, walls=walls)
+
+
+def _time_per_item(func, items, repeat: int) -> float:
+    """Mean microseconds per call of func over items"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for item in items:
+            func(item)
+    return 1e6 * (time.perf_counter() - start) / (repeat * len(items))
+
+
+def run_case(game_type: str, puzzles: int, repeat: int, seed: int):
+    """Return (legacy bytes, compact bytes, legacy parse us, compact parse us, compact decode us)"""
+    generator = GAME_TYPES[game_type]()
+    with contextlib.redirect_stdout(io.StringIO()):
+        rng = random.Random(seed)
+        payloads = [generator.generate_payload("2025-01-01", rng=rng) for _ in range(puzzles)]
+
+    legacy = [json.dumps(payload) for payload in payloads]
+    compact = [
+        json.dumps(encode_payload(payload, COMPACT_PAYLOAD_VERSION), separators=(",", ":"))
+        for payload in payloads
+    ]
+    for payload, data in zip(payloads, compact):
+        decoded = decode_payload(json.loads(data), COMPACT_PAYLOAD_VERSION)
+        assert _sort_walls(decoded) == _sort_walls(payload), "round trip failed"
+
+    legacy_bytes = sum(len(data) for data in legacy) / puzzles
+    compact_bytes = sum(len(data) for data in compact) / puzzles
+    legacy_parse = _time_per_item(lambda data: decode_payload(json.loads(data), LEGACY_PAYLOAD_VERSION), legacy, repeat)
+    compact_parse = _time_per_item(json.loads, compact, repeat)
+    compact_decode = _time_per_item(
+        lambda data: decode_payload(json.loads(data), COMPACT_PAYLOAD_VERSION), compact, repeat
+    )
+    return legacy_bytes, compact_bytes, legacy_parse, compact_parse, compact_decode
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Payload encoding benchmark")
+    parser.add_argument("--puzzles", type=int, default=50, help="Puzzles per game type")
+    parser.add_argument("--repeat", type=int, default=200, help="Parse repetitions per puzzle")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed")
+    args = parser.parse_args()
+
+    print(f"{'game type':<18}{'v1 bytes':>10}{'v2 bytes':>10}{'ratio':>8}"
+          f"{'v1 parse us':>13}{'v2 parse us':>13}{'v2 decode us':>14}")
+    for game_type in GAME_TYPES:
+        legacy_bytes, compact_bytes, legacy_parse, compact_parse, compact_decode = run_case(
+            game_type, args.puzzles, args.repeat, args.seed
+        )
+        print(f"{game_type:<18}{legacy_bytes:>10.0f}{compact_bytes:>10.0f}{compact_bytes / legacy_bytes:>8.2f}"
+              f"{legacy_parse:>13.1f}{compact_parse:>13.1f}{compact_decode:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Sudoku size-scaling benchmark.
+
+Generates puzzles at several board sizes with both solver backends and
+reports per-puzzle latency and solver nodes. Used to pick DLX_MIN_SIZE.
+
+Usage:
+    python benchmarks/sudoku_size_scaling.py [--puzzles 20] [--seed 1]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from generators import SudokuGenerator  # noqa: E402
+from generators.dlx_solver import DancingLinksSolver  # noqa: E402
+from generators.clue_remover import ClueRemover  # noqa: E402
+from generators.sudoku_solver import SudokuSolver, DLX_MIN_SIZE  # noqa: E402
+
+BOARD_SHAPES = [
+    (6, 2, 3),
+    (8, 2, 4),
+    (9, 3, 3),
+    (12, 3, 4),
+]
+
+BACKENDS = {
+    "bitmask": SudokuSolver,
+    "dlx": DancingLinksSolver,
+}
+
+
+def run_case(size: int, block_rows: int, block_cols: int, backend: str, puzzles: int, seed: int):
+    """Generate puzzles with one backend and return (timings, nodes)"""
+    generator = SudokuGenerator(size=size, block_rows=block_rows, block_cols=block_cols)
+    generator.solver = BACKENDS[backend](size, block_rows, block_cols)
+    generator.remover = ClueRemover(generator.solver)
+    generator.rng = random.Random(seed)
+
+    timings = []
+    nodes = []
+    for _ in range(puzzles):
+        start = time.perf_counter()
+        generator.generate_payload("2025-01-01")
+        timings.append(time.perf_counter() - start)
+        nodes.append(generator.last_solver_nodes)
+    return timings, nodes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sudoku size-scaling benchmark")
+    parser.add_argument("--puzzles", type=int, default=20, help="Puzzles per size and backend")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed")
+    args = parser.parse_args()
+
+    print(f"DLX_MIN_SIZE = {DLX_MIN_SIZE}\n")
+    print(f"{'board':<10}{'backend':<10}{'mean ms':>10}{'max ms':>10}{'nodes':>10}")
+    for size, block_rows, block_cols in BOARD_SHAPES:
+        for backend in BACKENDS:
+            timings, nodes = run_case(size, block_rows, block_cols, backend, args.puzzles, args.seed)
+            mean_ms = 1000 * sum(timings) / len(timings)
+            max_ms = 1000 * max(timings)
+            mean_nodes = sum(nodes) / len(nodes)
+            print(f"{f'{size}x{size}':<10}{backend:<10}{mean_ms:>10.1f}{max_ms:>10.1f}{mean_nodes:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,354 @@
+"""
+Benchmark suite for the generators, validators and the request path.
+
+Cases (fixed seeds, so every run measures the same puzzles):
+    sudoku_generate/<game type>/<difficulty>  SudokuGenerator.generate_payload
+    zip_generate/<difficulty>                 ZipGenerator.generate_payload, with the
+                                              share of puzzles that fell back to the snake path
+    zip_generate_size/<n>x<n>                 ZipGenerator.generate_payload on bigger grids,
+                                              cycling through the difficulties, with the
+                                              share of puzzles that missed their band
+    sudoku_validate/<game type>               SudokuValidator.validate_payload
+    zip_validate                              ZipValidator.validate_payload
+    request/<game type>                       main._generate_and_store_puzzle against an
+                                              in-memory Firestore fake (fake_firestore.py)
+
+Each run of a case starts with untimed warm-up calls (caches, lazily built
+generators, the first Firestore fake). Each case runs --repeat times
+(default 5) and reports the median of the runs' p50/p95/p99 latency and
+throughput, plus the spread of p50 and p95 across the runs ((max - min) /
+median). --save-baseline writes the results to benchmarks/baseline.json;
+other runs compare against it and exit with status 1 when a case's p50 or
+p95 is slower than its tolerance and more than --min-delta-ms (default
+0.05 ms) slower. The tolerance is --threshold (default 25%), or
+--noise-factor (default 2) times the larger of the case's spread here and
+in the baseline if that is more: the work per case is fixed by the seeds,
+so the spread is timing noise (ZIP cases often vary by 30% between runs). A baseline saved with another
+--seed, --quick or --latency-ms is not compared (exit status 2). Baselines
+are machine-specific: save one on the machine you compare on.
+
+Usage:
+    python benchmarks/suite.py [--quick] [--only zip] [--repeat 3] [--save-baseline] [--threshold 0.25]
+        [--min-delta-ms 0.05] [--noise-factor 2]
+"""
+import argparse
+import contextlib
+import io
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+from datetime import date, datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from generators import SudokuGenerator, ZipGenerator  # noqa: E402
+from validators import SudokuValidator, ZipValidator  # noqa: E402
+
+from fake_firestore import FakeFirestore  # noqa: E402
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+DIFFICULTIES = ["medium", "hard", "expert"]
+
+SUDOKU_GAMES = {
+    "MINI_SUDOKU_6X6": (dict(), dict(size=6, block_rows=2, block_cols=3)),
+    "SUDOKU_9X9": (dict(size=9, block_rows=3, block_cols=3), dict(size=9, block_rows=3, block_cols=3)),
+}
+
+# Iterations per case (--quick divides them by 5)
+ITERATIONS = {
+    "sudoku_generate": 50,
+    "zip_generate": 30,
+    "zip_generate_size": 6,
+    "validate": 2000,
+    "request": 20,
+}
+
+# Bigger ZIP grids timed end to end (6x6 is zip_generate)
+ZIP_SIZES = [7, 8, 10]
+
+# Untimed calls at the start of every run
+WARMUP_ITERATIONS = 3
+
+# Run settings that change what a case measures: a baseline saved with
+# different values is not compared
+COMPARABLE_META = ("seed", "quick", "latencyMs")
+
+
+def percentile(sorted_values, p):
+    """Nearest-rank percentile of an ascending list"""
+    return sorted_values[max(0, math.ceil(p / 100 * len(sorted_values)) - 1)]
+
+
+def summarize(latencies, **extra):
+    """Latency percentiles (ms) and throughput of one case"""
+    ordered = sorted(latencies)
+    total = sum(latencies)
+    summary = {
+        "n": len(latencies),
+        "p50Ms": round(percentile(ordered, 50) * 1000, 4),
+        "p95Ms": round(percentile(ordered, 95) * 1000, 4),
+        "p99Ms": round(percentile(ordered, 99) * 1000, 4),
+        "meanMs": round(total / len(latencies) * 1000, 4),
+        "opsPerSecond": round(len(latencies) / total, 1) if total else None,
+    }
+    summary.update(extra)
+    return summary
+
+
+def timed(call, count, warmup=WARMUP_ITERATIONS):
+    """Latencies of count calls of call(i), after warmup untimed calls of
+    call(-warmup)..call(-1), with generator output silenced"""
+    latencies = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for i in range(-warmup, 0):
+            call(i)
+        for i in range(count):
+            start = time.perf_counter()
+            call(i)
+            latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def bench_sudoku_generate(iterations, seed):
+    for game_type, (generator_args, _) in SUDOKU_GAMES.items():
+        generator = SudokuGenerator(**generator_args)
+        for difficulty in DIFFICULTIES:
+            def run(generator=generator, difficulty=difficulty):
+                return summarize(timed(
+                    lambda i: generator.generate_payload("2025-01-01", difficulty=difficulty, rng=random.Random(seed + i)),
+                    iterations,
+                ))
+            yield f"sudoku_generate/{game_type}/{difficulty}", run
+
+
+def bench_zip_generate(iterations, seed):
+    generator = ZipGenerator()
+    for difficulty in DIFFICULTIES:
+        def run(difficulty=difficulty):
+            fallbacks = 0
+
+            def generate(i):
+                nonlocal fallbacks
+                generator.generate_payload("2025-01-01", difficulty=difficulty, rng=random.Random(seed + i))
+                if i >= 0:
+                    fallbacks += generator.last_path_sources["hamiltonianFallbacks"]
+
+            latencies = timed(generate, iterations)
+            return summarize(latencies, snakeFallbackRate=round(fallbacks / iterations, 4))
+        yield f"zip_generate/{difficulty}", run
+
+
+def bench_zip_generate_size(iterations, seed):
+    for size in ZIP_SIZES:
+        generator = ZipGenerator(rows=size)
+
+        def run(generator=generator):
+            misses = 0
+
+            def generate(i):
+                nonlocal misses
+                difficulty = DIFFICULTIES[i % len(DIFFICULTIES)]
+                generator.generate_payload("2025-01-01", difficulty=difficulty, rng=random.Random(seed + i))
+                if i >= 0 and generator.last_missed_difficulty is not None:
+                    misses += 1
+
+            # A single warm-up call: these take seconds, and nothing is left to warm after one
+            latencies = timed(generate, iterations, warmup=1)
+            return summarize(latencies, bandMissRate=round(misses / iterations, 4))
+        yield f"zip_generate_size/{size}x{size}", run
+
+
+def bench_validate(iterations, seed):
+    cases = [
+        (f"sudoku_validate/{game_type}", lambda args=generator_args: SudokuGenerator(**args),
+         lambda args=validator_args: SudokuValidator(**args))
+        for game_type, (generator_args, validator_args) in SUDOKU_GAMES.items()
+    ]
+    cases.append(("zip_validate", ZipGenerator, ZipValidator))
+
+    for name, make_generator, make_validator in cases:
+        def run(make_generator=make_generator, make_validator=make_validator):
+            rng = random.Random(seed)
+            generator, validator = make_generator(), make_validator()
+            with contextlib.redirect_stdout(io.StringIO()):
+                payloads = [
+                    generator.generate_payload("2025-01-01", rng=random.Random(rng.getrandbits(64)))
+                    for _ in range(10)
+                ]
+            return summarize(timed(lambda i: validator.validate_payload(payloads[i % len(payloads)]), iterations))
+        yield name, run
+
+
+def bench_request(iterations, seed, latency):
+    """Full single-puzzle request path, one new date per iteration"""
+    try:
+        import main
+    except ImportError as e:
+        print(f"⚠️  Skipping request cases, main.py cannot be imported: {e}")
+        return
+
+    main.PUZZLE_SEED_SALT = f"benchmark-{seed}"
+    main.PUZZLE_INDEX_PATH = None
+    main.PUZZLE_BANK_PATH = None
+    main.PARALLEL_CANDIDATES = 0
+    start_date = date(2025, 1, 1)
+
+    for game_type in main.GENERATORS:
+        def run(game_type=game_type):
+            db = FakeFirestore(latency=latency)
+            main._db = db
+            latencies = []
+            # Warm-up request the day before start_date: builds the generator
+            # and validator, and leaves a puzzle for the first timed request to delete
+            for i in range(-1, iterations):
+                # Each request deletes the previous day's puzzle and its results
+                previous = f"{game_type}_{start_date + timedelta(days=i - 1)}"
+                for user in range(20):
+                    db.data.setdefault("results", {})[f"{previous}_user{user}"] = {"puzzleId": previous}
+                date_str = (start_date + timedelta(days=i)).isoformat()
+                round_trips = db.round_trips
+                request_latencies = timed(lambda _: main._generate_and_store_puzzle(game_type, date_str), 1, warmup=0)
+                if i >= 0:
+                    latencies.extend(request_latencies)
+            # Round trips of one steady-state request
+            return summarize(latencies, firestoreRoundTrips=db.round_trips - round_trips)
+        yield f"request/{game_type}", run
+
+
+def median_summary(runs):
+    """Summary of repeated runs of a case: the median of each latency and
+    throughput figure and the relative spread of p50 and p95, other fields
+    from the run with the median p50"""
+    summary = dict(sorted(runs, key=lambda r: r["p50Ms"])[len(runs) // 2])
+    for key in ("p50Ms", "p95Ms", "p99Ms", "meanMs", "opsPerSecond"):
+        values = [run[key] for run in runs if run[key] is not None]
+        summary[key] = round(statistics.median(values), 4) if values else None
+    summary["spread"] = {
+        key: round((max(run[key] for run in runs) - min(run[key] for run in runs)) / summary[key], 4)
+        if summary[key] else 0.0
+        for key in ("p50Ms", "p95Ms")
+    }
+    return summary
+
+
+def meta_mismatches(meta, baseline_meta):
+    """Run settings that differ from the baseline's, as (key, current, baseline)"""
+    # Baselines from before latencyMs was recorded ran without simulated latency
+    baseline_meta = {"latencyMs": 0.0, **baseline_meta}
+    return [
+        (key, meta[key], baseline_meta.get(key))
+        for key in meta
+        if key != "created" and meta[key] != baseline_meta.get(key)
+    ]
+
+
+def tolerance(current, base, key, threshold, noise_factor):
+    """Allowed slowdown of one figure: threshold, or noise_factor times the
+    larger of its spread in this run and in the baseline"""
+    noise = max(current.get("spread", {}).get(key, 0.0), base.get("spread", {}).get(key, 0.0))
+    return max(threshold, noise_factor * noise)
+
+
+def compare(results, baseline, threshold, min_delta_ms, noise_factor):
+    """Cases whose p50 or p95 exceed the baseline by more than their tolerance and min_delta_ms"""
+    regressions = []
+    for name, current in results.items():
+        base = baseline.get("cases", {}).get(name)
+        if base is None:
+            continue
+        for key in ("p50Ms", "p95Ms"):
+            allowed = tolerance(current, base, key, threshold, noise_factor)
+            if base[key] and current[key] > base[key] * (1 + allowed) and current[key] - base[key] > min_delta_ms:
+                regressions.append(f"{name} {key}: {current[key]:.3f} ms vs baseline {base[key]:.3f} ms "
+                                   f"(+{(current[key] / base[key] - 1) * 100:.0f}%, "
+                                   f"tolerance {allowed:.0%})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='BrainBurst backend benchmark suite')
+    parser.add_argument('--quick', action='store_true', help='Fifth of the iterations')
+    parser.add_argument('--only', help='Run only cases whose name contains this')
+    parser.add_argument('--seed', type=int, default=1, help='Random seed')
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per case (the median is reported)')
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='Simulated Firestore round trip')
+    parser.add_argument('--baseline', default=BASELINE_PATH, help='Baseline JSON file')
+    parser.add_argument('--save-baseline', action='store_true', help='Write the results as the new baseline')
+    parser.add_argument('--threshold', type=float, default=0.25, help='Allowed slowdown before flagging')
+    parser.add_argument('--min-delta-ms', type=float, default=0.05, help='Smallest slowdown (ms) ever flagged')
+    parser.add_argument('--noise-factor', type=float, default=2.0,
+                        help='Tolerance in multiples of a case\'s spread across runs, when above --threshold')
+    args = parser.parse_args()
+    meta = {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "seed": args.seed,
+        "quick": args.quick,
+        "repeat": args.repeat,
+        "latencyMs": args.latency_ms,
+    }
+
+    scale = 5 if args.quick else 1
+    n = {key: max(1, count // scale) for key, count in ITERATIONS.items()}
+    suites = [
+        bench_sudoku_generate(n["sudoku_generate"], args.seed),
+        bench_zip_generate(n["zip_generate"], args.seed),
+        bench_zip_generate_size(n["zip_generate_size"], args.seed),
+        bench_validate(n["validate"], args.seed),
+        bench_request(n["request"], args.seed, args.latency_ms / 1000),
+    ]
+
+    print(f"\n⏱️  BrainBurst benchmark suite (seed {args.seed})\n")
+    print(f"   {'case':<42} {'n':>5} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'ops/s':>9} {'spread':>7}")
+    results = {}
+    for suite in suites:
+        for name, run in suite:
+            if args.only and args.only not in name:
+                continue
+            summary = results[name] = median_summary([run() for _ in range(args.repeat)])
+            extra = {
+                k: v for k, v in summary.items()
+                if k not in ("n", "p50Ms", "p95Ms", "p99Ms", "meanMs", "opsPerSecond", "spread")
+            }
+            print(f"   {name:<42} {summary['n']:>5} {summary['p50Ms']:>9.3f} {summary['p95Ms']:>9.3f} "
+                  f"{summary['p99Ms']:>9.3f} {summary['opsPerSecond']:>9.1f} {summary['spread']['p50Ms']:>7.0%}"
+                  + (f"  {extra}" if extra else ""))
+
+    if args.save_baseline:
+        baseline = {"meta": meta, "cases": results}
+        with open(args.baseline, "w") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"\n💾 Baseline written to {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f"\nℹ️  No baseline at {args.baseline}, run with --save-baseline to create one")
+        return
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    mismatches = meta_mismatches(meta, baseline.get("meta", {}))
+    for key, current, saved in mismatches:
+        print(f"{'❌' if key in COMPARABLE_META else '⚠️ '} {key} is {current}, the baseline's is {saved}")
+    if any(key in COMPARABLE_META for key, _, _ in mismatches):
+        print("\n❌ Not comparing: rerun with the baseline's settings or save a new baseline")
+        sys.exit(2)
+    regressions = compare(results, baseline, args.threshold, args.min_delta_ms, args.noise_factor)
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s) beyond their tolerance and {args.min_delta_ms} ms:")
+        for regression in regressions:
+            print(f"   {regression}")
+        sys.exit(1)
+    print(f"\n✅ No regressions beyond the tolerances (at least {args.threshold:.0%}) of the baseline")
+
+
+if __name__ == "__main__":
+    main()
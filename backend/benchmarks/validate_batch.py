@@ -0,0 +1,89 @@
+"""
+Batch validation benchmark.
+
+Builds N 6×6 boards from the solution grid catalog (a share of them
+deliberately corrupted), validates them with SudokuValidator.validate_batch
+and with the per-board structural checks of validate_payload, checks that
+both agree and reports boards per second.
+
+Usage:
+    python benchmarks/validate_batch.py [--boards 200000] [--seed 1]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from generators import SolutionGridSampler  # noqa: E402
+from validators import BATCH_ERROR_MESSAGES, BATCH_VALID, SudokuValidator  # noqa: E402
+
+
+def make_boards(count: int, seed: int):
+    """Return (initial, solution) arrays of shape [count, 6, 6], about 10% of them broken"""
+    rng = random.Random(seed)
+    sampler = SolutionGridSampler()
+    solution = np.array([sampler.sample(rng) for _ in range(count)], dtype=np.int8)
+
+    np_rng = np.random.default_rng(seed)
+    keep = np_rng.random(solution.shape) < 0.5
+    initial = np.where(keep, solution, 0).astype(np.int8)
+
+    # Break some boards: swap two solution cells, or change a given
+    broken = np_rng.choice(count, count // 10, replace=False)
+    for i in broken[::2]:
+        solution[i, 0, 0], solution[i, 0, 1] = solution[i, 1, 0], solution[i, 0, 0]
+    for i in broken[1::2]:
+        r, c = np.argwhere(initial[i])[0]
+        initial[i, r, c] = initial[i, r, c] % 6 + 1
+    return initial, solution
+
+
+def validate_loop(validator: SudokuValidator, initial, solution):
+    """Per-board checks of validate_payload, without the uniqueness check"""
+    codes = []
+    for init, sol in zip(initial.tolist(), solution.tolist()):
+        valid, _ = validator._validate_complete_sudoku(sol)
+        if not valid:
+            codes.append(False)
+            continue
+        givens = sum(1 for row in init for cell in row if cell != 0)
+        codes.append(
+            validator._validate_initial_matches_solution(init, sol)
+            and 12 <= givens <= 28
+        )
+    return codes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch validation benchmark")
+    parser.add_argument("--boards", type=int, default=200000, help="Boards to validate")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed")
+    args = parser.parse_args()
+
+    initial, solution = make_boards(args.boards, args.seed)
+    validator = SudokuValidator()
+
+    start = time.perf_counter()
+    codes = validator.validate_batch(initial, solution)
+    batch_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    loop_valid = validate_loop(validator, initial, solution)
+    loop_time = time.perf_counter() - start
+
+    assert (codes == BATCH_VALID).tolist() == loop_valid, "batch and per-board results differ"
+
+    print(f"{args.boards} boards")
+    for code, message in BATCH_ERROR_MESSAGES.items():
+        print(f"   {int((codes == code).sum()):>8}  {message}")
+    print(f"validate_batch : {batch_time:8.3f}s  {args.boards / batch_time:12.0f} boards/s")
+    print(f"per-board loop : {loop_time:8.3f}s  {args.boards / loop_time:12.0f} boards/s")
+
+
+if __name__ == "__main__":
+    main()
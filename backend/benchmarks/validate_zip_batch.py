@@ -0,0 +1,123 @@
+"""
+ZIP validation benchmark.
+
+Draws N random 6×6 puzzles from the backbite path sampler (dots on the
+path, walls on edges the path never uses), corrupts a share of them and
+validates them with ZipValidator.validate_batch and with validate_payload,
+checks that both agree and reports puzzles per second (best of three
+runs for the batch).
+
+Usage:
+    python benchmarks/validate_zip_batch.py [--puzzles 100000] [--seed 1]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from generators.backbite import BackbitePathSampler  # noqa: E402
+from generators.puzzle_encoding import mask_to_walls, wall_edge_count  # noqa: E402
+from validators import ZIP_BATCH_ERROR_MESSAGES, ZIP_BATCH_VALID, ZipValidator  # noqa: E402
+
+SIZE = 6
+MAX_DOTS = 16
+
+
+def path_edges(path):
+    """Wall-mask bits of the edges a path uses"""
+    right_edges = SIZE * (SIZE - 1)
+    bits = set()
+    for a, b in zip(path, path[1:]):
+        low = min(a, b)
+        if abs(a - b) == 1:
+            bits.add(low // SIZE * (SIZE - 1) + low % SIZE)
+        else:
+            bits.add(right_edges + low)
+    return bits
+
+
+def make_puzzles(count: int, seed: int):
+    """Return (paths, dots, walls) arrays, about 10% of the puzzles broken"""
+    rng = random.Random(seed)
+    sampler = BackbitePathSampler(SIZE, SIZE, moves_per_cell=5)
+    edges = wall_edge_count(SIZE, SIZE)
+
+    paths = np.empty((count, SIZE * SIZE), dtype=np.int16)
+    dots = np.full((count, MAX_DOTS), -1, dtype=np.int16)
+    walls = np.zeros((count, edges), dtype=bool)
+    for i in range(count):
+        path = sampler.sample(rng)
+        steps = sorted(rng.sample(range(1, len(path) - 1), rng.randint(2, MAX_DOTS - 2)))
+        dot_cells = [path[0]] + [path[s] for s in steps] + [path[-1]]
+        paths[i] = path
+        dots[i, :len(dot_cells)] = dot_cells
+        free = sorted(set(range(edges)) - path_edges(path))
+        walls[i, rng.sample(free, rng.randint(0, 8))] = True
+
+    # Break some puzzles: swap two path cells, swap two dots, or wall a used edge
+    broken = rng.sample(range(count), count // 10)
+    for n, i in enumerate(broken):
+        if n % 3 == 0:
+            j, k = rng.sample(range(SIZE * SIZE), 2)
+            paths[i, j], paths[i, k] = paths[i, k], paths[i, j]
+        elif n % 3 == 1:
+            dots[i, 1], dots[i, 2] = dots[i, 2], dots[i, 1]
+        else:
+            walls[i, rng.choice(sorted(path_edges(paths[i].tolist())))] = True
+    return paths, dots, walls
+
+
+def to_payload(path, dot_cells, wall_row):
+    """Generator-format payload for one puzzle of the arrays"""
+    mask = sum(1 << int(bit) for bit in np.flatnonzero(wall_row))
+    payload = {
+        "size": SIZE,
+        "dots": [
+            {"row": int(cell) // SIZE, "col": int(cell) % SIZE, "index": i + 1}
+            for i, cell in enumerate(dot_cells) if cell >= 0
+        ],
+        "solution": [{"row": int(cell) // SIZE, "col": int(cell) % SIZE} for cell in path],
+    }
+    if mask:
+        payload["walls"] = mask_to_walls(mask, SIZE, SIZE)
+    return payload
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ZIP validation benchmark")
+    parser.add_argument("--puzzles", type=int, default=100000, help="Puzzles to validate")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed")
+    args = parser.parse_args()
+
+    paths, dots, walls = make_puzzles(args.puzzles, args.seed)
+    payloads = [to_payload(p, d, w) for p, d, w in zip(paths, dots, walls)]
+    validator = ZipValidator(SIZE)
+
+    # Best of three: the first run also pays for faulting in fresh array memory
+    batch_time = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        codes = validator.validate_batch(paths, dots, walls)
+        batch_time = min(batch_time, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    loop_valid = [validator.validate_payload(payload)[0] for payload in payloads]
+    loop_time = time.perf_counter() - start
+
+    assert (codes == ZIP_BATCH_VALID).tolist() == loop_valid, "batch and per-payload results differ"
+
+    print(f"{args.puzzles} puzzles")
+    for code, message in ZIP_BATCH_ERROR_MESSAGES.items():
+        print(f"   {int((codes == code).sum()):>8}  {message}")
+    print(f"validate_batch   : {batch_time:8.3f}s  {args.puzzles / batch_time:12.0f} puzzles/s")
+    print(f"validate_payload : {loop_time:8.3f}s  {args.puzzles / loop_time:12.0f} puzzles/s"
+          f"  ({loop_time / args.puzzles * 1e6:.1f} µs each)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Backbite path sampler mixing and throughput benchmark.
+
+For each grid size, runs chains from a fixed snake path and tracks two
+statistics against their long-run values:
+    snake edges : share of path edges still shared with the start path
+    turns       : share of interior path cells where the path turns
+A chain has mixed once both are within tolerance of the long-run value.
+Also reports backbite moves per second and paths per second at the
+sampler's default moves_per_cell.
+
+Usage:
+    python benchmarks/zip_backbite_mixing.py [--chains 200] [--seed 1]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from generators.backbite import BackbitePathSampler  # noqa: E402
+
+GRID_SHAPES = [(6, 6), (7, 7), (8, 8), (10, 10), (12, 12), (6, 10)]
+CHECKPOINTS = [1, 2, 5, 10, 20, 40]  # Moves per cell
+EQUILIBRIUM_MOVES_PER_CELL = 200
+TOLERANCE = 0.02
+
+
+def _edges(path):
+    return {frozenset(pair) for pair in zip(path, path[1:])}
+
+
+def _turn_share(path, cols):
+    turns = sum(
+        1 for a, b, c in zip(path, path[1:], path[2:])
+        if (b - a) != (c - b)
+    )
+    return turns / (len(path) - 2)
+
+
+def run_mixing(rows: int, cols: int, chains: int, seed: int):
+    """Return {moves_per_cell: (snake edge share, turn share)} and the long-run values"""
+    sampler = BackbitePathSampler(rows, cols)
+    rng = random.Random(seed)
+    start = [r * cols + (c if r % 2 == 0 else cols - 1 - c) for r in range(rows) for c in range(cols)]
+    start_edges = _edges(start)
+
+    totals = {m: [0.0, 0.0] for m in CHECKPOINTS + [EQUILIBRIUM_MOVES_PER_CELL]}
+    for _ in range(chains):
+        path = list(start)
+        done = 0
+        for checkpoint in sorted(totals):
+            sampler.walk(path, rng, (checkpoint - done) * sampler.cells)
+            done = checkpoint
+            totals[checkpoint][0] += len(_edges(path) & start_edges) / (sampler.cells - 1)
+            totals[checkpoint][1] += _turn_share(path, cols)
+
+    means = {m: (edges / chains, turns / chains) for m, (edges, turns) in totals.items()}
+    return means, means.pop(EQUILIBRIUM_MOVES_PER_CELL)
+
+
+def run_throughput(rows: int, cols: int, samples: int, seed: int):
+    """Return (moves per second, paths per second) at the default moves_per_cell"""
+    sampler = BackbitePathSampler(rows, cols)
+    rng = random.Random(seed)
+    start = time.perf_counter()
+    for _ in range(samples):
+        sampler.sample(rng)
+    elapsed = time.perf_counter() - start
+    return samples * sampler.moves_per_cell * sampler.cells / elapsed, samples / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backbite mixing and throughput benchmark")
+    parser.add_argument("--chains", type=int, default=200, help="Chains per grid size")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed")
+    args = parser.parse_args()
+
+    default_moves = BackbitePathSampler(2, 2).moves_per_cell
+    print(f"Default moves_per_cell = {default_moves}\n")
+    header = "".join(f"{f'{m}/cell':>14}" for m in CHECKPOINTS)
+    print(f"{'grid':<8}{'statistic':<12}{header}{'long run':>10}{'mixed at':>10}")
+    for rows, cols in GRID_SHAPES:
+        means, equilibrium = run_mixing(rows, cols, args.chains, args.seed)
+        mixed = next(
+            (m for m in CHECKPOINTS if all(abs(means[m][i] - equilibrium[i]) <= TOLERANCE for i in (0, 1))),
+            None
+        )
+        for i, name in enumerate(("snake edges", "turns")):
+            values = "".join(f"{means[m][i]:>14.3f}" for m in CHECKPOINTS)
+            mixed_label = f"{mixed}/cell" if mixed else "-"
+            print(f"{f'{rows}x{cols}' if i == 0 else '':<8}{name:<12}{values}{equilibrium[i]:>10.3f}"
+                  f"{mixed_label if i == 0 else '':>10}")
+
+    print(f"\n{'grid':<8}{'moves/s':>12}{'paths/s':>10}")
+    for rows, cols in GRID_SHAPES:
+        moves_per_second, paths_per_second = run_throughput(rows, cols, 100, args.seed)
+        print(f"{f'{rows}x{cols}':<8}{moves_per_second:>12.0f}{paths_per_second:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+ZIP Hamiltonian path search benchmark.
+
+Runs ZipGenerator's path generation on fixed seeds (the precomputed path
+library on 6x6) and reports the time per path and how often it falls back
+to the snake pattern. Also times the bare search on 6x6 and larger grids.
+
+Usage:
+    python benchmarks/zip_path_search.py [--paths 2000] [--seed 1]
+"""
+import argparse
+import contextlib
+import io
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from generators import ZipGenerator  # noqa: E402
+from generators.hamiltonian import HamiltonianPathSearch  # noqa: E402
+
+GRID_SHAPES = [(6, 6), (7, 7), (8, 8), (6, 9)]
+
+
+def _percentile(values, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def run_generator(paths: int, seed: int):
+    """Return (timings, fallbacks) for ZipGenerator path generation"""
+    generator = ZipGenerator()
+    generator.rng = random.Random(seed)
+    timings = []
+    fallbacks = 0
+    for _ in range(paths):
+        log = io.StringIO()
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(log):
+            generator._generate_valid_zip_puzzle(8)
+        timings.append(time.perf_counter() - start)
+        fallbacks += "fallback" in log.getvalue()
+    return timings, fallbacks
+
+
+def run_search(rows: int, cols: int, paths: int, seed: int):
+    """Return (timings, nodes, failures) for the bare search from random valid starts"""
+    search = HamiltonianPathSearch(rows, cols)
+    rng = random.Random(seed)
+    starts = [cell for cell in range(search.cells) if search.can_start(cell)]
+    timings, nodes, failures = [], [], 0
+    for _ in range(paths):
+        start = time.perf_counter()
+        path = search.find_path(rng.choice(starts), rng, deadline=start + 3.0)
+        timings.append(time.perf_counter() - start)
+        nodes.append(search.nodes)
+        failures += path is None
+    return timings, nodes, failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ZIP path search benchmark")
+    parser.add_argument("--paths", type=int, default=2000, help="Paths per case")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed")
+    args = parser.parse_args()
+
+    timings, fallbacks = run_generator(args.paths, args.seed)
+    print(f"ZipGenerator 6x6 (path library): p50 {1000 * _percentile(timings, 0.5):.2f} ms, "
+          f"p99 {1000 * _percentile(timings, 0.99):.2f} ms, max {1000 * max(timings):.2f} ms, "
+          f"snake fallbacks {fallbacks}/{args.paths}\n")
+
+    print(f"{'grid':<8}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}{'max nodes':>11}{'failed':>8}")
+    for rows, cols in GRID_SHAPES:
+        timings, nodes, failures = run_search(rows, cols, args.paths, args.seed)
+        print(f"{f'{rows}x{cols}':<8}{1000 * _percentile(timings, 0.5):>10.2f}"
+              f"{1000 * _percentile(timings, 0.99):>10.2f}{1000 * max(timings):>10.2f}"
+              f"{max(nodes):>11}{failures:>8}")
+
+
+if __name__ == "__main__":
+    main()
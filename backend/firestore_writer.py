@@ -1,21 +1,76 @@
 """Firestore writer for puzzle storage"""
 import json
-from typing import Dict, Any
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Set, Tuple
 from firebase_admin import firestore
 from datetime import datetime
 
+from instrumentation import metrics
+from payload_codec import LEGACY_PAYLOAD_VERSION, encode_payload
 
-class FirestoreWriter:
-    """Writes puzzles to Firestore"""
+# Firestore allows at most 500 writes per batch commit
+BATCH_WRITE_LIMIT = 500
+
+# Cascading deletes read document keys in pages of one batch commit each,
+# and keep this many commits in flight while the next page is read
+DELETE_PAGE_SIZE = BATCH_WRITE_LIMIT
+MAX_CONCURRENT_DELETE_COMMITS = 16
+
+
+class PuzzleDocuments:
+    """Puzzle document building shared by FirestoreWriter and AsyncFirestoreWriter (no Firestore calls)"""
     
-    def __init__(self, db):
+    def __init__(self, db, payload_versions: Optional[Dict[str, int]] = None):
         """
         Initialize writer with Firestore database instance.
         
         Args:
-            db: firebase_admin.firestore.client() instance
+            db: firebase_admin.firestore.client() instance, or the
+                firestore_async client for AsyncFirestoreWriter
+            payload_versions: Payload encoding per game type (see payload_codec),
+                game types not listed use the legacy JSON payload
         """
         self.db = db
+        self.payload_versions = payload_versions or {}
+        self.last_delete: Dict[str, Any] = {}  # Counts and time of the last cascading delete
+    
+    def _puzzle_doc(self, game_type: str, date_str: str, payload: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+        """Document ID and fields of a puzzle document"""
+        puzzle_id = f"{game_type}_{date_str}"
+        payload_version = self.payload_version(game_type)
+        
+        # Serialize payload to JSON string (same as AdminPuzzleUploader)
+        if payload_version == LEGACY_PAYLOAD_VERSION:
+            payload_json = json.dumps(payload)
+        else:
+            payload_json = json.dumps(encode_payload(payload, payload_version), separators=(",", ":"))
+        
+        return puzzle_id, {
+            "puzzleId": puzzle_id,  # Include puzzleId field
+            "gameType": game_type,
+            "date": date_str,
+            "payloadJson": payload_json,  # Store as JSON string
+            "payloadVersion": payload_version,
+            "createdAt": firestore.SERVER_TIMESTAMP,
+            "generatedBy": "deterministic-algorithm"
+        }
+    
+    def payload_version(self, game_type: str) -> int:
+        """Payload encoding version used when writing puzzles of this game type"""
+        return self.payload_versions.get(game_type, LEGACY_PAYLOAD_VERSION)
+    
+    @staticmethod
+    def _is_old(puzzle_id: str, keep_puzzle_id: str, before: Optional[str]) -> bool:
+        """Whether a cleanup deletes the puzzle: not the kept one, and dated before `before` if given"""
+        if puzzle_id == keep_puzzle_id:
+            return False
+        # Puzzle IDs end with the date, so keys-only pages are enough
+        return before is None or puzzle_id.rsplit("_", 1)[-1] < before
+
+
+class FirestoreWriter(PuzzleDocuments):
+    """Writes puzzles to Firestore"""
     
     def write_puzzle(
         self, 
@@ -34,19 +89,7 @@ class FirestoreWriter:
         Returns:
             puzzle_id: The document ID that was created
         """
-        puzzle_id = f"{game_type}_{date_str}"
-        
-        # Serialize payload to JSON string (same as AdminPuzzleUploader)
-        payload_json = json.dumps(payload)
-        
-        puzzle_doc = {
-            "puzzleId": puzzle_id,  # Include puzzleId field
-            "gameType": game_type,
-            "date": date_str,
-            "payloadJson": payload_json,  # Store as JSON string
-            "createdAt": firestore.SERVER_TIMESTAMP,
-            "generatedBy": "deterministic-algorithm"
-        }
+        puzzle_id, puzzle_doc = self._puzzle_doc(game_type, date_str, payload)
         
         # Write to Firestore
         doc_ref = self.db.collection("puzzles").document(puzzle_id)
@@ -55,70 +98,175 @@ class FirestoreWriter:
         print(f"✅ Puzzle written to Firestore: {puzzle_id}")
         return puzzle_id
     
+    def write_puzzles(
+        self,
+        puzzles: List[Tuple[str, str, Dict[str, Any]]],
+        puzzle_hashes: Optional[Dict[str, List[int]]] = None
+    ) -> List[str]:
+        """
+        Write many puzzles with batched commits (BATCH_WRITE_LIMIT writes each).
+        
+        Args:
+            puzzles: (game_type, date_str, payload) per puzzle
+            puzzle_hashes: Canonical hashes to append to each game type's
+                index doc in the same commits
+            
+        Returns:
+            puzzle_ids in the order of puzzles
+        """
+        writes = []
+        puzzle_ids = []
+        for game_type, date_str, payload in puzzles:
+            puzzle_id, puzzle_doc = self._puzzle_doc(game_type, date_str, payload)
+            writes.append((self.db.collection("puzzles").document(puzzle_id), puzzle_doc, False))
+            puzzle_ids.append(puzzle_id)
+        for game_type, hashes in (puzzle_hashes or {}).items():
+            if hashes:
+                doc_ref = self.db.collection("puzzleIndex").document(game_type)
+                writes.append((doc_ref, {"hashes": firestore.ArrayUnion(hashes)}, True))
+        
+        for start in range(0, len(writes), BATCH_WRITE_LIMIT):
+            batch = self.db.batch()
+            for doc_ref, doc, merge in writes[start:start + BATCH_WRITE_LIMIT]:
+                batch.set(doc_ref, doc, merge=merge)
+            batch.commit()
+        
+        print(f"✅ {len(puzzle_ids)} puzzle(s) written to Firestore in "
+              f"{(len(writes) + BATCH_WRITE_LIMIT - 1) // BATCH_WRITE_LIMIT} batch commit(s)")
+        return puzzle_ids
+    
+    def get_puzzle_hashes(self, game_type: str) -> List[int]:
+        """Read the canonical puzzle hashes stored in the game type's index doc"""
+        doc = self.db.collection("puzzleIndex").document(game_type).get()
+        if not doc.exists:
+            return []
+        return doc.to_dict().get("hashes", [])
+    
+    def add_puzzle_hash(self, game_type: str, puzzle_hash: int) -> None:
+        """Append a canonical puzzle hash to the game type's index doc (atomic)"""
+        doc_ref = self.db.collection("puzzleIndex").document(game_type)
+        doc_ref.set({"hashes": firestore.ArrayUnion([puzzle_hash])}, merge=True)
+    
     def puzzle_exists(self, game_type: str, date_str: str) -> bool:
         """Check if a puzzle already exists for the given game type and date"""
         puzzle_id = f"{game_type}_{date_str}"
         doc_ref = self.db.collection("puzzles").document(puzzle_id)
         return doc_ref.get().exists
     
-    def delete_old_puzzles(self, game_type: str, keep_date: str) -> int:
+    def existing_puzzle_ids(self, puzzles: Iterable[Tuple[str, str]]) -> Set[str]:
+        """IDs of the (game_type, date_str) puzzles that already exist, in one round trip"""
+        refs = [
+            self.db.collection("puzzles").document(f"{game_type}_{date_str}")
+            for game_type, date_str in puzzles
+        ]
+        if not refs:
+            return set()
+        return {snapshot.id for snapshot in self.db.get_all(refs) if snapshot.exists}
+    
+    def delete_old_puzzles(self, game_type: str, keep_date: str, before: Optional[str] = None) -> int:
         """
         Delete all puzzles for a game type except the one for keep_date.
         Also deletes all associated user results.
         
+        Only document keys are read (keys-only queries, paged with cursors),
+        and each page is deleted with one batch commit. Up to
+        MAX_CONCURRENT_DELETE_COMMITS commits run at once, across pages and
+        puzzles, while the next page is read. Puzzles are deleted after all
+        of their results, so an interrupted cascade can simply be re-run.
+        Counts and time taken are kept in last_delete.
+        
         Args:
             game_type: e.g., "MINI_SUDOKU_6X6"
             keep_date: Date string to keep (e.g., "2025-12-27")
+            before: Only delete puzzles dated before this date (e.g. the
+                start of a backfilled range, so later puzzles are kept)
             
         Returns:
             Number of puzzles deleted
         """
-        puzzles_ref = self.db.collection("puzzles")
-        # Query all puzzles for this game type
-        puzzles = puzzles_ref.where("gameType", "==", game_type).stream()
-        
-        deleted_puzzle_count = 0
-        deleted_results_count = 0
+        start = time.perf_counter()
         keep_puzzle_id = f"{game_type}_{keep_date}"
         
-        for puzzle in puzzles:
-            if puzzle.id != keep_puzzle_id:
-                puzzle_id = puzzle.id
-                
-                # First, delete all results associated with this puzzle
-                results_deleted = self._delete_results_for_puzzle(puzzle_id)
-                deleted_results_count += results_deleted
-                
-                # Then delete the puzzle itself
-                puzzle.reference.delete()
-                deleted_puzzle_count += 1
-                print(f"🗑️  Deleted old puzzle: {puzzle_id} ({results_deleted} results)")
+        # Query all puzzles for this game type
+        puzzles_query = self.db.collection("puzzles").where("gameType", "==", game_type)
+        old_puzzles = [
+            puzzle_ref
+            for page in self._key_pages(puzzles_query)
+            for puzzle_ref in page
+            if self._is_old(puzzle_ref.id, keep_puzzle_id, before)
+        ]
+        
+        with ThreadPoolExecutor(MAX_CONCURRENT_DELETE_COMMITS) as pool:
+            # First, delete all results associated with the puzzles
+            result_commits = [
+                pool.submit(self._commit_deletes, page)
+                for puzzle_ref in old_puzzles
+                for page in self._key_pages(
+                    self.db.collection("results").where("puzzleId", "==", puzzle_ref.id)
+                )
+            ]
+            deleted_results_count = sum(commit.result() for commit in result_commits)
+            
+            # Then delete the puzzles themselves
+            puzzle_commits = [
+                pool.submit(self._commit_deletes, old_puzzles[i:i + BATCH_WRITE_LIMIT])
+                for i in range(0, len(old_puzzles), BATCH_WRITE_LIMIT)
+            ]
+            deleted_puzzle_count = sum(commit.result() for commit in puzzle_commits)
         
+        self.last_delete = {
+            "puzzlesDeleted": deleted_puzzle_count,
+            "resultsDeleted": deleted_results_count,
+            "batchCommits": len(result_commits) + len(puzzle_commits),
+            "seconds": round(time.perf_counter() - start, 4)
+        }
+        metrics.count("puzzlesDeleted", deleted_puzzle_count)
+        metrics.count("resultsDeleted", deleted_results_count)
+        metrics.count("deleteCommits", self.last_delete["batchCommits"])
         if deleted_puzzle_count > 0:
-            print(f"✅ Deleted {deleted_puzzle_count} old puzzle(s) and {deleted_results_count} result(s), kept: {keep_puzzle_id}")
+            for puzzle_ref in old_puzzles:
+                print(f"🗑️  Deleted old puzzle: {puzzle_ref.id}")
+            print(f"✅ Deleted {deleted_puzzle_count} old puzzle(s) and {deleted_results_count} result(s) "
+                  f"in {self.last_delete['batchCommits']} batch commit(s), {self.last_delete['seconds']:.2f}s, "
+                  f"kept: {keep_puzzle_id}")
         else:
             print(f"ℹ️  No old puzzles to delete")
         
         return deleted_puzzle_count
     
-    def _delete_results_for_puzzle(self, puzzle_id: str) -> int:
+    def _key_pages(self, query) -> Iterator[List[Any]]:
         """
-        Delete all user results associated with a specific puzzle.
+        Document references matching a query, read in keys-only pages.
         
         Args:
-            puzzle_id: The puzzle ID to delete results for
+            query: Collection or filtered query to page through
             
-        Returns:
-            Number of results deleted
+        Yields:
+            Lists of up to DELETE_PAGE_SIZE document references, in document ID order
         """
-        results_ref = self.db.collection("results")
-        # Query all results for this puzzle
-        results = results_ref.where("puzzleId", "==", puzzle_id).stream()
-        
-        deleted_count = 0
-        for result in results:
-            result.reference.delete()
-            deleted_count += 1
+        query = query.select([]).order_by(firestore.FieldPath.document_id()).limit(DELETE_PAGE_SIZE)
+        page_query = query
+        while True:
+            snapshots = list(page_query.stream())
+            if snapshots:
+                yield [snapshot.reference for snapshot in snapshots]
+            if len(snapshots) < DELETE_PAGE_SIZE:
+                return
+            # Continue after the last document, even once it has been deleted
+            page_query = query.start_after(snapshots[-1])
+    
+    def _commit_deletes(self, doc_refs: List[Any]) -> int:
+        """
+        Delete documents with one batch commit.
         
-        return deleted_count
-
+        Args:
+            doc_refs: At most BATCH_WRITE_LIMIT document references
+            
+        Returns:
+            Number of documents deleted
+        """
+        batch = self.db.batch()
+        for doc_ref in doc_refs:
+            batch.delete(doc_ref)
+        batch.commit()
+        return len(doc_refs)
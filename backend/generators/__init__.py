@@ -1,11 +1,25 @@
 """Game generators package"""
-from .base import GameGenerator
-from .sudoku_generator import SudokuGenerator
-from .zip_generator import ZipGenerator
-
-__all__ = ['GameGenerator', 'SudokuGenerator', 'ZipGenerator']
-
+import importlib
 
+# Names are imported from their modules on first access, so importing the
+# package (e.g. for derive_seed) does not load every solver
+_EXPORTS = {
+    'GameGenerator': '.base',
+    'derive_seed': '.seeding',
+    'Deadline': '.deadline',
+    'SudokuSolver': '.sudoku_solver',
+    'SolutionGridSampler': '.grid_catalog',
+    'SudokuGenerator': '.sudoku_generator',
+    'ZipSolver': '.zip_solver',
+    'ZipGenerator': '.zip_generator',
+}
 
+__all__ = list(_EXPORTS)
 
 
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
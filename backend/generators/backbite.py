@@ -0,0 +1,93 @@
+"""
+Backbite Markov chain for random Hamiltonian paths on rectangular grids.
+
+Exact search slows down quickly as grids grow, but any Hamiltonian path
+can be turned into another with backbite moves: pick an end of the path
+and a grid neighbor v of that end. Adding the edge end-v closes a loop;
+breaking the loop at v's other side gives a new Hamiltonian path with a
+new end. Starting from a snake path, a fixed number of moves per cell
+yields well-mixed random paths at a cost that grows only with the number
+of moves.
+
+Each move is one index lookup and one slice reversal. Both are linear in
+the path length, so a move gets slower as the grid grows and a full sample
+(moves_per_cell × cells moves) grows with the square of the cell count.
+Both run in C, so on the grid sizes used here the fixed per-move overhead
+still dominates the linear part.
+"""
+import random
+from typing import List, Optional
+
+
+class BackbitePathSampler:
+    """Samples random Hamiltonian paths on a rows × cols grid"""
+
+    def __init__(self, rows: int, cols: int, moves_per_cell: int = 20):
+        """
+        Args:
+            rows: Grid rows
+            cols: Grid columns
+            moves_per_cell: Backbite moves per sample, per grid cell
+        """
+        self.rows = rows
+        self.cols = cols
+        self.cells = rows * cols
+        self.moves_per_cell = moves_per_cell
+        self.neighbors: List[List[int]] = []
+        for cell in range(self.cells):
+            row, col = divmod(cell, cols)
+            self.neighbors.append([
+                r * cols + c
+                for r, c in ((row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1))
+                if 0 <= r < rows and 0 <= c < cols
+            ])
+
+    def snake(self, rng: random.Random) -> List[int]:
+        """Boustrophedon path from a random corner, along rows or columns"""
+        if rng.random() < 0.5:
+            path = [
+                r * self.cols + (c if r % 2 == 0 else self.cols - 1 - c)
+                for r in range(self.rows) for c in range(self.cols)
+            ]
+        else:
+            path = [
+                (r if c % 2 == 0 else self.rows - 1 - r) * self.cols + c
+                for c in range(self.cols) for r in range(self.rows)
+            ]
+        if rng.random() < 0.5:
+            path.reverse()
+        return path
+
+    def sample(self, rng: random.Random, moves: Optional[int] = None) -> List[int]:
+        """
+        Draw a random Hamiltonian path.
+
+        Args:
+            rng: Random source
+            moves: Backbite moves to apply (moves_per_cell × cells if None)
+
+        Returns:
+            Cells of the path in order (cell = row * cols + col)
+        """
+        path = self.snake(rng)
+        self.walk(path, rng, self.moves_per_cell * self.cells if moves is None else moves)
+        return path
+
+    def walk(self, path: List[int], rng: random.Random, moves: int) -> None:
+        """Apply backbite moves to path in place"""
+        neighbors = self.neighbors
+        choice = rng.choice
+        coin = rng.random
+        for _ in range(moves):
+            if coin() < 0.5:
+                # Tail end: v = path[i], new path ... path[i], path[-1], ..., path[i + 1]
+                v = choice(neighbors[path[-1]])
+                i = path.index(v)
+                if i != len(path) - 2:
+                    path[i + 1:] = path[:i:-1]
+            else:
+                # Head end: mirror image of the tail move
+                v = choice(neighbors[path[0]])
+                i = path.index(v)
+                if i != 1:
+                    path[:i] = path[i - 1::-1]
@@ -1,16 +1,31 @@
 """Base protocol for game generators"""
-from typing import Protocol, Dict, Any
+import random
+from typing import Protocol, Dict, Any, Optional
+
+from .deadline import Deadline
 
 
 class GameGenerator(Protocol):
     """Protocol for game puzzle generators"""
     
-    def generate_payload(self, date_str: str) -> Dict[str, Any]:
+    def generate_payload(
+        self,
+        date_str: str,
+        difficulty: Optional[str] = None,
+        rng: Optional[random.Random] = None,
+        deadline: Optional[Deadline] = None
+    ) -> Dict[str, Any]:
         """
         Generate a puzzle payload for a specific date.
         
         Args:
             date_str: Date in format "YYYY-MM-DD"
+            difficulty: Requested difficulty band ("medium", "hard" or
+                "expert"); the generator picks one if None
+            rng: Source of all randomness for this puzzle; the same seed
+                gives the same puzzle. Uses the generator's own rng if None
+            deadline: Time limit for this puzzle; once it expires the
+                generator returns the best valid puzzle found so far
             
         Returns:
             Dictionary containing the puzzle payload
@@ -0,0 +1,76 @@
+"""Incremental clue removal for Sudoku puzzle generation"""
+from typing import List, Tuple
+
+
+class ClueRemover:
+    """
+    Removes givens from a solved board while keeping the solution unique.
+
+    The solver state (candidate masks) is updated in place as cells are
+    removed or restored, and each uniqueness check only asks whether the
+    removed cell could take a different value.
+    """
+
+    def __init__(self, solver):
+        """
+        Args:
+            solver: Solver exposing load/place/clear/has_alternative
+        """
+        self.solver = solver
+        self.size = solver.size
+        self.solution: List[List[int]] = []
+        self.board: List[List[int]] = []
+        self.givens = 0
+        self.nodes = 0
+
+    def reset(self, solution_board: List[List[int]]) -> None:
+        """Start from the complete solution with every cell given"""
+        self.solution = [row[:] for row in solution_board]
+        self.board = [row[:] for row in solution_board]
+        self.givens = self.size * self.size
+        self.solver.load(self.board)
+        self.solver.nodes = 0
+        self.nodes = 0
+
+    def try_remove(self, row: int, col: int) -> bool:
+        """
+        Remove the given at (row, col) if the puzzle stays uniquely solvable.
+
+        Returns:
+            True if the cell was removed, False if it had to be restored
+        """
+        value = self.board[row][col]
+        if value == 0:
+            return False
+
+        self.remove(row, col)
+        nodes_before = self.solver.nodes
+        ambiguous = self.solver.has_alternative(row, col, value)
+        self.nodes += self.solver.nodes - nodes_before
+
+        if ambiguous:
+            self.restore(row, col)
+            return False
+        return True
+
+    def remove(self, row: int, col: int) -> None:
+        """Clear a given without checking uniqueness"""
+        self.board[row][col] = 0
+        self.solver.clear(row, col)
+        self.givens -= 1
+
+    def restore(self, row: int, col: int) -> None:
+        """Put the solution value back at (row, col)"""
+        value = self.solution[row][col]
+        self.board[row][col] = value
+        self.solver.place(row, col, value)
+        self.givens += 1
+
+    def removed_cells(self) -> List[Tuple[int, int]]:
+        """List the currently empty cells"""
+        return [
+            (r, c)
+            for r in range(self.size)
+            for c in range(self.size)
+            if self.board[r][c] == 0
+        ]
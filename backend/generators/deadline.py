@@ -0,0 +1,58 @@
+"""Request deadlines passed from the HTTP handler down to the generators"""
+import math
+import time
+from typing import Any, Dict, Optional
+
+
+class Deadline:
+    """
+    Point in time (time.perf_counter) a request's work must be done by.
+
+    One deadline is created when a request arrives and passed down through
+    the retry loops into generate_payload(), where the generators cap their
+    own timeouts with remaining() and stop improving a puzzle once it has
+    expired. reserve() carves out time for later stages, e.g. the Firestore
+    writes after generation, and expire() cuts the work short when its
+    result is no longer needed. Deadline() without a budget never expires.
+    """
+
+    __slots__ = ("start", "at")
+
+    def __init__(self, seconds: float = math.inf, start: Optional[float] = None):
+        self.start = time.perf_counter() if start is None else start
+        self.at = self.start + seconds
+
+    @property
+    def budget(self) -> float:
+        """Seconds from the start of the request to the deadline"""
+        return self.at - self.start
+
+    def remaining(self) -> float:
+        """Seconds left (negative once expired)"""
+        return self.at - time.perf_counter()
+
+    def expired(self) -> bool:
+        return time.perf_counter() >= self.at
+
+    def expire(self) -> None:
+        """Expire now, so work checking this deadline wraps up early"""
+        self.at = min(self.at, time.perf_counter())
+
+    def reserve(self, seconds: float) -> "Deadline":
+        """Earlier deadline that leaves seconds for the work after it"""
+        deadline = Deadline(start=self.start)
+        deadline.at = self.at - seconds
+        return deadline
+
+    def usage(self) -> Dict[str, Any]:
+        """Budget and time used so far, for responses"""
+        used = time.perf_counter() - self.start
+        return {
+            "budgetSeconds": round(self.budget, 4) if math.isfinite(self.budget) else None,
+            "usedSeconds": round(used, 4),
+            "usedFraction": round(used / self.budget, 4) if math.isfinite(self.budget) else None,
+        }
+
+
+# Shared deadline for work without a time limit
+NO_DEADLINE = Deadline()
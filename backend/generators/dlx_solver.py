@@ -0,0 +1,300 @@
+"""Exact-cover (Dancing Links) solver for rectangular-block Sudoku boards"""
+import random
+from typing import List, Optional
+
+
+class DancingLinksSolver:
+    """
+    Knuth's Algorithm X on a Dancing Links matrix, stored in flat lists.
+
+    Columns are the 4 * size² constraints (cell filled, digit in row, digit
+    in column, digit in block); rows are the size³ (row, col, digit)
+    candidates. Givens are kept in self.grid and covered at the start of
+    each search, so cells can be placed and cleared in any order between
+    searches. Exposes the same interface as SudokuSolver.
+    """
+
+    def __init__(self, size: int = 9, block_rows: int = 3, block_cols: int = 3):
+        self.size = size
+        self.block_rows = block_rows
+        self.block_cols = block_cols
+        self.cell_count = size * size
+
+        self.grid = [0] * self.cell_count
+
+        # Statistics for the most recent search
+        self.nodes = 0
+        self.max_depth = 0
+        self.solution: Optional[List[int]] = None
+
+        # Candidates chosen on the current search path
+        self._partial: List[int] = []
+
+        self._build_matrix()
+
+    def _build_matrix(self) -> None:
+        size = self.size
+        cells = self.cell_count
+        column_count = 4 * cells
+        blocks_per_row = size // self.block_cols
+
+        # Node 0 is the root, nodes 1..column_count are column headers
+        header_count = column_count + 1
+        self._left = [i - 1 for i in range(header_count)]
+        self._right = [i + 1 for i in range(header_count)]
+        self._left[0] = column_count
+        self._right[column_count] = 0
+        self._up = list(range(header_count))
+        self._down = list(range(header_count))
+        self._column = list(range(header_count))
+        self._row_id = [-1] * header_count
+        self._column_size = [0] * header_count
+        self._covered = [False] * header_count
+
+        # First node of every candidate row, indexed by cell * size + digit - 1
+        self._row_start = [0] * (cells * size)
+
+        for r in range(size):
+            for c in range(size):
+                cell = r * size + c
+                block = (r // self.block_rows) * blocks_per_row + c // self.block_cols
+                for d in range(size):
+                    candidate = cell * size + d
+                    columns = (
+                        1 + cell,
+                        1 + cells + r * size + d,
+                        1 + 2 * cells + c * size + d,
+                        1 + 3 * cells + block * size + d,
+                    )
+                    first = len(self._column)
+                    self._row_start[candidate] = first
+                    for offset, col in enumerate(columns):
+                        node = first + offset
+                        self._column.append(col)
+                        self._row_id.append(candidate)
+                        # Link vertically at the bottom of the column
+                        self._up.append(self._up[col])
+                        self._down.append(col)
+                        self._down[self._up[col]] = node
+                        self._up[col] = node
+                        self._column_size[col] += 1
+                        # Link horizontally in a circular row of four
+                        self._left.append(first + (offset - 1) % 4)
+                        self._right.append(first + (offset + 1) % 4)
+
+    def load(self, board: List[List[int]]) -> bool:
+        """
+        Reset the givens to those of board.
+
+        Returns:
+            False if two givens conflict with each other
+        """
+        size = self.size
+        self.grid = [board[r][c] for r in range(size) for c in range(size)]
+
+        row_used = [0] * size
+        col_used = [0] * size
+        block_used = [0] * size
+        blocks_per_row = size // self.block_cols
+        for idx, value in enumerate(self.grid):
+            if not value:
+                continue
+            r, c = divmod(idx, size)
+            b = (r // self.block_rows) * blocks_per_row + c // self.block_cols
+            bit = 1 << (value - 1)
+            if (row_used[r] | col_used[c] | block_used[b]) & bit:
+                return False
+            row_used[r] |= bit
+            col_used[c] |= bit
+            block_used[b] |= bit
+        return True
+
+    def count_solutions(self, board: List[List[int]], limit: int = 2) -> int:
+        """
+        Count solutions of board, stopping as soon as limit is reached.
+
+        The first solution found is kept in self.solution (flat list).
+        """
+        self.nodes = 0
+        self.max_depth = 0
+        self.solution = None
+        if not self.load(board):
+            return 0
+        return self._solve_with_givens(limit, None, [])
+
+    def fill_random(self, rng: random.Random) -> List[List[int]]:
+        """Generate a random complete board using rng for row ordering"""
+        self.nodes = 0
+        self.max_depth = 0
+        self.solution = None
+        self.grid = [0] * self.cell_count
+        self._solve_with_givens(1, rng, [])
+        return self.to_board(self.solution)
+
+    def place(self, row: int, col: int, value: int) -> None:
+        """Set a given on the loaded board"""
+        self.grid[row * self.size + col] = value
+
+    def clear(self, row: int, col: int) -> None:
+        """Remove a given from the loaded board"""
+        self.grid[row * self.size + col] = 0
+
+    def has_alternative(self, row: int, col: int, value: int) -> bool:
+        """
+        Check whether the loaded board has a solution with (row, col) != value.
+
+        The cell must already be cleared. Node counts accumulate in
+        self.nodes across calls.
+        """
+        cell = row * self.size + col
+        extra = [cell * self.size + d for d in range(self.size) if d != value - 1]
+        for candidate in extra:
+            if self._solve_with_givens(1, None, [candidate]):
+                return True
+        return False
+
+    def to_board(self, flat: List[int]) -> List[List[int]]:
+        """Convert a flat cell list into a list of rows"""
+        size = self.size
+        return [flat[r * size:(r + 1) * size] for r in range(size)]
+
+    def _solve_with_givens(
+        self,
+        limit: int,
+        rng: Optional[random.Random],
+        extra_candidates: List[int]
+    ) -> int:
+        """Cover the givens (plus extra candidates), search, then restore the matrix"""
+        size = self.size
+        chosen = [
+            idx * size + value - 1
+            for idx, value in enumerate(self.grid)
+            if value
+        ]
+        chosen.extend(extra_candidates)
+
+        selected = []
+        found = 0
+        for candidate in chosen:
+            if not self._select(self._row_start[candidate]):
+                break
+            selected.append(candidate)
+        else:
+            self._partial = list(chosen)
+            found = self._search(limit, rng, 0)
+
+        for candidate in reversed(selected):
+            self._deselect(self._row_start[candidate])
+        return found
+
+    def _select(self, first: int) -> bool:
+        """Cover every column of a row; fails if one is already covered"""
+        node = first
+        while True:
+            if self._covered[self._column[node]]:
+                # Undo the columns covered so far
+                while node != first:
+                    node = self._left[node]
+                    self._uncover(self._column[node])
+                return False
+            self._cover(self._column[node])
+            node = self._right[node]
+            if node == first:
+                return True
+
+    def _deselect(self, first: int) -> None:
+        node = self._left[first]
+        while True:
+            self._uncover(self._column[node])
+            if node == first:
+                return
+            node = self._left[node]
+
+    def _cover(self, col: int) -> None:
+        left, right, up, down = self._left, self._right, self._up, self._down
+        column, column_size = self._column, self._column_size
+        self._covered[col] = True
+        right[left[col]] = right[col]
+        left[right[col]] = left[col]
+        i = down[col]
+        while i != col:
+            j = right[i]
+            while j != i:
+                down[up[j]] = down[j]
+                up[down[j]] = up[j]
+                column_size[column[j]] -= 1
+                j = right[j]
+            i = down[i]
+
+    def _uncover(self, col: int) -> None:
+        left, right, up, down = self._left, self._right, self._up, self._down
+        column, column_size = self._column, self._column_size
+        i = up[col]
+        while i != col:
+            j = left[i]
+            while j != i:
+                column_size[column[j]] += 1
+                down[up[j]] = j
+                up[down[j]] = j
+                j = left[j]
+            i = up[i]
+        right[left[col]] = col
+        left[right[col]] = col
+        self._covered[col] = False
+
+    def _search(self, limit: int, rng: Optional[random.Random], depth: int) -> int:
+        """Algorithm X: branch on the column with the fewest remaining rows"""
+        self.nodes += 1
+        if depth > self.max_depth:
+            self.max_depth = depth
+
+        right, down = self._right, self._down
+        column_size = self._column_size
+
+        col = right[0]
+        if col == 0:
+            if self.solution is None:
+                solution = [0] * self.cell_count
+                for candidate in self._partial:
+                    cell, digit = divmod(candidate, self.size)
+                    solution[cell] = digit + 1
+                self.solution = solution
+            return 1
+
+        best = col
+        best_size = column_size[col]
+        while col != 0 and best_size > 1:
+            if column_size[col] < best_size:
+                best, best_size = col, column_size[col]
+            col = right[col]
+        if best_size == 0:
+            return 0
+
+        rows = []
+        i = down[best]
+        while i != best:
+            rows.append(i)
+            i = down[i]
+        if rng is not None:
+            rng.shuffle(rows)
+
+        found = 0
+        self._cover(best)
+        for node in rows:
+            j = right[node]
+            while j != node:
+                self._cover(self._column[j])
+                j = right[j]
+            self._partial.append(self._row_id[node])
+
+            found += self._search(limit - found, rng, depth + 1)
+
+            self._partial.pop()
+            j = self._left[node]
+            while j != node:
+                self._uncover(self._column[j])
+                j = self._left[j]
+            if found >= limit:
+                break
+        self._uncover(best)
+        return found
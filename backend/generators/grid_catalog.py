@@ -0,0 +1,204 @@
+"""
+Catalog of essentially different 6×6 Sudoku solution grids.
+
+Two grids are equivalent when one maps to the other by relabeling digits,
+permuting the three bands, swapping the two rows inside a band, permuting
+the two stacks or permuting the three columns inside a stack (transposition
+does not apply to 2×3 blocks). The 28,200,960 valid 6×6 grids fall into a
+small number of such classes. The catalog stores one representative per
+class together with its weight - the number of grids with first row
+123456 in the class - so a class can be drawn with probability
+proportional to its size and a uniformly random symmetry applied to it.
+That yields a uniformly random solution grid without any search.
+
+Regenerate the shipped catalog with:
+    python -m generators.grid_catalog
+"""
+import itertools
+import os
+import random
+from bisect import bisect_right
+from typing import List, Optional, Sequence, Tuple
+
+SIZE = 6
+BLOCK_ROWS = 2
+BLOCK_COLS = 3
+
+CATALOG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "sudoku_6x6_grids.txt")
+
+
+def _row_permutations() -> List[Tuple[int, ...]]:
+    """All band orders combined with row swaps inside each band"""
+    bands = range(SIZE // BLOCK_ROWS)
+    perms = []
+    for band_order in itertools.permutations(bands):
+        for swaps in itertools.product(
+            itertools.permutations(range(BLOCK_ROWS)), repeat=len(band_order)
+        ):
+            perms.append(tuple(
+                band * BLOCK_ROWS + swap[i]
+                for band, swap in zip(band_order, swaps)
+                for i in range(BLOCK_ROWS)
+            ))
+    return perms
+
+
+def _col_permutations() -> List[Tuple[int, ...]]:
+    """All stack orders combined with column permutations inside each stack"""
+    stacks = range(SIZE // BLOCK_COLS)
+    perms = []
+    for stack_order in itertools.permutations(stacks):
+        for inner in itertools.product(
+            itertools.permutations(range(BLOCK_COLS)), repeat=len(stack_order)
+        ):
+            perms.append(tuple(
+                stack * BLOCK_COLS + order[i]
+                for stack, order in zip(stack_order, inner)
+                for i in range(BLOCK_COLS)
+            ))
+    return perms
+
+
+def _normalize(flat: Sequence[int]) -> Tuple[int, ...]:
+    """Relabel digits so the first row reads 1..6"""
+    mapping = {digit: i + 1 for i, digit in enumerate(flat[:SIZE])}
+    return tuple(mapping[digit] for digit in flat)
+
+
+def _enumerate_normalized_grids() -> List[Tuple[int, ...]]:
+    """Every valid grid whose first row is 1..6 (39,168 of them)"""
+    first_row = tuple(range(1, SIZE + 1))
+    perms = list(itertools.permutations(first_row))
+    grids = []
+
+    def extend(rows: List[Tuple[int, ...]]) -> None:
+        r = len(rows)
+        if r == SIZE:
+            grids.append(tuple(digit for row in rows for digit in row))
+            return
+        band_start = (r // BLOCK_ROWS) * BLOCK_ROWS
+        for perm in perms:
+            if any(perm[c] == row[c] for row in rows for c in range(SIZE)):
+                continue
+            if any(
+                set(perm[s:s + BLOCK_COLS]) & set(row[s:s + BLOCK_COLS])
+                for row in rows[band_start:]
+                for s in range(0, SIZE, BLOCK_COLS)
+            ):
+                continue
+            extend(rows + [perm])
+
+    extend([first_row])
+    return grids
+
+
+def build_catalog() -> List[Tuple[int, Tuple[int, ...]]]:
+    """
+    Split all normalized grids into equivalence classes.
+
+    Returns:
+        [(weight, representative), ...] sorted by representative, where the
+        representative is the lexicographically smallest normalized grid of
+        its class
+    """
+    row_perms = _row_permutations()
+    col_perms = _col_permutations()
+    unseen = set(_enumerate_normalized_grids())
+    catalog = []
+
+    while unseen:
+        grid = unseen.pop()
+        orbit = {grid}
+        for row_perm in row_perms:
+            rows = [grid[r * SIZE:(r + 1) * SIZE] for r in row_perm]
+            for col_perm in col_perms:
+                orbit.add(_normalize([row[c] for row in rows for c in col_perm]))
+        unseen -= orbit
+        catalog.append((len(orbit), min(orbit)))
+
+    catalog.sort(key=lambda entry: entry[1])
+    return catalog
+
+
+def write_catalog(catalog: List[Tuple[int, Tuple[int, ...]]], path: str = CATALOG_PATH) -> None:
+    """Write the catalog as 'weight digits' lines"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write("# Essentially different 6x6 Sudoku grids (2x3 blocks)\n")
+        f.write("# weight = grids with first row 123456 in the class; total 39168\n")
+        for weight, grid in catalog:
+            f.write(f"{weight} {''.join(str(d) for d in grid)}\n")
+
+
+def load_catalog(path: str = CATALOG_PATH) -> List[Tuple[int, Tuple[int, ...]]]:
+    """Read the catalog written by write_catalog()"""
+    catalog = []
+    with open(path) as f:
+        for line in f:
+            if not line.strip() or line.startswith("#"):
+                continue
+            weight, digits = line.split()
+            catalog.append((int(weight), tuple(int(d) for d in digits)))
+    return catalog
+
+
+class SolutionGridSampler:
+    """Draws uniformly random 6×6 solution grids from the shipped catalog"""
+
+    def __init__(self, path: str = CATALOG_PATH):
+        self.path = path
+        self._representatives: Optional[List[Tuple[int, ...]]] = None
+        self._cumulative: List[int] = []
+
+    @staticmethod
+    def supports(size: int, block_rows: int, block_cols: int) -> bool:
+        """The catalog only covers 6×6 boards with 2×3 blocks"""
+        return (size, block_rows, block_cols) == (SIZE, BLOCK_ROWS, BLOCK_COLS)
+
+    def sample(self, rng: random.Random) -> List[List[int]]:
+        """Return a uniformly random valid grid in constant time"""
+        if self._representatives is None:
+            self._load()
+
+        # Pick a class with probability proportional to its size
+        pick = rng.randrange(self._cumulative[-1])
+        grid = self._representatives[bisect_right(self._cumulative, pick)]
+
+        # Then a uniformly random symmetry: bands, rows, stacks, columns, digits
+        bands = list(range(SIZE // BLOCK_ROWS))
+        rng.shuffle(bands)
+        row_order = []
+        for band in bands:
+            rows = [band * BLOCK_ROWS + i for i in range(BLOCK_ROWS)]
+            rng.shuffle(rows)
+            row_order.extend(rows)
+
+        stacks = list(range(SIZE // BLOCK_COLS))
+        rng.shuffle(stacks)
+        col_order = []
+        for stack in stacks:
+            cols = [stack * BLOCK_COLS + i for i in range(BLOCK_COLS)]
+            rng.shuffle(cols)
+            col_order.extend(cols)
+
+        digits = list(range(1, SIZE + 1))
+        rng.shuffle(digits)
+
+        return [
+            [digits[grid[r * SIZE + c] - 1] for c in col_order]
+            for r in row_order
+        ]
+
+    def _load(self) -> None:
+        catalog = load_catalog(self.path)
+        self._representatives = [grid for _, grid in catalog]
+        total = 0
+        for weight, _ in catalog:
+            total += weight
+            self._cumulative.append(total)
+
+
+if __name__ == "__main__":
+    built = build_catalog()
+    write_catalog(built)
+    print(f"Wrote {len(built)} classes covering {sum(w for w, _ in built)} normalized grids to {CATALOG_PATH}")
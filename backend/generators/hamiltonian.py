@@ -0,0 +1,170 @@
+"""
+Bitboard Hamiltonian path search for ZIP grids.
+
+Cells are numbered row * cols + col and sets of cells are integer
+bitmasks, so visiting, undoing and neighbor tests are single bit
+operations instead of set and tuple allocations. The search prunes
+branches that cannot complete:
+
+    - parity: the grid is bipartite, so the remaining path alternates
+      colors and the unvisited cells of each color must match it
+    - dead ends: an unvisited cell with no way in is fatal, and at most
+      one cell with a single way in may exist (it must be the path end)
+    - connectivity: all unvisited cells must stay reachable from the head
+"""
+import random
+import time
+from typing import List, Optional
+
+
+class _SearchAborted(Exception):
+    """Raised inside the search when its node or time budget runs out"""
+
+
+class HamiltonianPathSearch:
+    """Randomized Hamiltonian path search on a rows × cols grid"""
+
+    def __init__(self, rows: int, cols: int, check_interval: int = 1024):
+        """
+        Args:
+            rows: Grid rows
+            cols: Grid columns
+            check_interval: Nodes between deadline checks (power of two)
+        """
+        self.rows = rows
+        self.cols = cols
+        self.cells = rows * cols
+        self.full = (1 << self.cells) - 1
+        self.check_mask = check_interval - 1
+
+        self.neighbors: List[List[int]] = []
+        self.neighbor_masks: List[int] = []
+        for cell in range(self.cells):
+            row, col = divmod(cell, cols)
+            adjacent = [
+                r * cols + c
+                for r, c in ((row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1))
+                if 0 <= r < rows and 0 <= c < cols
+            ]
+            self.neighbors.append(adjacent)
+            self.neighbor_masks.append(sum(1 << n for n in adjacent))
+
+        # Checkerboard coloring and column edge masks for bitboard shifts
+        self.black = sum(1 << cell for cell in range(self.cells) if sum(divmod(cell, cols)) % 2 == 0)
+        self.not_first_col = sum(1 << cell for cell in range(self.cells) if cell % cols != 0)
+        self.not_last_col = sum(1 << cell for cell in range(self.cells) if cell % cols != cols - 1)
+
+        self.nodes = 0
+
+    def can_start(self, cell: int) -> bool:
+        """A path covering every cell can only start on the majority color"""
+        black_cells = self.black.bit_count()
+        white_cells = self.cells - black_cells
+        if black_cells == white_cells:
+            return True
+        is_black = bool(self.black >> cell & 1)
+        return is_black == (black_cells > white_cells)
+
+    def find_path(
+        self,
+        start: int,
+        rng: random.Random,
+        deadline: Optional[float] = None,
+        max_nodes: Optional[int] = None
+    ) -> Optional[List[int]]:
+        """
+        Search for a Hamiltonian path from start.
+
+        Candidates are tried in Warnsdorff order (fewest onward moves first)
+        with random tie-breaking, so repeated calls give varied paths.
+
+        Args:
+            start: Start cell
+            rng: Random source for tie-breaking
+            deadline: time.perf_counter() value to give up at
+            max_nodes: Node budget for this search
+
+        Returns:
+            Cells of the path in order, or None if none was found in budget
+        """
+        self.nodes = 0
+        self._deadline = deadline
+        self._max_nodes = max_nodes
+        self._rng = rng
+        path = [start]
+        try:
+            if self._extend(path, 1 << start):
+                return path
+        except _SearchAborted:
+            pass
+        return None
+
+    def _extend(self, path: List[int], visited: int) -> bool:
+        if visited == self.full:
+            return True
+
+        self.nodes += 1
+        if not self.nodes & self.check_mask:
+            if self._max_nodes is not None and self.nodes > self._max_nodes:
+                raise _SearchAborted()
+            if self._deadline is not None and time.perf_counter() > self._deadline:
+                raise _SearchAborted()
+
+        head = path[-1]
+        unvisited = self.full & ~visited
+        if not self._feasible(head, unvisited):
+            return False
+
+        candidates = []
+        for cell in self.neighbors[head]:
+            if not visited >> cell & 1:
+                onward = (self.neighbor_masks[cell] & unvisited).bit_count()
+                candidates.append((onward, self._rng.random(), cell))
+        candidates.sort()
+
+        for _, _, cell in candidates:
+            path.append(cell)
+            if self._extend(path, visited | 1 << cell):
+                return True
+            path.pop()
+        return False
+
+    def _feasible(self, head: int, unvisited: int) -> bool:
+        """Parity, dead-end and connectivity checks for the unvisited cells"""
+        # Parity: the rest of the path starts on the color opposite the head
+        remaining = unvisited.bit_count()
+        black_left = (unvisited & self.black).bit_count()
+        next_color_left = remaining - black_left if self.black >> head & 1 else black_left
+        if next_color_left * 2 - remaining not in (0, 1):
+            return False
+
+        # Dead ends: a cell with fewer than two ways in must be the path end
+        head_mask = self.neighbor_masks[head]
+        ends = 0
+        cells = unvisited
+        while cells:
+            low = cells & -cells
+            cells ^= low
+            degree = (self.neighbor_masks[low.bit_length() - 1] & unvisited).bit_count()
+            if head_mask & low:
+                degree += 1
+            if degree < 2:
+                if degree == 0 and remaining > 1:
+                    return False
+                ends += 1
+                if ends > 1:
+                    return False
+
+        # Connectivity: flood fill the unvisited cells from the head's neighbors
+        reach = head_mask & unvisited
+        while True:
+            grown = (
+                reach
+                | (reach << self.cols)
+                | (reach >> self.cols)
+                | ((reach & self.not_last_col) << 1)
+                | ((reach & self.not_first_col) >> 1)
+            ) & unvisited
+            if grown == reach:
+                return reach == unvisited
+            reach = grown
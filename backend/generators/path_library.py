@@ -0,0 +1,202 @@
+"""
+Library of precomputed 6×6 Hamiltonian paths for ZIP puzzles.
+
+The library stores distinct paths up to symmetry: two paths are the same
+entry when one maps to the other by one of the 8 grid symmetries
+(rotations and reflections) and/or by walking it backwards. Each entry is
+kept in its canonical form - the smallest of its 16 images - as a start
+cell byte followed by the 35 steps packed as 2-bit directions (10 bytes).
+
+File layout (little-endian):
+    header  : magic "BBHP", version u16, rows u8, cols u8, entry count u32
+    records : fixed-size records, so entry i is a single slice at
+              HEADER.size + i * record_size
+
+The file is memory-mapped on first use and entries are decoded one at a
+time, so opening the library costs nothing and each sample is O(1): one
+random entry, one random symmetry and a random direction.
+
+Regenerate the shipped library with:
+    python -m generators.path_library --count 20000
+"""
+import argparse
+import mmap
+import os
+import random
+import struct
+import time
+from typing import List, Optional, Sequence, Tuple
+
+from .puzzle_encoding import DIRECTIONS, pack_moves, path_to_moves, unpack_moves
+
+SIZE = 6
+
+LIBRARY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "zip_6x6_paths.bin")
+
+MAGIC = b"BBHP"
+VERSION = 1
+HEADER = struct.Struct("<4sHBBI")
+
+
+def _symmetries(size: int) -> List[List[int]]:
+    """Cell maps of the 8 symmetries of a size × size grid (identity first)"""
+    last = size - 1
+    transforms = [
+        lambda r, c: (r, c),
+        lambda r, c: (c, last - r),
+        lambda r, c: (last - r, last - c),
+        lambda r, c: (last - c, r),
+        lambda r, c: (r, last - c),
+        lambda r, c: (last - r, c),
+        lambda r, c: (c, r),
+        lambda r, c: (last - c, last - r),
+    ]
+    maps = []
+    for transform in transforms:
+        cell_map = []
+        for cell in range(size * size):
+            r, c = transform(*divmod(cell, size))
+            cell_map.append(r * size + c)
+        maps.append(cell_map)
+    return maps
+
+
+def canonical_path(cells: Sequence[int], symmetries: Sequence[Sequence[int]]) -> Tuple[int, ...]:
+    """Smallest image of a path under the grid symmetries and reversal"""
+    best = None
+    for cell_map in symmetries:
+        mapped = tuple(cell_map[cell] for cell in cells)
+        for image in (mapped, mapped[::-1]):
+            if best is None or image < best:
+                best = image
+    return best
+
+
+def encode_path(cells: Sequence[int], size: int = SIZE) -> bytes:
+    """Pack a path as its start cell and 2-bit step directions"""
+    path = [divmod(cell, size) for cell in cells]
+    return bytes([cells[0]]) + pack_moves(path_to_moves(path))
+
+
+def record_size(size: int = SIZE) -> int:
+    """Bytes per encoded path on a size × size grid"""
+    return 1 + (2 * (size * size - 1) + 7) // 8
+
+
+def build_library(count: int, seed: int, size: int = SIZE) -> List[bytes]:
+    """
+    Sample count distinct path classes with the backbite chain.
+
+    Returns:
+        Encoded canonical paths, sorted
+    """
+    from generators.backbite import BackbitePathSampler
+
+    rng = random.Random(seed)
+    sampler = BackbitePathSampler(size, size)
+    symmetries = _symmetries(size)
+    seen = set()
+    while len(seen) < count:
+        seen.add(canonical_path(sampler.sample(rng), symmetries))
+    return sorted(encode_path(cells, size) for cells in seen)
+
+
+def write_library(records: List[bytes], path: str = LIBRARY_PATH, size: int = SIZE) -> None:
+    """Write encoded paths into a library file"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, size, size, len(records)))
+        for record in records:
+            f.write(record)
+
+
+class HamiltonianPathLibrary:
+    """Samples Hamiltonian paths from a memory-mapped library file"""
+
+    def __init__(self, path: str = LIBRARY_PATH):
+        self.path = path
+        self.count = 0
+        self._map: Optional[mmap.mmap] = None
+        self._file = None
+
+    @staticmethod
+    def supports(rows: int, cols: int, path: str = LIBRARY_PATH) -> bool:
+        """The shipped library covers 6×6 grids (if its file is present)"""
+        return (rows, cols) == (SIZE, SIZE) and os.path.exists(path)
+
+    def sample(self, rng: random.Random) -> List[int]:
+        """
+        Return a random Hamiltonian path in constant time.
+
+        Returns:
+            Cells of the path in order (cell = row * size + col)
+        """
+        if self._map is None:
+            self._open()
+
+        cells = self.get(rng.randrange(self.count))
+        cell_map = self._symmetries[rng.randrange(8)]
+        cells = [cell_map[cell] for cell in cells]
+        if rng.random() < 0.5:
+            cells.reverse()
+        return cells
+
+    def get(self, index: int) -> List[int]:
+        """Decode entry index (in canonical form) with a single slice of the mapped file"""
+        if self._map is None:
+            self._open()
+        if not 0 <= index < self.count:
+            raise IndexError(f"Path library has {self.count} entries, asked for {index}")
+
+        start = HEADER.size + index * self._record_size
+        record = self._map[start:start + self._record_size]
+        cell = record[0]
+        cells = [cell]
+        for move in unpack_moves(record[1:], self._cells - 1):
+            cell += self._steps[move]
+            cells.append(cell)
+        return cells
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._file.close()
+            self._map = None
+
+    def _open(self) -> None:
+        self._file = open(self.path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, rows, cols, count = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION or rows != cols:
+            raise ValueError(f"Not a version {VERSION} square path library: {self.path}")
+
+        self.size = rows
+        self.count = count
+        self._cells = rows * cols
+        self._record_size = record_size(rows)
+        self._steps = [dr * cols + dc for dr, dc in DIRECTIONS]
+        self._symmetries = _symmetries(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the 6×6 Hamiltonian path library')
+    parser.add_argument('--output', default=LIBRARY_PATH, help='Library file to write')
+    parser.add_argument('--count', type=int, default=20000, help='Distinct paths (up to symmetry)')
+    parser.add_argument('--seed', type=int, default=1, help='Random seed')
+    args = parser.parse_args()
+
+    print(f"\n🧭 Building Hamiltonian path library")
+    print(f"🔢 Paths: {args.count} (×16 with symmetries and reversal)\n")
+
+    start = time.perf_counter()
+    records = build_library(args.count, args.seed)
+    write_library(records, args.output)
+    elapsed = time.perf_counter() - start
+
+    print(f"✅ Wrote {len(records)} paths to {args.output} "
+          f"({os.path.getsize(args.output) / 1024:.0f} KiB) in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Bit-packing helpers shared by the puzzle bank and compact payload formats"""
+from typing import Any, Dict, List, Sequence, Tuple
+
+# Path step directions, indexed by their 2-bit code
+DIRECTIONS = [(-1, 0), (0, 1), (1, 0), (0, -1)]
+DIRECTION_LETTERS = "URDL"
+
+
+def zip_dimensions(payload: Dict[str, Any]) -> Tuple[int, int]:
+    """(rows, cols) of a ZIP payload: square grids store size, others rows and cols"""
+    if "size" in payload:
+        return payload["size"], payload["size"]
+    return payload["rows"], payload["cols"]
+
+
+def pack_nibbles(values: Sequence[int]) -> bytes:
+    """Pack values 0-15 two per byte (low nibble first)"""
+    data = bytearray((len(values) + 1) // 2)
+    for i, value in enumerate(values):
+        data[i >> 1] |= (value & 0xF) << ((i & 1) * 4)
+    return bytes(data)
+
+
+def unpack_nibbles(data: bytes, count: int) -> List[int]:
+    """Inverse of pack_nibbles()"""
+    return [(data[i >> 1] >> ((i & 1) * 4)) & 0xF for i in range(count)]
+
+
+def path_to_moves(path: Sequence[Tuple[int, int]]) -> List[int]:
+    """Convert a path of adjacent cells into 2-bit direction codes"""
+    moves = []
+    for (r1, c1), (r2, c2) in zip(path, path[1:]):
+        moves.append(DIRECTIONS.index((r2 - r1, c2 - c1)))
+    return moves
+
+
+def moves_to_path(start: Tuple[int, int], moves: Sequence[int]) -> List[Tuple[int, int]]:
+    """Walk direction codes from start back into a list of cells"""
+    row, col = start
+    path = [(row, col)]
+    for move in moves:
+        dr, dc = DIRECTIONS[move]
+        row, col = row + dr, col + dc
+        path.append((row, col))
+    return path
+
+
+def pack_moves(moves: Sequence[int]) -> bytes:
+    """Pack direction codes four per byte (lowest bits first)"""
+    data = bytearray((len(moves) + 3) // 4)
+    for i, move in enumerate(moves):
+        data[i >> 2] |= (move & 0x3) << ((i & 3) * 2)
+    return bytes(data)
+
+
+def unpack_moves(data: bytes, count: int) -> List[int]:
+    """Inverse of pack_moves()"""
+    return [(data[i >> 2] >> ((i & 3) * 2)) & 0x3 for i in range(count)]
+
+
+def wall_edge_count(rows: int, cols: int) -> int:
+    """Number of interior edges a wall can sit on"""
+    return rows * (cols - 1) + (rows - 1) * cols
+
+
+def walls_to_mask(walls: Sequence[Dict[str, Any]], rows: int, cols: int) -> int:
+    """
+    Encode walls as a bitmask over interior edges.
+
+    Bits 0 .. rows*(cols-1)-1 are RIGHT edges in row-major order, the
+    following (rows-1)*cols bits are BOTTOM edges. LEFT and TOP walls are
+    stored as the RIGHT/BOTTOM wall of the neighbouring cell.
+    """
+    right_edges = rows * (cols - 1)
+    mask = 0
+    for wall in walls:
+        row, col, side = wall["row"], wall["col"], wall["side"]
+        if side == "LEFT":
+            col, side = col - 1, "RIGHT"
+        elif side == "TOP":
+            row, side = row - 1, "BOTTOM"
+        if side == "RIGHT":
+            mask |= 1 << (row * (cols - 1) + col)
+        else:
+            mask |= 1 << (right_edges + row * cols + col)
+    return mask
+
+
+def mask_to_walls(mask: int, rows: int, cols: int) -> List[Dict[str, Any]]:
+    """Inverse of walls_to_mask() (walls come back as RIGHT/BOTTOM)"""
+    right_edges = rows * (cols - 1)
+    walls = []
+    for bit in range(wall_edge_count(rows, cols)):
+        if not mask >> bit & 1:
+            continue
+        if bit < right_edges:
+            row, col = divmod(bit, cols - 1)
+            walls.append({"row": row, "col": col, "side": "RIGHT"})
+        else:
+            row, col = divmod(bit - right_edges, cols)
+            walls.append({"row": row, "col": col, "side": "BOTTOM"})
+    return walls
@@ -0,0 +1,21 @@
+"""Deterministic per-date seeds for puzzle generation"""
+import hashlib
+
+
+def derive_seed(game_type: str, date_str: str, salt: str = "") -> int:
+    """
+    Derive a 64-bit seed from game type, date and salt.
+    
+    The same inputs give the same seed on every instance and Python
+    version (unlike hash()), so a day's puzzle can be recomputed anywhere.
+    
+    Args:
+        game_type: e.g., "MINI_SUDOKU_6X6"
+        date_str: Date in format "YYYY-MM-DD"
+        salt: Secret or rotation value mixed into the seed
+        
+    Returns:
+        Unsigned 64-bit seed for random.Random()
+    """
+    key = f"{game_type}|{date_str}|{salt}".encode()
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little")
@@ -1,48 +1,99 @@
-"""Sudoku 6×6 puzzle generator using deterministic algorithms"""
-import json
+"""Sudoku puzzle generator (6×6 by default) using deterministic algorithms"""
 import random
 from typing import Dict, Any, List, Tuple, Optional
 
+from .clue_remover import ClueRemover
+from .deadline import NO_DEADLINE, Deadline
+from .grid_catalog import SolutionGridSampler
+from .sudoku_grader import SudokuGrader
+from .sudoku_solver import create_solver
+
+# SudokuGrader score bands for 6×6 boards (scaled by area for other sizes)
+DIFFICULTY_BANDS = {
+    "medium": (14, 22),    # Naked singles only, 14-22 empty cells
+    "hard": (23, 28),      # Few givens, or a couple of hidden singles
+    "expert": (29, 400)    # Several hidden singles or advanced techniques
+}
+
 
 class SudokuGenerator:
-    """Generates 6×6 Sudoku puzzles using backtracking algorithms"""
+    """
+    Generates Sudoku puzzles with rectangular blocks.
     
-    def __init__(self, openai_client=None):
+    Boards up to 10×10 use the bitmask constraint-propagation solver,
+    12×12 and larger use the Dancing Links exact-cover solver.
+    """
+    
+    def __init__(self, openai_client=None, size: int = 6, block_rows: int = 2, block_cols: int = 3):
         # openai_client parameter kept for API compatibility but not used
-        self.size = 6
-        self.block_rows = 2
-        self.block_cols = 3
-        self.numbers = [1, 2, 3, 4, 5, 6]
+        self.size = size
+        self.block_rows = block_rows
+        self.block_cols = block_cols
+        self.numbers = list(range(1, size + 1))
+        self.rng = random.Random()
+        self.solver = create_solver(self.size, self.block_rows, self.block_cols)
+        self.remover = ClueRemover(self.solver)
+        self.grader = SudokuGrader(self.size, self.block_rows, self.block_cols)
+        self.grid_sampler = (
+            SolutionGridSampler()
+            if SolutionGridSampler.supports(self.size, self.block_rows, self.block_cols)
+            else None
+        )
+        self.max_band_attempts = 30  # Fresh solution boards tried per puzzle
+        self.deadline = NO_DEADLINE
+        self.last_solver_nodes = 0
+        self.last_deadline_hit = False  # Last puzzle was cut short by the deadline
+        self.last_missed_difficulty: Optional[str] = None  # Requested band the last puzzle missed
     
-    def generate_payload(self, date_str: str) -> Dict[str, Any]:
+    def generate_payload(
+        self,
+        date_str: str,
+        difficulty: Optional[str] = None,
+        rng: Optional[random.Random] = None,
+        deadline: Optional[Deadline] = None
+    ) -> Dict[str, Any]:
         """
-        Generate a valid 6×6 Sudoku puzzle.
+        Generate a valid Sudoku puzzle.
         
         Args:
-            date_str: Date string (used for seeding randomness for variety)
+            date_str: Date string
+            difficulty: "medium", "hard" or "expert"; random if None
+            rng: Seeded random source for a reproducible puzzle; self.rng if None
+            deadline: Request deadline; once it expires the best valid puzzle
+                so far is returned (see last_deadline_hit). self.deadline if None
             
         Returns:
-            Dictionary matching Sudoku6x6Payload schema:
+            Dictionary matching Sudoku6x6Payload schema (shown for 6×6):
             {
                 "size": 6,
                 "blockRows": 2,
                 "blockCols": 3,
-                "initialBoard": [[...]], # 6×6 with 0 for empty
-                "solutionBoard": [[...]], # 6×6 complete solution
-                "difficulty": "medium" | "hard" | "expert"
+                "initialBoard": [[...]], # size×size with 0 for empty
+                "solutionBoard": [[...]], # size×size complete solution
+                "difficulty": "medium" | "hard" | "expert",
+                "difficultyScore": 42 # SudokuGrader score
             }
+            "difficulty" is the band the score falls in; if no attempt
+            reached the requested band it names an easier one, and
+            last_missed_difficulty holds the requested one.
         """
-        # Use system time for true randomness - each generation will be different
-        # This ensures variety: different puzzles, different zero positions, different visible numbers
-        
-        # Randomly select difficulty
-        difficulty = random.choice(["medium", "hard", "expert"])
-        
-        # Generate solution board
-        solution_board = self._generate_solution_board()
-        
-        # Generate puzzle with unique solution
-        initial_board = self._generate_puzzle_with_unique_solution(solution_board, difficulty)
+        if rng is not None or deadline is not None:
+            # Draw everything for this puzzle from the caller's rng, within the caller's deadline
+            saved_rng, saved_deadline = self.rng, self.deadline
+            self.rng, self.deadline = rng or self.rng, deadline or self.deadline
+            try:
+                return self.generate_payload(date_str, difficulty)
+            finally:
+                self.rng, self.deadline = saved_rng, saved_deadline
+        
+        # Randomly select difficulty unless one was requested
+        if difficulty is None:
+            difficulty = self.rng.choice(["medium", "hard", "expert"])
+        
+        # Generate solution and puzzle graded into the difficulty band
+        solution_board, initial_board, score = self._generate_graded_puzzle(difficulty)
+        graded = self._difficulty_for_score(score)
+        self.last_missed_difficulty = difficulty if graded != difficulty else None
         
         return {
             "size": self.size,
@@ -50,221 +101,118 @@ class SudokuGenerator:
             "blockCols": self.block_cols,
             "initialBoard": initial_board,
             "solutionBoard": solution_board,
-            "difficulty": difficulty
+            "difficulty": graded,
+            "difficultyScore": score
         }
     
     def _generate_solution_board(self) -> List[List[int]]:
-        """Generate a valid complete 6×6 Sudoku solution using backtracking"""
-        board = [[0] * self.size for _ in range(self.size)]
-        
-        # Create shuffled list of all positions for random traversal
-        positions = [(r, c) for r in range(self.size) for c in range(self.size)]
-        random.shuffle(positions)
-        
-        # Create shuffled list of numbers for each position
-        number_order = self.numbers.copy()
-        random.shuffle(number_order)
-        
-        def is_valid(row: int, col: int, num: int) -> bool:
-            """Check if placing num at (row, col) is valid"""
-            # Check row
-            if num in board[row]:
-                return False
-            
-            # Check column
-            if num in [board[r][col] for r in range(self.size)]:
-                return False
-            
-            # Check 2×3 block
-            block_row_start = (row // self.block_rows) * self.block_rows
-            block_col_start = (col // self.block_cols) * self.block_cols
-            
-            for r in range(block_row_start, block_row_start + self.block_rows):
-                for c in range(block_col_start, block_col_start + self.block_cols):
-                    if board[r][c] == num:
-                        return False
-            
-            return True
-        
-        def solve_backtrack(pos_index: int) -> bool:
-            """Backtracking solver to fill the board"""
-            if pos_index >= len(positions):
-                return True
-            
-            row, col = positions[pos_index]
-            
-            # Try numbers in random order
-            nums = self.numbers.copy()
-            random.shuffle(nums)
-            
-            for num in nums:
-                if is_valid(row, col, num):
-                    board[row][col] = num
-                    if solve_backtrack(pos_index + 1):
-                        return True
-                    board[row][col] = 0
-            
-            return False
+        """
+        Generate a valid complete Sudoku solution.
         
-        # Generate solution
-        solve_backtrack(0)
-        return board
+        6×6 boards are drawn uniformly from the grid catalog in constant time;
+        other sizes fall back to randomized search with the solver backend.
+        """
+        if self.grid_sampler is not None:
+            return self.grid_sampler.sample(self.rng)
+        return self.solver.fill_random(self.rng)
     
-    def _solve_and_count_solutions(self, board: List[List[int]], max_solutions: int = 2) -> Tuple[int, int]:
+    def _generate_graded_puzzle(self, difficulty: str) -> Tuple[List[List[int]], List[List[int]], int]:
         """
-        Solve the puzzle and count solutions, tracking maximum backtracking depth.
+        Generate a puzzle whose human-technique score falls in the difficulty band.
+        
+        Each attempt builds a fresh solution and removes clues under grader
+        control. If no attempt lands in the band, or self.deadline expires,
+        the closest puzzle found (highest score not above the band) is
+        returned.
         
         Returns:
-            (solution_count, max_backtrack_depth)
-            max_backtrack_depth: maximum depth reached during solving (0 = pure logic, >0 = branching)
+            (solution_board, initial_board, score)
         """
-        solution_count = 0
-        max_depth = 0
-        
-        def is_valid(row: int, col: int, num: int, board_state: List[List[int]]) -> bool:
-            """Check if placing num at (row, col) is valid"""
-            # Check row
-            if num in board_state[row]:
-                return False
-            
-            # Check column
-            if num in [board_state[r][col] for r in range(self.size)]:
-                return False
-            
-            # Check 2×3 block
-            block_row_start = (row // self.block_rows) * self.block_rows
-            block_col_start = (col // self.block_cols) * self.block_cols
-            
-            for r in range(block_row_start, block_row_start + self.block_rows):
-                for c in range(block_col_start, block_col_start + self.block_cols):
-                    if board_state[r][c] == num:
-                        return False
-            
-            return True
-        
-        def count_solutions_backtrack(board_state: List[List[int]], depth: int) -> None:
-            """Recursive backtracking to count solutions"""
-            nonlocal solution_count, max_depth
-            
-            max_depth = max(max_depth, depth)
-            
-            # Find first empty cell
-            empty_pos = None
-            for r in range(self.size):
-                for c in range(self.size):
-                    if board_state[r][c] == 0:
-                        empty_pos = (r, c)
-                        break
-                if empty_pos:
-                    break
-            
-            if empty_pos is None:
-                # Board is complete - found a solution
-                solution_count += 1
-                return
-            
-            row, col = empty_pos
-            
-            # Try all valid numbers
-            for num in self.numbers:
-                if solution_count >= max_solutions:
-                    return  # Early exit if we found multiple solutions
-                
-                if is_valid(row, col, num, board_state):
-                    board_state[row][col] = num
-                    count_solutions_backtrack(board_state, depth + 1)
-                    board_state[row][col] = 0
-        
-        # Create copy of board to avoid modifying original
-        board_copy = [row[:] for row in board]
-        count_solutions_backtrack(board_copy, 0)
+        band_min, band_max = self._difficulty_band(difficulty)
+        best = None
+        self.last_solver_nodes = 0
+        self.last_deadline_hit = False
+        
+        for _ in range(self.max_band_attempts):
+            if best is not None and self.deadline.expired():
+                self.last_deadline_hit = True
+                break
+            solution_board = self._generate_solution_board()
+            initial_board, score = self._generate_puzzle_with_unique_solution(
+                solution_board, band_min, band_max
+            )
+            if best is None or score > best[2]:
+                best = (solution_board, initial_board, score)
+            if score >= band_min:
+                break
         
-        return solution_count, max_depth
+        return best
+    
+    def _difficulty_band(self, difficulty: str) -> Tuple[int, int]:
+        """Score band for a difficulty, scaled by board area from the 6×6 values"""
+        band_min, band_max = DIFFICULTY_BANDS.get(difficulty, DIFFICULTY_BANDS["medium"])
+        cells = self.size * self.size
+        return band_min * cells // 36, band_max * cells // 36
+    
+    def _difficulty_for_score(self, score: int) -> str:
+        """Difficulty whose band holds the score (medium for scores below every band)"""
+        for difficulty in reversed(DIFFICULTY_BANDS):
+            if score >= self._difficulty_band(difficulty)[0]:
+                return difficulty
+        return "medium"
     
     def _generate_puzzle_with_unique_solution(
         self, 
         solution_board: List[List[int]], 
-        difficulty: str
-    ) -> List[List[int]]:
+        band_min: int,
+        band_max: int
+    ) -> Tuple[List[List[int]], int]:
         """
         Generate initial board by removing numbers, ensuring unique solution.
         
-        Difficulty levels based on solver backtracking depth:
-        - Medium: depth = 1 (limited branching)
-        - Hard: depth > 1 (deep branching)
-        - Expert: depth > 2 (extensive branching, minimal givens)
-        """
-        # Start with complete solution
-        initial_board = [row[:] for row in solution_board]
+        Removal is incremental: the solver keeps its candidate masks between
+        attempts and only checks whether the removed cell could take another
+        value, so the board is never copied or re-solved from scratch.
+        Every accepted removal is graded; removals that push the score past
+        band_max (or beyond what the techniques can solve) are reverted, and
+        removal stops once the score reaches band_min or, with at most
+        max_givens left, self.deadline expires (the board so far is still
+        unique, just easier).
+        Solver nodes used are added to self.last_solver_nodes.
         
-        # Create shuffled list of all positions for random removal order
-        positions = [(r, c) for r in range(self.size) for c in range(self.size)]
-        random.shuffle(positions)
-        
-        # Target givens based on difficulty (approximate ranges)
-        difficulty_targets = {
-            "medium": (18, 22),    # Moderate givens
-            "hard": (12, 16),      # Fewer givens = harder
-            "expert": (8, 12)      # Very few givens = expert
-        }
-        min_givens, max_givens = difficulty_targets.get(difficulty, (18, 22))
-        target_givens = random.randint(min_givens, max_givens)
+        Returns:
+            (initial_board, score)
+        """
+        self.remover.reset(solution_board)
         
-        # Track what we've tried to remove
-        removal_order = positions.copy()
-        random.shuffle(removal_order)
+        # Shuffled list of all positions for random removal order
+        removal_order = [(r, c) for r in range(self.size) for c in range(self.size)]
+        self.rng.shuffle(removal_order)
         
-        attempts = 0
-        max_attempts = 200  # Safety limit
+        # Stay within the givens the validator accepts
+        min_givens = 12 * self.size * self.size // 36
+        max_givens = 28 * self.size * self.size // 36
+        score = 0
         
         for row, col in removal_order:
-            if attempts >= max_attempts:
+            if self.remover.givens <= min_givens:
+                break
+            if self.remover.givens <= max_givens and self.deadline.expired():
+                self.last_deadline_hit = True
                 break
             
-            # Skip if already empty
-            if initial_board[row][col] == 0:
+            # Keeps the removal only if the solution stays unique
+            if not self.remover.try_remove(row, col):
                 continue
             
-            # Check current givens count
-            current_givens = sum(1 for r in range(self.size) for c in range(self.size) if initial_board[r][c] != 0)
+            new_score, _, solved = self.grader.grade(self.remover.board)
+            if not solved or new_score > band_max:
+                self.remover.restore(row, col)
+                continue
             
-            # Stop if we've reached or gone below target minimum
-            if current_givens <= min_givens:
+            score = new_score
+            if score >= band_min:
                 break
-            
-            # Try removing this cell
-            original_value = initial_board[row][col]
-            initial_board[row][col] = 0
-            
-            # Count solutions with backtracking depth tracking
-            solution_count, max_depth = self._solve_and_count_solutions(initial_board, max_solutions=2)
-            
-            # Check if puzzle still has unique solution
-            if solution_count == 1:
-                # Successfully removed - check if we should continue
-                current_givens_after = sum(1 for r in range(self.size) for c in range(self.size) if initial_board[r][c] != 0)
-                
-                # If we're still above target, continue
-                # If we're at or below target, we're done
-                if current_givens_after <= min_givens:
-                    break
-            else:
-                # Multiple solutions or no solution - revert removal
-                initial_board[row][col] = original_value
-            
-            attempts += 1
-        
-        # Final verification
-        solution_count, max_depth = self._solve_and_count_solutions(initial_board, max_solutions=2)
-        
-        if solution_count != 1:
-            # If we somehow ended up with non-unique solution, restore some cells
-            # This should rarely happen, but provide safety fallback
-            for row, col in removal_order[:5]:
-                if initial_board[row][col] == 0:
-                    initial_board[row][col] = solution_board[row][col]
-                    solution_count, _ = self._solve_and_count_solutions(initial_board, max_solutions=2)
-                    if solution_count == 1:
-                        break
         
-        return initial_board
+        self.last_solver_nodes += self.remover.nodes
+        return [row[:] for row in self.remover.board], score
@@ -0,0 +1,217 @@
+"""Bitmask constraint-propagation solver for rectangular-block Sudoku boards"""
+import random
+from typing import List, Optional
+
+from .dlx_solver import DancingLinksSolver
+
+# Boards at least this large are solved with Dancing Links (see
+# benchmarks/sudoku_size_scaling.py: bitmask search wins up to 10×10)
+DLX_MIN_SIZE = 12
+
+
+def create_solver(size: int = 6, block_rows: int = 2, block_cols: int = 3):
+    """Pick the solver backend for a board size (bitmask for small, DLX for large)"""
+    if size >= DLX_MIN_SIZE:
+        return DancingLinksSolver(size, block_rows, block_cols)
+    return SudokuSolver(size, block_rows, block_cols)
+
+
+class SudokuSolver:
+    """
+    Reusable Sudoku solver backed by row/column/block candidate bitmasks.
+
+    Digit d is represented by bit (d - 1). Every search node propagates naked
+    singles first and then branches on the empty cell with the fewest
+    candidates, so uniqueness checks rarely need more than a handful of nodes.
+    """
+
+    def __init__(self, size: int = 6, block_rows: int = 2, block_cols: int = 3):
+        self.size = size
+        self.block_rows = block_rows
+        self.block_cols = block_cols
+        self.cell_count = size * size
+        self.full_mask = (1 << size) - 1
+
+        # (row, col, block) for every flat cell index
+        blocks_per_row = size // block_cols
+        self._cells = [
+            (r, c, (r // block_rows) * blocks_per_row + c // block_cols)
+            for r in range(size)
+            for c in range(size)
+        ]
+        self._popcount = [bin(mask).count("1") for mask in range(1 << size)]
+
+        self.grid = [0] * self.cell_count
+        self.row_used = [0] * size
+        self.col_used = [0] * size
+        self.block_used = [0] * size
+
+        # Statistics for the most recent search
+        self.nodes = 0
+        self.max_depth = 0
+        self.solution: Optional[List[int]] = None
+
+    def load(self, board: List[List[int]]) -> bool:
+        """
+        Reset the solver state to the givens of board.
+
+        Returns:
+            False if two givens conflict with each other
+        """
+        size = self.size
+        self.grid = [0] * self.cell_count
+        self.row_used = [0] * size
+        self.col_used = [0] * size
+        self.block_used = [0] * size
+
+        for r in range(size):
+            for c in range(size):
+                value = board[r][c]
+                if value:
+                    if not self._candidates(r * size + c) & (1 << (value - 1)):
+                        return False
+                    self._place(r * size + c, 1 << (value - 1))
+        return True
+
+    def count_solutions(self, board: List[List[int]], limit: int = 2) -> int:
+        """
+        Count solutions of board, stopping as soon as limit is reached.
+
+        The first solution found is kept in self.solution (flat list).
+        """
+        self.nodes = 0
+        self.max_depth = 0
+        self.solution = None
+        if not self.load(board):
+            return 0
+        return self._search(limit, None, 0)
+
+    def fill_random(self, rng: random.Random) -> List[List[int]]:
+        """Generate a random complete board using rng for candidate ordering"""
+        self.nodes = 0
+        self.max_depth = 0
+        self.solution = None
+        self.load([[0] * self.size for _ in range(self.size)])
+        self._search(1, rng, 0)
+        return self.to_board(self.solution)
+
+    def place(self, row: int, col: int, value: int) -> None:
+        """Set a given on the loaded board, updating the candidate masks"""
+        self._place(row * self.size + col, 1 << (value - 1))
+
+    def clear(self, row: int, col: int) -> None:
+        """Remove a given from the loaded board, updating the candidate masks"""
+        self._clear(row * self.size + col)
+
+    def has_alternative(self, row: int, col: int, value: int) -> bool:
+        """
+        Check whether the loaded board has a solution with (row, col) != value.
+
+        The cell must already be cleared. If the board minus this cell was
+        uniquely solvable with value at (row, col), a False result means the
+        board is still uniquely solvable, so only the removed cell needs to be
+        searched instead of re-counting every solution from scratch.
+        Node counts accumulate in self.nodes across calls.
+        """
+        idx = row * self.size + col
+        mask = self._candidates(idx) & ~(1 << (value - 1))
+        while mask:
+            bit = mask & -mask
+            mask ^= bit
+            self._place(idx, bit)
+            found = self._search(1, None, 0)
+            self._clear(idx)
+            if found:
+                return True
+        return False
+
+    def to_board(self, flat: List[int]) -> List[List[int]]:
+        """Convert a flat cell list into a list of rows"""
+        size = self.size
+        return [flat[r * size:(r + 1) * size] for r in range(size)]
+
+    def _candidates(self, idx: int) -> int:
+        r, c, b = self._cells[idx]
+        return self.full_mask & ~(self.row_used[r] | self.col_used[c] | self.block_used[b])
+
+    def _place(self, idx: int, bit: int) -> None:
+        r, c, b = self._cells[idx]
+        self.grid[idx] = bit.bit_length()
+        self.row_used[r] |= bit
+        self.col_used[c] |= bit
+        self.block_used[b] |= bit
+
+    def _clear(self, idx: int) -> None:
+        r, c, b = self._cells[idx]
+        bit = 1 << (self.grid[idx] - 1)
+        self.grid[idx] = 0
+        self.row_used[r] &= ~bit
+        self.col_used[c] &= ~bit
+        self.block_used[b] &= ~bit
+
+    def _search(self, limit: int, rng: Optional[random.Random], depth: int) -> int:
+        """Propagate naked singles, then branch on the most constrained cell"""
+        self.nodes += 1
+        if depth > self.max_depth:
+            self.max_depth = depth
+
+        grid = self.grid
+        cells = self._cells
+        row_used, col_used, block_used = self.row_used, self.col_used, self.block_used
+        full_mask = self.full_mask
+        popcount = self._popcount
+        trail = []
+
+        while True:
+            best_idx = -1
+            best_mask = 0
+            best_count = self.size + 1
+            placed_single = False
+
+            for idx in range(self.cell_count):
+                if grid[idx]:
+                    continue
+                r, c, b = cells[idx]
+                mask = full_mask & ~(row_used[r] | col_used[c] | block_used[b])
+                if not mask:
+                    # Dead end - undo propagated singles
+                    for placed in reversed(trail):
+                        self._clear(placed)
+                    return 0
+                count = popcount[mask]
+                if count == 1:
+                    self._place(idx, mask)
+                    trail.append(idx)
+                    placed_single = True
+                elif count < best_count:
+                    best_idx, best_mask, best_count = idx, mask, count
+
+            if not placed_single:
+                break
+
+        if best_idx < 0:
+            # Board complete
+            if self.solution is None:
+                self.solution = grid[:]
+            found = 1
+        else:
+            bits = []
+            mask = best_mask
+            while mask:
+                bit = mask & -mask
+                bits.append(bit)
+                mask ^= bit
+            if rng is not None:
+                rng.shuffle(bits)
+
+            found = 0
+            for bit in bits:
+                self._place(best_idx, bit)
+                found += self._search(limit - found, rng, depth + 1)
+                self._clear(best_idx)
+                if found >= limit:
+                    break
+
+        for placed in reversed(trail):
+            self._clear(placed)
+        return found
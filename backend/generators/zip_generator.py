@@ -1,28 +1,94 @@
-"""ZIP puzzle generator - connect numbered dots on 6x6 grid"""
+"""ZIP puzzle generator - connect numbered dots on a rectangular grid (6x6 by default)"""
 import random
 import time
+from collections import Counter
 from typing import Dict, Any, List, Tuple, Set, Optional
 
+from .backbite import BackbitePathSampler
+from .deadline import NO_DEADLINE, Deadline
+from .hamiltonian import HamiltonianPathSearch
+from .path_library import HamiltonianPathLibrary
+from .zip_grader import ZipGrader
+from .zip_solver import SolverBudgetExceeded, ZipSolver
+
+# ZipGrader score bands for 6×6 grids (scaled by area for other sizes)
+DIFFICULTY_BANDS = {
+    "medium": (30, 80),      # Mostly forced moves, a few shallow guesses
+    "hard": (81, 250),       # Several branch points needing some search
+    "expert": (251, 100000)  # Deep refutations between sparse dots
+}
+
+# Grids with at least this many cells draw paths from the backbite chain;
+# smaller ones use exact search, which is faster there and just as varied
+BACKBITE_MIN_CELLS = 49
+
 
 class ZipGenerator:
     """Generates ZIP puzzles - connect the dots with a continuous path"""
     
-    def __init__(self, openai_client=None):
+    def __init__(self, openai_client=None, rows: int = 6, cols: Optional[int] = None):
         # openai_client parameter kept for API compatibility but not used
-        self.size = 6
+        self.rows = rows
+        self.cols = cols if cols is not None else rows
+        self.cells = self.rows * self.cols
         self.min_dots = 4  # Increased from 2 - harder
-        self.max_dots = 16  # Decreased from 16 - harder with fewer dots
-        self.wall_probability = 0.7  # 70% chance to add walls
+        self.max_dots = 16 * self.cells // 36  # 16 on 6x6, scales with area
+        self.max_walls = 12
+        self.walls_per_removal = 2  # Walls that may replace one removed dot
+        self.optimize_timeout = 1.0  # Seconds for clue optimization
+        self.rng = random.Random()
+        self.path_search = HamiltonianPathSearch(self.rows, self.cols)
+        self.path_library = (
+            HamiltonianPathLibrary() if HamiltonianPathLibrary.supports(self.rows, self.cols) else None
+        )
+        self.path_sampler = (
+            BackbitePathSampler(self.rows, self.cols) if self.cells >= BACKBITE_MIN_CELLS else None
+        )
+        self.path_timeout = 3.0  # Seconds before falling back to the snake pattern
+        self.max_path_nodes = 20000  # Search nodes per start position
+        self.max_solver_nodes = 10000  # Per uniqueness check; undecided checks count as failed
+        self.solver = ZipSolver(self.rows, self.cols, max_nodes=self.max_solver_nodes)
+        self.grader = ZipGrader(self.rows, self.cols, max_nodes=self.max_solver_nodes)
+        self.max_unique_attempts = 5  # Fresh paths tried for a unique puzzle
+        self.max_band_attempts = 8  # Unique puzzles tried for the difficulty band
+        # Solver nodes per puzzle before settling for the closest one found.
+        # Nodes cost more on bigger grids, so the budget shrinks with area
+        # (50,000 on 6x6, above what 6x6 puzzles use; 18,000 on 10x10).
+        # Unlike the timeouts it does not depend on machine speed, so a
+        # seed still reproduces the puzzle
+        self.max_puzzle_nodes = 1_800_000 // self.cells
+        self.deadline = NO_DEADLINE  # Caps path_timeout and optimize_timeout
+        self.last_solver_nodes = 0
+        self.last_deadline_hit = False  # Last puzzle was cut short by the deadline
+        # A time limit (path_timeout, optimize_timeout or the deadline) stopped
+        # work on the last puzzle, so its rng seed alone does not reproduce it
+        self.last_timed_out = False
+        self.last_grade: Dict[str, int] = {}
+        self.last_missed_difficulty: Optional[str] = None  # Requested band the last puzzle missed
+        # Where the last puzzle's candidate paths came from (zipPathLibrary,
+        # zipPathBackbite, zipPathSearch or hamiltonianFallbacks)
+        self.last_path_sources: Counter = Counter()
     
-    def generate_payload(self, date_str: str) -> Dict[str, Any]:
+    def generate_payload(
+        self,
+        date_str: str,
+        difficulty: Optional[str] = None,
+        rng: Optional[random.Random] = None,
+        deadline: Optional[Deadline] = None
+    ) -> Dict[str, Any]:
         """
         Generate a valid ZIP puzzle.
         
         Args:
-            date_str: Date string (used for seeding randomness for variety)
+            date_str: Date string
+            difficulty: "medium", "hard" or "expert"; random if None
+            rng: Seeded random source for a reproducible puzzle; self.rng if None
+            deadline: Request deadline; once it expires the best valid puzzle
+                so far is returned (see last_deadline_hit). self.deadline if None
             
         Returns:
-            Dictionary matching ZipPayload schema:
+            Dictionary matching ZipPayload schema (square grids have
+            "size", other grids "rows" and "cols" instead):
             {
                 "size": 6,
                 "dots": [
@@ -34,260 +100,418 @@ class ZipGenerator:
                     {"row": 0, "col": 0},
                     {"row": 0, "col": 1},
                     ...
-                ]
+                ],
+                "difficulty": "medium" | "hard" | "expert",
+                "difficultyScore": 42 # ZipGrader score
             }
+            "difficulty" is the band the score falls in; if no attempt
+            reached the requested band it names another one, and
+            last_missed_difficulty holds the requested one.
         """
-        # Randomly select number of dots (between min and max)
-        num_dots = random.randint(self.min_dots, self.max_dots)
+        if rng is not None or deadline is not None:
+            # Draw everything for this puzzle from the caller's rng, within the caller's deadline
+            saved_rng, saved_deadline = self.rng, self.deadline
+            self.rng, self.deadline = rng or self.rng, deadline or self.deadline
+            try:
+                return self.generate_payload(date_str, difficulty)
+            finally:
+                self.rng, self.deadline = saved_rng, saved_deadline
         
-        # Generate valid dot placements and solution path
-        dots, solution_path = self._generate_valid_zip_puzzle(num_dots)
+        # Randomly select difficulty unless one was requested
+        if difficulty is None:
+            difficulty = self.rng.choice(["medium", "hard", "expert"])
         
-        # Maybe add walls (70% chance)
-        walls = []
-        if random.random() < self.wall_probability:
-            walls = self._generate_walls(solution_path)
+        dots, walls, solution_path, score = self._generate_graded_puzzle(difficulty)
         
         # Convert solution path to serializable format
         solution = [{"row": pos[0], "col": pos[1]} for pos in solution_path]
         
-        payload = {
-            "size": self.size,
+        if self.rows == self.cols:
+            payload = {"size": self.rows}
+        else:
+            payload = {"rows": self.rows, "cols": self.cols}
+        payload.update({
             "dots": dots,
             "solution": solution
-        }
+        })
         
         # Only add walls if we generated any
         if walls:
             payload["walls"] = walls
         
+        graded = self._difficulty_for_score(score)
+        self.last_missed_difficulty = difficulty if graded != difficulty else None
+        payload["difficulty"] = graded
+        payload["difficultyScore"] = score
         return payload
     
+    def _generate_graded_puzzle(
+        self,
+        difficulty: str
+    ) -> Tuple[List[Dict[str, int]], List[Dict[str, Any]], List[Tuple[int, int]], int]:
+        """
+        Generate a unique puzzle whose ZipGrader score falls in the difficulty band.
+        
+        Each attempt draws a fresh path and removes clues under grader
+        control. If no attempt lands in the band, or self.deadline expires
+        or max_puzzle_nodes are used, the closest puzzle found is returned. Only puzzles the solver proved
+        unique and the grader scored are candidates. Solver nodes used are
+        added to self.last_solver_nodes, path sources are counted in
+        self.last_path_sources and the grader stats of the result are kept
+        in self.last_grade.
+        
+        Returns:
+            (dots, walls, solution_path, score)
+        
+        Raises:
+            ValueError: If no attempt produced a unique, graded puzzle
+        """
+        band_min, band_max = self._difficulty_band(difficulty)
+        best = None
+        self.last_solver_nodes = 0
+        self.last_deadline_hit = False
+        self.last_timed_out = False
+        self.last_path_sources = Counter()
+        
+        for _ in range(self.max_band_attempts):
+            if best is not None and self.deadline.expired():
+                self.last_deadline_hit = True
+                break
+            if best is not None and self.last_solver_nodes >= self.max_puzzle_nodes:
+                break
+            unique = self._generate_unique_puzzle()
+            if unique is None:
+                continue
+            dots, solution_path = unique
+            
+            # Trade dots for walls while the puzzle stays unique and in band
+            optimized = self._optimize_clues(solution_path, dots, band_min, band_max)
+            if optimized is None:
+                continue
+            dots, walls, score, stats = optimized
+            distance = max(band_min - score, score - band_max, 0)
+            if best is None or distance < best[0]:
+                best = (distance, dots, walls, solution_path, score, stats)
+            if distance == 0:
+                break
+        
+        if best is None:
+            raise ValueError(f"No unique ZIP puzzle after {self.max_band_attempts} attempts")
+        _, dots, walls, solution_path, score, self.last_grade = best
+        return dots, walls, solution_path, score
+    
+    def _difficulty_band(self, difficulty: str) -> Tuple[int, int]:
+        """Score band for a difficulty, scaled by grid area from the 6×6 values"""
+        band_min, band_max = DIFFICULTY_BANDS.get(difficulty, DIFFICULTY_BANDS["medium"])
+        return band_min * self.cells // 36, band_max * self.cells // 36
+    
+    def _difficulty_for_score(self, score: int) -> str:
+        """Difficulty whose band holds the score (medium for scores below every band)"""
+        for difficulty in reversed(DIFFICULTY_BANDS):
+            if score >= self._difficulty_band(difficulty)[0]:
+                return difficulty
+        return "medium"
+    
+    def _generate_unique_puzzle(self) -> Optional[Tuple[List[Dict[str, int]], List[Tuple[int, int]]]]:
+        """
+        Draw a solution path and dot it until the path is the only solution.
+        
+        Returns: (dots, solution_path), or None if no path drawn within
+            max_unique_attempts (or before self.deadline) could be made unique
+        """
+        for attempt in range(self.max_unique_attempts):
+            if attempt > 0 and self.deadline.expired():
+                self.last_deadline_hit = True
+                break
+            
+            # Generate a solution path with a few evenly spaced dots
+            dots, solution_path = self._generate_valid_zip_puzzle(self.min_dots)
+            
+            # Add dots until the intended path is the only solution
+            unique_dots = self._make_unique(solution_path, dots, [])
+            if unique_dots is not None:
+                return unique_dots, solution_path
+            print(f"   Path has alternate solutions even with {self.max_dots} dots, trying another")
+        return None
+    
     def _generate_valid_zip_puzzle(self, num_dots: int) -> Tuple[List[Dict[str, int]], List[Tuple[int, int]]]:
         """
-        Generate dots that can be connected by a path that fills all 36 cells.
+        Generate dots that can be connected by a path that fills every cell.
         
         Returns: (dots, solution_path)
         
         Strategy: Time-boxed Hamiltonian path with safe fallback
-        - Tries to find interesting Hamiltonian paths (3 second limit)
+        - 6x6 grids draw a path from the precomputed path library
+        - Large grids draw a random path from the backbite chain
+        - Others try to find interesting Hamiltonian paths (path_timeout limit)
         - Falls back to snake pattern if timeout
         - Best of both worlds: variety + reliability
         """
-        # Try Hamiltonian with timeout
-        start_time = time.time()
-        timeout = 3.0  # 3 second limit
+        if self.path_library is not None:
+            cells = self.path_library.sample(self.rng)
+            path = [divmod(cell, self.cols) for cell in cells]
+            self.last_path_sources["zipPathLibrary"] += 1
+            print(f"   ✅ Drew Hamiltonian path from library ({self.path_library.count} × 16 paths)")
+            return self._dots_at(self._select_dot_positions(path, num_dots)), path
+        
+        if self.path_sampler is not None:
+            cells = self.path_sampler.sample(self.rng)
+            path = [divmod(cell, self.cols) for cell in cells]
+            self.last_path_sources["zipPathBackbite"] += 1
+            print(f"   ✅ Sampled Hamiltonian path ({self.path_sampler.moves_per_cell * self.cells} backbite moves)")
+            return self._dots_at(self._select_dot_positions(path, num_dots)), path
+        
+        # Try Hamiltonian with timeout (never past the request deadline)
+        deadline = min(time.perf_counter() + self.path_timeout, self.deadline.at)
         max_attempts = 15  # Try multiple starting positions
         
         for attempt in range(max_attempts):
             # Check timeout
-            if time.time() - start_time > timeout:
+            if time.perf_counter() > deadline:
                 print(f"   Hamiltonian timeout after {attempt} attempts, using fallback")
                 break
             
             # Try to generate Hamiltonian path
-            path = self._try_hamiltonian_path(start_time, timeout)
+            path = self._try_hamiltonian_path(deadline)
             
-            if path and len(path) == 36:
+            if path and len(path) == self.cells:
+                self.last_path_sources["zipPathSearch"] += 1
                 print(f"   ✅ Found Hamiltonian path on attempt {attempt + 1}")
                 # Select dot positions along the path
-                dot_positions = self._select_dot_positions(path, num_dots)
-                
-                # Convert to dot format
-                dots = []
-                for i, pos in enumerate(dot_positions):
-                    dots.append({
-                        "row": pos[0],
-                        "col": pos[1],
-                        "index": i + 1
-                    })
-                
-                return dots, path
+                return self._dots_at(self._select_dot_positions(path, num_dots)), path
         
         # Fallback to snake pattern (guaranteed to work)
+        self.last_path_sources["hamiltonianFallbacks"] += 1
+        if time.perf_counter() > deadline:
+            self.last_timed_out = True
+        if self.deadline.expired():
+            self.last_deadline_hit = True
         print("   Using snake pattern fallback")
         return self._generate_snake_dots(num_dots), self._generate_snake_path()
     
-    def _try_hamiltonian_path(self, start_time: float, timeout: float) -> Optional[List[Tuple[int, int]]]:
+    def _try_hamiltonian_path(self, deadline: float) -> Optional[List[Tuple[int, int]]]:
         """
-        Try to find a Hamiltonian path with timeout protection.
-        Uses Warnsdorff's heuristic for faster search.
+        Try to find a Hamiltonian path from a random corner or edge cell.
+        
+        Uses the bitboard search (Warnsdorff order with parity, dead-end and
+        connectivity pruning). Each attempt has a node budget, so a seeded
+        rng gives the same path on any machine unless the deadline hits.
         """
         # Random starting position (corners and edges work best)
+        last_row, last_col = self.rows - 1, self.cols - 1
         start_positions = [
-            (0, 0), (0, 5), (5, 0), (5, 5),  # corners
-            (0, 2), (0, 3),                   # top edge
-            (5, 2), (5, 3),                   # bottom edge
-            (2, 0), (3, 0),                   # left edge
-            (2, 5), (3, 5)                    # right edge
+            (row, col)
+            for row in range(self.rows) for col in range(self.cols)
+            if row in (0, last_row) or col in (0, last_col)
+            if self.path_search.can_start(row * self.cols + col)
         ]
         
-        start_pos = random.choice(start_positions)
-        path = [start_pos]
-        visited = {start_pos}
-        
-        # Use backtracking with Warnsdorff's heuristic
-        if self._hamiltonian_backtrack(path, visited, start_time, timeout):
-            return path
-        
-        return None
+        start_row, start_col = self.rng.choice(start_positions)
+        cells = self.path_search.find_path(
+            start_row * self.cols + start_col,
+            self.rng,
+            deadline=deadline,
+            max_nodes=self.max_path_nodes
+        )
+        if cells is None:
+            return None
+        return [divmod(cell, self.cols) for cell in cells]
     
-    def _hamiltonian_backtrack(
-        self, 
-        path: List[Tuple[int, int]], 
-        visited: Set[Tuple[int, int]],
-        start_time: float,
-        timeout: float
-    ) -> bool:
+    def _make_unique(
+        self,
+        path: List[Tuple[int, int]],
+        dots: List[Dict[str, int]],
+        walls: List[Dict[str, Any]]
+    ) -> Optional[List[Dict[str, int]]]:
         """
-        Backtracking algorithm with Warnsdorff's heuristic and timeout.
+        Add dots along the path until it is the only solution.
+        
+        Each round asks the solver for an alternate solution and adds a dot
+        that rules it out: a cell the alternate visits between a different
+        pair of dots, or else the two cells where it first leaves the path
+        (the alternate visits them in the opposite order). If the solver
+        runs out of budget, the longest stretches between dots are split.
+        
+        Returns:
+            Dots of a unique puzzle, or None if max_dots is not enough
         """
-        # Check timeout
-        if time.time() - start_time > timeout:
-            return False
-        
-        # Success: visited all cells
-        if len(path) == 36:
-            return True
-        
-        current = path[-1]
-        
-        # Get neighbors and sort by Warnsdorff's rule
-        # (visit cells with fewer unvisited neighbors first)
-        neighbors = self._get_adjacent_cells(current[0], current[1])
-        
-        # Filter unvisited and score by accessibility
-        candidates = []
-        for neighbor in neighbors:
-            if neighbor not in visited:
-                # Count unvisited neighbors of this neighbor
-                next_neighbors = self._get_adjacent_cells(neighbor[0], neighbor[1])
-                accessibility = sum(1 for n in next_neighbors if n not in visited)
-                candidates.append((accessibility, neighbor))
-        
-        # Sort by accessibility (lower is better - visit "harder" cells first)
-        candidates.sort(key=lambda x: (x[0], random.random()))
-        
-        # Try each candidate
-        for _, neighbor in candidates:
-            path.append(neighbor)
-            visited.add(neighbor)
+        order = {cell: i for i, cell in enumerate(path)}
+        dot_steps = sorted(order[(dot["row"], dot["col"])] for dot in dots)
+        
+        while True:
+            positions = [path[i] for i in dot_steps]
+            self.solver.load(positions, walls)
+            decided, alternate = self._find_alternate(path)
+            if decided and alternate is None:
+                return self._dots_at(positions)
             
-            if self._hamiltonian_backtrack(path, visited, start_time, timeout):
-                return True
-            
-            # Backtrack
-            path.pop()
-            visited.remove(neighbor)
-        
-        return False
+            if decided:
+                new_steps = self._separating_steps(path, alternate, set(positions), order)
+            else:
+                # Too open to decide within budget: split the longest gaps between dots
+                gaps = [(b - a, a) for a, b in zip(dot_steps, dot_steps[1:])]
+                longest = max(gaps)[0]
+                new_steps = [start + gap // 2 for gap, start in gaps if gap * 2 > longest and gap > 1]
+            if not new_steps or len(dot_steps) + len(new_steps) > self.max_dots:
+                return None
+            dot_steps = sorted(dot_steps + new_steps)
     
-    def _generate_winding_path(self) -> List[Tuple[int, int]]:
-        """
-        Generate a randomized winding path (LinkedIn Tango style).
-        Creates natural, curved patterns with directional preference.
-        Guaranteed to visit all 36 cells and fast to compute.
+    def _optimize_clues(
+        self,
+        path: List[Tuple[int, int]],
+        dots: List[Dict[str, int]],
+        band_min: int,
+        band_max: int
+    ) -> Optional[Tuple[List[Dict[str, int]], List[Dict[str, Any]], int, Dict[str, int]]]:
         """
-        # Random starting corner/edge
-        start_positions = [
-            (0, 0), (0, 5), (5, 0), (5, 5),  # corners
-            (0, random.randint(1, 4)),        # top edge
-            (5, random.randint(1, 4)),        # bottom edge
-            (random.randint(1, 4), 0),        # left edge
-            (random.randint(1, 4), 5)         # right edge
-        ]
-        
-        start = random.choice(start_positions)
-        path = [start]
-        visited = {start}
+        Remove dots one at a time while the puzzle stays unique and in band.
         
-        # Directions: right, down, left, up
-        directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
-        current_direction = random.randint(0, 3)
+        When removing a dot opens an alternate solution, walls across the
+        edges where alternates leave the path are tried instead (up to
+        walls_per_removal). The loaded puzzle is edited in place and
+        re-checked after each change; accepted changes are graded and
+        reverted if the score passes band_max. Puzzles that start above
+        band_max get extra dots first. Stops once the score
+        reaches band_min, at min_dots or at optimize_timeout (capped by
+        self.deadline).
         
-        # Directional momentum - prefer continuing in same direction
-        momentum = 0
-        
-        while len(path) < 36:
-            current_pos = path[-1]
-            found_next = False
-            
-            # Try directions with preference for current direction
-            direction_attempts = []
+        Returns:
+            (dots, walls, score, grader stats), or None if the starting
+            puzzle cannot be proven unique or graded within max_solver_nodes
+        """
+        deadline = min(time.perf_counter() + self.optimize_timeout, self.deadline.at)
+        order = {cell: i for i, cell in enumerate(path)}
+        dot_steps = sorted(order[(dot["row"], dot["col"])] for dot in dots)
+        walls: List[Dict[str, Any]] = []
+        
+        self.solver.load([path[i] for i in dot_steps], walls)
+        decided, alternate = self._find_alternate(path)
+        grade = self._grade(path, dot_steps, walls) if decided and alternate is None else None
+        if grade is None:
+            # Not unique, or too open to tell or to grade
+            return None
+        score, stats = grade
+        
+        # Too hard already: more dots only remove solutions, so split the
+        # longest stretches between dots until the score drops into band
+        while score > band_max and len(dot_steps) < self.max_dots:
+            if time.perf_counter() > deadline:
+                self.last_timed_out = True
+                break
+            gap, start = max((b - a, a) for a, b in zip(dot_steps, dot_steps[1:]))
+            if gap < 2:
+                break
+            dot_steps = sorted(dot_steps + [start + gap // 2])
+            grade = self._grade(path, dot_steps, walls)
+            if grade is not None:
+                score, stats = grade
+        
+        candidates = dot_steps[1:-1]  # First and last dots mark the path ends
+        self.rng.shuffle(candidates)
+        for step in candidates:
+            if score >= band_min:
+                break
+            if len(dot_steps) <= self.min_dots:
+                break
+            if time.perf_counter() > deadline:
+                self.last_timed_out = True
+                break
             
-            # High momentum: strongly prefer current direction
-            if momentum > 2:
-                direction_attempts = [current_direction] * 4 + [(current_direction + i) % 4 for i in [1, 3, 2]]
-            # Some momentum: prefer current direction
-            elif momentum > 0:
-                direction_attempts = [current_direction] * 2 + [(current_direction + i) % 4 for i in [1, 3, 2]]
-            # No momentum: allow more turning
-            else:
-                direction_attempts = [current_direction] + [(current_direction + i) % 4 for i in [1, 2, 3]]
+            trial_steps = [s for s in dot_steps if s != step]
+            self.solver.set_dots([path[i] for i in trial_steps])
+            decided, alternate = self._find_alternate(path)
             
-            for dir_idx in direction_attempts:
-                dr, dc = directions[dir_idx]
-                new_pos = (current_pos[0] + dr, current_pos[1] + dc)
-                
-                # Check if valid and unvisited
-                if (0 <= new_pos[0] < self.size and 
-                    0 <= new_pos[1] < self.size and 
-                    new_pos not in visited):
-                    
-                    path.append(new_pos)
-                    visited.add(new_pos)
-                    
-                    # Update momentum
-                    if dir_idx == current_direction:
-                        momentum = min(momentum + 1, 5)  # Build momentum
-                    else:
-                        current_direction = dir_idx
-                        momentum = 0  # Reset on turn
-                    
-                    found_next = True
-                    break
+            added_walls = []
+            while decided and alternate is not None and len(added_walls) < self.walls_per_removal \
+                    and len(walls) + len(added_walls) < self.max_walls:
+                wall = self._blocking_wall(path, alternate)
+                self.solver.add_wall(wall)
+                added_walls.append(wall)
+                decided, alternate = self._find_alternate(path)
             
-            # If stuck, find any available neighbor
-            if not found_next:
-                for dr, dc in directions:
-                    new_pos = (current_pos[0] + dr, current_pos[1] + dc)
-                    if (0 <= new_pos[0] < self.size and 
-                        0 <= new_pos[1] < self.size and 
-                        new_pos not in visited):
-                        path.append(new_pos)
-                        visited.add(new_pos)
-                        current_direction = directions.index((dr, dc))
-                        momentum = 0
-                        found_next = True
-                        break
+            if decided and alternate is None:
+                grade = self._grade(path, trial_steps, walls + added_walls)
+                if grade is not None and grade[0] <= band_max:
+                    dot_steps = trial_steps
+                    walls.extend(added_walls)
+                    score, stats = grade
+                    continue
             
-            # If still stuck, backtrack
-            if not found_next and len(path) < 36:
-                # This shouldn't happen often, but fallback to snake if needed
-                if len(path) < 10:
-                    return self._generate_snake_path()
-                # Try to continue from a different visited cell
-                break
-        
-        # If we didn't visit all cells, fill remaining with snake pattern
-        if len(path) < 36:
-            return self._generate_snake_path()
+            for wall in added_walls:
+                self.solver.remove_wall(wall)
         
-        return path
+        if self.deadline.expired():
+            self.last_deadline_hit = True
+        print(f"   Optimized clues: {len(dot_steps)} dots, {len(walls)} walls, difficulty {score}")
+        return self._dots_at([path[i] for i in dot_steps]), walls, score, stats
     
-    def _get_adjacent_cells(self, row: int, col: int) -> List[Tuple[int, int]]:
-        """Get orthogonally adjacent cells within grid bounds."""
-        adjacent = []
-        
-        # Up, down, left, right
-        directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-        
-        for dr, dc in directions:
-            new_row, new_col = row + dr, col + dc
-            if 0 <= new_row < self.size and 0 <= new_col < self.size:
-                adjacent.append((new_row, new_col))
+    def _grade(
+        self,
+        path: List[Tuple[int, int]],
+        dot_steps: List[int],
+        walls: List[Dict[str, Any]]
+    ) -> Optional[Tuple[int, Dict[str, int]]]:
+        """ZipGrader (score, stats) of a unique puzzle, or None if grading ran past max_solver_nodes"""
+        try:
+            grade = self.grader.grade([path[i] for i in dot_steps], walls, path)
+        except SolverBudgetExceeded:
+            grade = None
+        self.last_solver_nodes += self.grader.nodes
+        return grade
+    
+    def _find_alternate(self, path: List[Tuple[int, int]]) -> Tuple[bool, Optional[List[Tuple[int, int]]]]:
+        """
+        Look for a solution of the solver's loaded puzzle other than path.
         
-        return adjacent
+        Returns:
+            (decided, alternate) - decided is False if the check ran past
+            max_solver_nodes, alternate is None if path is the only solution
+        """
+        try:
+            alternate = self.solver.alternative(path)
+            decided = True
+        except SolverBudgetExceeded:
+            alternate = None
+            decided = False
+        self.last_solver_nodes += self.solver.nodes
+        return decided, alternate
+    
+    def _blocking_wall(self, path: List[Tuple[int, int]], alternate: List[Tuple[int, int]]) -> Dict[str, Any]:
+        """Wall across the edge where alternate first leaves path (never a path edge)"""
+        diverge = next(i for i, (a, b) in enumerate(zip(path, alternate)) if a != b)
+        (r1, c1), (r2, c2) = sorted([path[diverge - 1], alternate[diverge]])
+        if r1 == r2:
+            return {"row": r1, "col": c1, "side": "RIGHT"}
+        return {"row": r1, "col": c1, "side": "BOTTOM"}
+    
+    def _separating_steps(
+        self,
+        path: List[Tuple[int, int]],
+        alternate: List[Tuple[int, int]],
+        dot_cells: Set[Tuple[int, int]],
+        order: Dict[Tuple[int, int], int]
+    ) -> List[int]:
+        """Path indices of new dots that make alternate break the dot order"""
+        def segments(cells):
+            segment, result = 0, {}
+            for cell in cells:
+                if cell in dot_cells:
+                    segment += 1
+                result[cell] = segment
+            return result
+        
+        path_segments = segments(path)
+        alternate_segments = segments(alternate)
+        moved = [order[cell] for cell in path if path_segments[cell] != alternate_segments[cell]]
+        if moved:
+            return [self.rng.choice(moved)]
+        
+        diverge = next(i for i, (a, b) in enumerate(zip(path, alternate)) if a != b)
+        return [diverge, order[alternate[diverge]]]
+    
+    def _dots_at(self, positions: List[Tuple[int, int]]) -> List[Dict[str, int]]:
+        """Dot dicts numbered 1..n for positions in path order"""
+        return [{"row": row, "col": col, "index": i + 1} for i, (row, col) in enumerate(positions)]
     
     def _select_dot_positions(
         self, 
@@ -324,14 +548,14 @@ class ZipGenerator:
         """
         path = []
         
-        for row in range(self.size):
+        for row in range(self.rows):
             if row % 2 == 0:
                 # Left to right
-                for col in range(self.size):
+                for col in range(self.cols):
                     path.append((row, col))
             else:
                 # Right to left
-                for col in range(self.size - 1, -1, -1):
+                for col in range(self.cols - 1, -1, -1):
                     path.append((row, col))
         
         return path
@@ -356,69 +580,3 @@ class ZipGenerator:
             })
         
         return dots
-    
-    def _generate_walls(self, solution_path: List[Tuple[int, int]]) -> List[Dict[str, Any]]:
-        """
-        Generate walls that add difficulty but don't block the solution path.
-        
-        Strategy:
-        - Place walls on edges NOT used by the solution path
-        - Random placement with 15-30% coverage of available edges
-        - Creates barriers that make wrong paths more likely
-        """
-        # Build set of edges used by solution
-        solution_edges = set()
-        for i in range(len(solution_path) - 1):
-            curr = solution_path[i]
-            next_pos = solution_path[i + 1]
-            
-            # Record this edge (normalized so order doesn't matter)
-            edge = self._normalize_edge(curr, next_pos)
-            if edge:
-                solution_edges.add(edge)
-        
-        # Collect all possible edges in grid
-        all_edges = []
-        for row in range(self.size):
-            for col in range(self.size):
-                # Right edge (if not at right boundary)
-                if col < self.size - 1:
-                    edge = ((row, col), (row, col + 1))
-                    if edge not in solution_edges:
-                        all_edges.append((row, col, "RIGHT"))
-                
-                # Bottom edge (if not at bottom boundary)
-                if row < self.size - 1:
-                    edge = ((row, col), (row + 1, col))
-                    if edge not in solution_edges:
-                        all_edges.append((row, col, "BOTTOM"))
-        
-        # Randomly select 15-30% of available edges to place walls
-        num_walls = random.randint(int(len(all_edges) * 0.25), int(len(all_edges) * 0.45))
-        selected_edges = random.sample(all_edges, min(num_walls, len(all_edges)))
-        
-        walls = []
-        for row, col, side in selected_edges:
-            walls.append({
-                "row": row,
-                "col": col,
-                "side": side
-            })
-        
-        print(f"   Generated {len(walls)} walls (out of {len(all_edges)} available edges)")
-        return walls
-    
-    def _normalize_edge(self, pos1: Tuple[int, int], pos2: Tuple[int, int]) -> Optional[Tuple[Tuple[int, int], Tuple[int, int]]]:
-        """
-        Normalize an edge so (A, B) and (B, A) are treated as the same edge.
-        Returns None if positions are not adjacent.
-        """
-        # Check if positions are adjacent
-        row_diff = abs(pos1[0] - pos2[0])
-        col_diff = abs(pos1[1] - pos2[1])
-        
-        if (row_diff == 1 and col_diff == 0) or (row_diff == 0 and col_diff == 1):
-            # Return edge with smaller position first
-            return tuple(sorted([pos1, pos2]))
-        
-        return None
@@ -0,0 +1,94 @@
+"""
+Search-effort difficulty grader for ZIP puzzles.
+
+The grader follows the solution from dot 1 the way a solver would and,
+at every step, keeps only the moves that survive the ZipSolver pruning
+checks (parity, dead ends, reachability). A step with one surviving move
+is forced; a step with several is a branch point, and every wrong branch
+is refuted by exhaustive search. The score grows with both:
+
+    score = BRANCH_WEIGHT × branch points + search nodes spent refuting
+
+so a puzzle that can be solved by propagating forced moves alone scores
+0, and each guess the player has to make raises it by how much search
+the guess takes to rule out.
+"""
+from typing import Any, Dict, Sequence, Tuple
+
+from .zip_solver import ZipSolver
+
+# Score per step with more than one surviving move
+BRANCH_WEIGHT = 5
+
+
+class ZipGrader(ZipSolver):
+    """Grades ZIP puzzles by forced-move propagation and branch refutation"""
+
+    def grade(
+        self,
+        dots: Sequence[Tuple[int, int]],
+        walls: Sequence[Dict[str, Any]],
+        path: Sequence[Tuple[int, int]]
+    ) -> Tuple[int, Dict[str, int]]:
+        """
+        Grade a unique puzzle against its solution.
+
+        Args:
+            dots: (row, col) of dots 1..n in order
+            walls: Wall dicts with row, col and side
+            path: The solution path
+
+        Returns:
+            (score, stats) where stats has forcedMoves, branchPoints,
+            longestForcedRun (propagation depth) and searchNodes
+
+        Raises:
+            SolverBudgetExceeded: if refuting a branch needs more than max_nodes
+        """
+        self.load(dots, walls)
+        self.nodes = 0
+        self._limit = 1
+        self._memo: Dict[Tuple[int, int], int] = {}
+
+        cells = [row * self.cols + col for row, col in path]
+        visited = 1 << cells[0]
+        next_dot = 1
+        forced = branches = run = longest = 0
+        for head, cell in zip(cells, cells[1:]):
+            options = [
+                (option, dot) for option, dot in self._moves(head, visited, next_dot)
+                if self._viable(option, visited | 1 << option)
+            ]
+            if len(options) == 1:
+                forced += 1
+                run += 1
+                longest = max(longest, run)
+            else:
+                branches += 1
+                run = 0
+                for option, dot in options:
+                    if option != cell:
+                        # Wrong branches have no completion; count() proves it
+                        self._count(option, visited | 1 << option, dot)
+            next_dot = dict(options)[cell]
+            visited |= 1 << cell
+
+        score = BRANCH_WEIGHT * branches + self.nodes
+        return score, {
+            "forcedMoves": forced,
+            "branchPoints": branches,
+            "longestForcedRun": longest,
+            "searchNodes": self.nodes,
+        }
+
+    def grade_payload(self, payload: Dict[str, Any]) -> Tuple[int, Dict[str, int]]:
+        """Grade a ZIP payload (dots, optional walls and solution)"""
+        dots = [(dot["row"], dot["col"]) for dot in sorted(payload["dots"], key=lambda d: d["index"])]
+        path = [(cell["row"], cell["col"]) for cell in payload["solution"]]
+        return self.grade(dots, payload.get("walls", []), path)
+
+    def _viable(self, cell: int, visited: int) -> bool:
+        """Whether the path can still be completed after moving to cell"""
+        if visited == self.full:
+            return cell == self._end
+        return self._feasible(cell, self.full & ~visited)
@@ -0,0 +1,253 @@
+"""
+ZIP solution counter.
+
+A ZIP solution is a path that starts on dot 1, passes the dots in order,
+ends on the last dot, visits every cell once and never crosses a wall.
+The counter walks such paths depth-first over a bitmask of visited cells
+and stops as soon as it reaches the limit, so checking uniqueness
+(limit=2) is cheap even on open boards.
+
+A loaded puzzle can be edited in place (set_dots, add_wall, remove_wall)
+and re-checked, which is how the generator searches for minimal clues.
+
+Counts are memoized on (cell, visited): the visited mask already fixes
+which dot comes next, so it needs no separate key. Every node is pruned
+with parity, dead-end and reachability checks against the fixed end cell.
+"""
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .puzzle_encoding import DIRECTIONS
+
+_WALL_DIRECTIONS = {"TOP": (-1, 0), "RIGHT": (0, 1), "BOTTOM": (1, 0), "LEFT": (0, -1)}
+
+
+class SolverBudgetExceeded(Exception):
+    """Raised when a count needs more than the solver's max_nodes"""
+
+
+class ZipSolver:
+    """Counts ZIP solutions on a rows × cols grid"""
+
+    def __init__(self, rows: int = 6, cols: Optional[int] = None, max_nodes: Optional[int] = None):
+        """
+        Args:
+            rows: Grid rows
+            cols: Grid columns (defaults to rows)
+            max_nodes: Node budget per count; SolverBudgetExceeded past it
+        """
+        self.rows = rows
+        self.cols = cols if cols is not None else rows
+        self.cells = self.rows * self.cols
+        self.full = (1 << self.cells) - 1
+        self.black = sum(
+            1 << cell for cell in range(self.cells) if sum(divmod(cell, self.cols)) % 2 == 0
+        )
+        self.max_nodes = max_nodes
+        self.nodes = 0
+
+    def count_payload(self, payload: Dict[str, Any], limit: int = 2) -> int:
+        """Count solutions of a ZIP payload (dots and optional walls), up to limit"""
+        dots = [(dot["row"], dot["col"]) for dot in sorted(payload["dots"], key=lambda d: d["index"])]
+        return self.count_solutions(dots, payload.get("walls", []), limit)
+
+    def count_solutions(
+        self,
+        dots: Sequence[Tuple[int, int]],
+        walls: Sequence[Dict[str, Any]] = (),
+        limit: int = 2
+    ) -> int:
+        """
+        Count paths consistent with the dot order and walls, up to limit.
+
+        Args:
+            dots: (row, col) of dots 1..n in order (at least 2)
+            walls: Wall dicts with row, col and side
+            limit: Stop counting once this many solutions are found
+
+        Returns:
+            Number of solutions, capped at limit
+        """
+        self.load(dots, walls)
+        return self.count(limit)
+
+    def find_alternative(
+        self,
+        dots: Sequence[Tuple[int, int]],
+        walls: Sequence[Dict[str, Any]],
+        path: Sequence[Tuple[int, int]]
+    ) -> Optional[List[Tuple[int, int]]]:
+        """Find a solution other than path, or None if path is the only one"""
+        self.load(dots, walls)
+        return self.alternative(path)
+
+    def load(self, dots: Sequence[Tuple[int, int]], walls: Sequence[Dict[str, Any]] = ()) -> None:
+        """Set up a puzzle for incremental edits with set_dots/add_wall/remove_wall"""
+        self._neighbor_masks = self._build_neighbor_masks(walls)
+        self.set_dots(dots)
+
+    def set_dots(self, dots: Sequence[Tuple[int, int]]) -> None:
+        """Replace the dots of the loaded puzzle (walls are kept)"""
+        self._dot_cells = [row * self.cols + col for row, col in dots]
+        self._dot_mask = sum(1 << cell for cell in self._dot_cells)
+        self._end = self._dot_cells[-1]
+        self._end_black = bool(self.black >> self._end & 1)
+
+    def add_wall(self, wall: Dict[str, Any]) -> None:
+        """Block one edge of the loaded puzzle"""
+        a, b = self._wall_cells(wall)
+        self._neighbor_masks[a] &= ~(1 << b)
+        self._neighbor_masks[b] &= ~(1 << a)
+
+    def remove_wall(self, wall: Dict[str, Any]) -> None:
+        """Undo add_wall()"""
+        a, b = self._wall_cells(wall)
+        self._neighbor_masks[a] |= 1 << b
+        self._neighbor_masks[b] |= 1 << a
+
+    def count(self, limit: int = 2) -> int:
+        """Count solutions of the loaded puzzle, up to limit"""
+        self.nodes = 0
+        self._limit = limit
+        self._memo: Dict[Tuple[int, int], int] = {}
+        start = self._dot_cells[0]
+        return self._count(start, 1 << start, 1)
+
+    def alternative(self, path: Sequence[Tuple[int, int]]) -> Optional[List[Tuple[int, int]]]:
+        """
+        Find a solution of the loaded puzzle other than path, or None.
+
+        Counts with limit 2, then walks the memoized counts to pull out a
+        solution that leaves path as early as possible.
+        """
+        if self.count(limit=2) < 2:
+            return None
+
+        avoid = [row * self.cols + col for row, col in path]
+        cells = [self._dot_cells[0]]
+        visited = 1 << cells[0]
+        next_dot = 1
+        on_path = True
+        while visited != self.full:
+            best = None
+            for cell, dot in self._moves(cells[-1], visited, next_dot):
+                count = self._count(cell, visited | 1 << cell, dot)
+                stays_on_path = on_path and cell == avoid[len(cells)]
+                if count and not stays_on_path:
+                    best = (cell, dot)
+                    break
+                if stays_on_path and count >= 2:
+                    # Another solution shares this step with path
+                    best = (cell, dot)
+            cell, next_dot = best
+            on_path = on_path and cell == avoid[len(cells)]
+            cells.append(cell)
+            visited |= 1 << cell
+        return [divmod(cell, self.cols) for cell in cells]
+
+    def _wall_cells(self, wall: Dict[str, Any]) -> Tuple[int, int]:
+        dr, dc = _WALL_DIRECTIONS[wall["side"]]
+        return (
+            wall["row"] * self.cols + wall["col"],
+            (wall["row"] + dr) * self.cols + wall["col"] + dc,
+        )
+
+    def _moves(self, head: int, visited: int, next_dot: int) -> List[Tuple[int, int]]:
+        """Legal next cells from head, with the next-dot index after each"""
+        unvisited = self.full & ~visited
+        target = self._dot_cells[next_dot]
+        allowed = unvisited & ~self._dot_mask | 1 << target
+        moves = []
+        candidates = self._neighbor_masks[head] & allowed
+        while candidates:
+            low = candidates & -candidates
+            candidates ^= low
+            cell = low.bit_length() - 1
+            if cell == target:
+                if cell == self._end and visited | low != self.full:
+                    continue
+                moves.append((cell, next_dot + 1))
+            else:
+                moves.append((cell, next_dot))
+        return moves
+
+    def _build_neighbor_masks(self, walls: Sequence[Dict[str, Any]]) -> List[int]:
+        blocked = set()
+        for wall in walls:
+            a, b = self._wall_cells(wall)
+            blocked.add((a, b))
+            blocked.add((b, a))
+
+        masks = []
+        for cell in range(self.cells):
+            row, col = divmod(cell, self.cols)
+            mask = 0
+            for dr, dc in DIRECTIONS:
+                r, c = row + dr, col + dc
+                if 0 <= r < self.rows and 0 <= c < self.cols and (cell, r * self.cols + c) not in blocked:
+                    mask |= 1 << (r * self.cols + c)
+            masks.append(mask)
+        return masks
+
+    def _count(self, head: int, visited: int, next_dot: int) -> int:
+        if visited == self.full:
+            return 1 if head == self._end else 0
+
+        key = (head, visited)
+        if key in self._memo:
+            return self._memo[key]
+
+        self.nodes += 1
+        if self.max_nodes is not None and self.nodes > self.max_nodes:
+            raise SolverBudgetExceeded(f"Solution count needs more than {self.max_nodes} nodes")
+        total = 0
+        if self._feasible(head, self.full & ~visited):
+            # Dots other than the next one are closed until their turn
+            for cell, dot in self._moves(head, visited, next_dot):
+                total += self._count(cell, visited | 1 << cell, dot)
+                if total >= self._limit:
+                    total = self._limit
+                    break
+
+        self._memo[key] = total
+        return total
+
+    def _feasible(self, head: int, unvisited: int) -> bool:
+        """Parity, dead-end and reachability checks for the rest of the path"""
+        masks = self._neighbor_masks
+
+        # Parity: the rest of the path runs from a neighbor of the head to the
+        # end cell, alternating colors on the way
+        remaining = unvisited.bit_count()
+        head_black = bool(self.black >> head & 1)
+        first_color_left = (unvisited & self.black).bit_count()
+        if head_black:
+            first_color_left = remaining - first_color_left
+        if first_color_left * 2 - remaining not in (0, 1):
+            return False
+        ends_on_first_color = remaining % 2 == 1
+        if (self._end_black != head_black) != ends_on_first_color:
+            return False
+
+        # Dead ends: every cell but the end needs two ways in
+        head_mask = masks[head]
+        cells = unvisited
+        while cells:
+            low = cells & -cells
+            cells ^= low
+            cell = low.bit_length() - 1
+            degree = (masks[cell] & unvisited).bit_count() + (1 if head_mask & low else 0)
+            if degree < 2 and cell != self._end:
+                return False
+            if degree == 0:
+                return False
+
+        # Reachability: every unvisited cell must be reachable from the head
+        reach = head_mask & unvisited
+        frontier = reach
+        while frontier:
+            low = frontier & -frontier
+            frontier ^= low
+            grown = masks[low.bit_length() - 1] & unvisited & ~reach
+            reach |= grown
+            frontier |= grown
+        return reach == unvisited
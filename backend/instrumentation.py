@@ -0,0 +1,123 @@
+"""
+Per-request timing spans and counters for the generation pipeline.
+
+Instrumentation is off unless PIPELINE_METRICS is set. While a request is
+being measured (between start() and finish()), span() times a stage and
+count() adds to a counter. Repeated spans of the same name (e.g. one per
+generation attempt) are summed. finish() returns the request's metrics for
+the HTTP response and writes them as one structured JSON log line, which
+Cloud Logging parses into fields.
+
+The request being measured is kept in a ContextVar, so concurrent requests
+on threads or asyncio tasks each see their own. Work handed to an executor
+thread is measured only if it runs in a copy of the request's context
+(contextvars.copy_context().run).
+
+When instrumentation is off, or no request is being measured (e.g. inside
+batch pool workers), span() returns a shared no-op context manager and
+count() returns immediately, so the calls can stay in hot code.
+
+Usage:
+    from instrumentation import metrics
+
+    metrics.start("ZIP", "2025-12-25")
+    with metrics.span("write"):
+        writer.write_puzzle(...)
+    metrics.count("resultsDeleted", 12)
+    result["metrics"] = metrics.finish()
+"""
+import json
+import os
+import time
+from contextlib import nullcontext
+from contextvars import ContextVar
+from typing import Any, Dict, Optional
+
+ENABLED = os.getenv('PIPELINE_METRICS', '').lower() in ('1', 'true', 'yes')
+
+_NO_SPAN = nullcontext()
+
+
+class _Span:
+    """Context manager timing one stage into its request's metrics"""
+
+    __slots__ = ("request", "name", "start")
+
+    def __init__(self, request: "RequestMetrics", name: str):
+        self.request = request
+        self.name = name
+
+    def __enter__(self) -> "_Span":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        elapsed = time.perf_counter() - self.start
+        span = self.request.spans.setdefault(self.name, [0, 0.0])
+        span[0] += 1
+        span[1] += elapsed
+
+
+class RequestMetrics:
+    """Spans and counters of one request"""
+
+    def __init__(self, **fields: Any):
+        self.fields = fields
+        self.spans: Dict[str, list] = {}
+        self.counters: Dict[str, int] = {}
+        self.start = time.perf_counter()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "totalSeconds": round(time.perf_counter() - self.start, 4),
+            "spans": {
+                name: {"count": count, "seconds": round(seconds, 4)}
+                for name, (count, seconds) in self.spans.items()
+            },
+            "counters": dict(self.counters),
+        }
+
+
+class Metrics:
+    """Collects metrics for the request currently being handled"""
+
+    def __init__(self, enabled: bool = ENABLED):
+        self.enabled = enabled
+        self._request: ContextVar[Optional[RequestMetrics]] = ContextVar(f"request_metrics_{id(self)}", default=None)
+
+    def start(self, game_type: str, date_str: str) -> None:
+        """Begin measuring a request in the current context (no-op when disabled)"""
+        self._request.set(RequestMetrics(gameType=game_type, date=date_str) if self.enabled else None)
+
+    def span(self, name: str):
+        """Time a stage: `with metrics.span("write"): ...`"""
+        request = self._request.get()
+        if request is None:
+            return _NO_SPAN
+        return _Span(request, name)
+
+    def count(self, name: str, value: int = 1) -> None:
+        """Add value to a counter"""
+        request = self._request.get()
+        if request is None:
+            return
+        request.counters[name] = request.counters.get(name, 0) + value
+
+    def finish(self) -> Optional[Dict[str, Any]]:
+        """
+        Stop measuring, log the metrics as a JSON line and return them.
+
+        Returns:
+            {"totalSeconds", "spans", "counters"}, or None when disabled
+        """
+        request = self._request.get()
+        self._request.set(None)
+        if request is None:
+            return None
+        data = request.to_dict()
+        print(json.dumps({"severity": "INFO", "message": "puzzle pipeline metrics", **request.fields, **data}))
+        return data
+
+
+# Shared collector used across the pipeline
+metrics = Metrics()
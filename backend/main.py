@@ -3,28 +3,50 @@ BrainBurst Backend - Daily Puzzle Generator
 Cloud Function entry point for generating and storing daily puzzles
 """
 import os
+import contextvars
+import functools
 import json
-from datetime import datetime, timezone
-from typing import Dict, Any
+import random
+import threading
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Dict, Any, Iterator, List, Optional, Tuple
 
 # Load environment variables from .env file (for local development)
 from dotenv import load_dotenv
 load_dotenv()
 
 # Third-party imports
-import firebase_admin
-from firebase_admin import credentials, firestore
-from openai import OpenAI
 import functions_framework
 
-# Local imports
-from generators import SudokuGenerator, ZipGenerator
-from validators import SudokuValidator
-from firestore_writer import FirestoreWriter
+# Local imports (generators and validators import their modules on first use)
+import generators
+import validators
+from generators import derive_seed
+from generators.deadline import NO_DEADLINE, Deadline
+from instrumentation import metrics
+from payload_codec import COMPACT_PAYLOAD_VERSION
+from puzzle_index import PuzzleIndex, load_index, puzzle_hash
+from registry import LazyRegistry
 
+if TYPE_CHECKING:
+    from async_firestore_writer import AsyncFirestoreWriter
+    from firestore_writer import FirestoreWriter
 
-# Initialize Firebase Admin (only once)
-if not firebase_admin._apps:
+# Cold starts: firebase_admin, the Firestore clients, asyncio, multiprocessing
+# and each generator are loaded on first use, so an instance only pays for
+# what its requests need (see benchmarks/import_time.py)
+_db = None
+
+
+def _init_firebase() -> None:
+    """Initialize Firebase Admin (only once)"""
+    import firebase_admin
+    from firebase_admin import credentials
+    
+    if firebase_admin._apps:
+        return
+    
     # In Cloud Functions, credentials are automatic
     # For local development, use service account JSON
     service_account_path = os.getenv('FIREBASE_SERVICE_ACCOUNT_PATH', './serviceAccountKey.json')
@@ -46,22 +68,97 @@ if not firebase_admin._apps:
             print("⚠️  No service account key found, trying default credentials...")
             firebase_admin.initialize_app()
 
-# Initialize clients
-db = firestore.client()
 
-# Initialize generator registry (no OpenAI dependency needed)
-GENERATORS = {
-    "MINI_SUDOKU_6X6": SudokuGenerator(),  # Deterministic generator, no API key needed
-    "ZIP": ZipGenerator(),  # ZIP puzzle generator
+def _get_db():
+    """Firestore client, created on first use"""
+    global _db
+    if _db is None:
+        from firebase_admin import firestore
+        _init_firebase()
+        _db = firestore.client()
+    return _db
+
+
+def _get_writer() -> "FirestoreWriter":
+    """Firestore writer on the shared client"""
+    from firestore_writer import FirestoreWriter
+    return FirestoreWriter(_get_db(), PAYLOAD_VERSIONS)
+
+
+# Generator registry: each generator is built by its factory on first use
+GENERATORS = LazyRegistry({
+    "MINI_SUDOKU_6X6": lambda: generators.SudokuGenerator(),  # Deterministic generator, no API key needed
+    "SUDOKU_9X9": lambda: generators.SudokuGenerator(size=9, block_rows=3, block_cols=3),
+    "ZIP": lambda: generators.ZipGenerator(),  # ZIP puzzle generator
     # Future games:
-    # "TANGO": TangoGenerator(),
-}
+    # "TANGO": lambda: generators.TangoGenerator(),
+})
+
+VALIDATORS = LazyRegistry({
+    "MINI_SUDOKU_6X6": lambda: validators.SudokuValidator(size=6, block_rows=2, block_cols=3),
+    "SUDOKU_9X9": lambda: validators.SudokuValidator(size=9, block_rows=3, block_cols=3),
+    "ZIP": lambda: validators.ZipValidator(),
+})
+
+# Generators and validators keep per-call state (rng, deadline, solver, last_*
+# stats), so one attempt at a time runs per game type within a process
+_generator_locks = {game_type: threading.Lock() for game_type in GENERATORS}
+
+# Difficulty bands every generator accepts (random when a request names none)
+DIFFICULTIES = ["medium", "hard", "expert"]
+
+# Batch mode: most (game type, date) items one request may generate
+MAX_BATCH_ITEMS = 400
+
+# Candidate racing: generate-and-validate attempts run in parallel per round
+# (0 or 1 = one attempt at a time); only used on instances with several cores
+PARALLEL_CANDIDATES = int(os.getenv('PARALLEL_CANDIDATES', '0'))
+
+# Request deadline: HTTP requests get the Cloud Function timeout, and generation
+# stops early enough to leave FIRESTORE_RESERVE_SECONDS for deletes and writes
+REQUEST_TIMEOUT_SECONDS = float(os.getenv('REQUEST_TIMEOUT_SECONDS', '60'))
+FIRESTORE_RESERVE_SECONDS = float(os.getenv('FIRESTORE_RESERVE_SECONDS', '10'))
 
-VALIDATORS = {
-    "MINI_SUDOKU_6X6": SudokuValidator(size=6, block_rows=2, block_cols=3),
-    # ZIP doesn't need complex validation - basic structure is enough
+# Winning attempt and wall time of the request's last _generate_validated_payload()
+# call. Each request sets a fresh dict, which executor threads running in a copy
+# of its context (see _in_executor) update in place
+_last_generation: contextvars.ContextVar[Dict[str, Any]] = contextvars.ContextVar("last_generation")
+
+# Duplicate index: local file if PUZZLE_INDEX_PATH is set, else Firestore puzzleIndex docs
+PUZZLE_INDEX_PATH = os.getenv('PUZZLE_INDEX_PATH')
+MAX_DUPLICATE_ATTEMPTS = 3
+
+# Game types stored with the compact payload encoding (comma-separated), e.g. "ZIP,SUDOKU_9X9"
+PAYLOAD_VERSIONS = {
+    game_type.strip(): COMPACT_PAYLOAD_VERSION
+    for game_type in os.getenv('COMPACT_PAYLOAD_GAME_TYPES', '').split(',')
+    if game_type.strip()
 }
 
+# Seeded mode: when set, each day's puzzle is derived from (game type, date, salt)
+# so any instance recomputes the same puzzle; the seed is stored in the payload
+PUZZLE_SEED_SALT = os.getenv('PUZZLE_SEED_SALT')
+
+# Optional pre-generated puzzle bank (built with puzzle_bank.py)
+PUZZLE_BANK_PATH = os.getenv('PUZZLE_BANK_PATH')
+_puzzle_bank = None
+
+# Async pipeline: single-puzzle requests overlap Firestore I/O with generation
+# on the async client, run by one event loop thread per instance
+ASYNC_PIPELINE = os.getenv('ASYNC_PIPELINE', '').lower() in ('1', 'true', 'yes')
+_async_db = None
+_async_loop = None
+_async_loop_lock = threading.Lock()
+
+
+def _get_puzzle_bank():
+    """Open the puzzle bank on first use, or return None if none is configured"""
+    global _puzzle_bank
+    if _puzzle_bank is None and PUZZLE_BANK_PATH and os.path.exists(PUZZLE_BANK_PATH):
+        from puzzle_bank import PuzzleBank
+        _puzzle_bank = PuzzleBank(PUZZLE_BANK_PATH, os.getenv('PUZZLE_BANK_LEDGER'))
+    return _puzzle_bank
+
 
 @functions_framework.http
 def generate_daily_puzzle(request):
@@ -71,7 +168,8 @@ def generate_daily_puzzle(request):
     Request body (JSON):
     {
         "gameType": "MINI_SUDOKU_6X6",
-        "date": "2025-12-25"  // Optional, defaults to today
+        "date": "2025-12-25",  // Optional, defaults to today
+        "difficulty": "hard"   // Optional: "medium", "hard" or "expert"
     }
     
     Response:
@@ -80,8 +178,22 @@ def generate_daily_puzzle(request):
         "puzzleId": "MINI_SUDOKU_6X6_2025-12-25",
         "message": "Puzzle generated successfully"
     }
+    
+    Batch mode (backfills, several games per call) - see _generate_batch():
+    {
+        "gameTypes": ["MINI_SUDOKU_6X6", "ZIP"],
+        "startDate": "2025-12-20",
+        "endDate": "2025-12-25",     // Optional, defaults to startDate
+        "force": false,              // Optional, regenerate existing puzzles
+        "cleanup": true,             // Optional, delete puzzles older than the range
+                                     // (default: only if endDate is today or later)
+        "difficulty": "hard"         // Optional
+    }
     """
     try:
+        # The request's time budget starts now
+        deadline = Deadline(REQUEST_TIMEOUT_SECONDS)
+        
         # Parse request
         request_json = request.get_json(silent=True)
         if not request_json:
@@ -90,6 +202,16 @@ def generate_daily_puzzle(request):
                 "error": "No JSON body provided"
             }, 400
         
+        difficulty = request_json.get('difficulty')
+        if difficulty is not None and difficulty not in DIFFICULTIES:
+            return {
+                "success": False,
+                "error": f"Unknown difficulty: {difficulty}"
+            }, 400
+        
+        if 'gameTypes' in request_json or 'startDate' in request_json:
+            return _handle_batch_request(request_json, difficulty, deadline)
+        
         game_type = request_json.get('gameType', 'MINI_SUDOKU_6X6')
         date_str = request_json.get('date', datetime.now(timezone.utc).strftime('%Y-%m-%d'))
         
@@ -101,7 +223,12 @@ def generate_daily_puzzle(request):
             }, 400
         
         # Generate puzzle
-        result = _generate_and_store_puzzle(game_type, date_str)
+        if ASYNC_PIPELINE:
+            result = _run_async(_generate_and_store_puzzle_async(
+                game_type, date_str, difficulty=difficulty, deadline=deadline
+            ))
+        else:
+            result = _generate_and_store_puzzle(game_type, date_str, difficulty=difficulty, deadline=deadline)
         
         if result["success"]:
             return result, 200
@@ -116,7 +243,282 @@ def generate_daily_puzzle(request):
         }, 500
 
 
-def _generate_and_store_puzzle(game_type: str, date_str: str, force: bool = False) -> Dict[str, Any]:
+def _handle_batch_request(
+    request_json: Dict[str, Any],
+    difficulty: Optional[str],
+    deadline: Deadline
+) -> Tuple[Dict[str, Any], int]:
+    """Validate a batch request body and run it"""
+    today = datetime.now(timezone.utc).strftime('%Y-%m-%d')
+    # Each game type once, in the order given
+    game_types = list(dict.fromkeys(request_json.get('gameTypes', list(GENERATORS))))
+    start_date = request_json.get('startDate', today)
+    end_date = request_json.get('endDate', start_date)
+    
+    unknown = [game_type for game_type in game_types if game_type not in GENERATORS]
+    if unknown:
+        return {
+            "success": False,
+            "error": f"Unknown game type(s): {', '.join(unknown)}"
+        }, 400
+    
+    try:
+        dates = _date_range(start_date, end_date)
+    except ValueError as e:
+        return {
+            "success": False,
+            "error": f"Invalid date range: {e}"
+        }, 400
+    
+    if len(dates) * len(game_types) > MAX_BATCH_ITEMS:
+        return {
+            "success": False,
+            "error": f"Batch of {len(dates) * len(game_types)} puzzles exceeds the limit of {MAX_BATCH_ITEMS}"
+        }, 400
+    
+    cleanup = request_json.get('cleanup')
+    result = _generate_batch(
+        game_types,
+        dates,
+        force=bool(request_json.get('force', False)),
+        difficulty=difficulty,
+        cleanup=None if cleanup is None else bool(cleanup),
+        deadline=deadline
+    )
+    return result, 200 if result["success"] else 500
+
+
+def _date_range(start_date: str, end_date: str) -> List[str]:
+    """Dates from start_date to end_date inclusive (YYYY-MM-DD)"""
+    start = date.fromisoformat(start_date)
+    end = date.fromisoformat(end_date)
+    if end < start:
+        raise ValueError(f"endDate {end_date} is before startDate {start_date}")
+    return [(start + timedelta(days=i)).isoformat() for i in range((end - start).days + 1)]
+
+
+# True inside pool workers, which cannot start pools of their own
+_in_pool_worker = False
+
+# Long-lived worker pool for batches and candidate races (created on first
+# use), and the shared round counter raced candidates compare their job's
+# round against
+_worker_pool = None
+_race_round = None
+
+# One batch or race at a time on the worker pool, which already uses every core
+_pool_lock = threading.Lock()
+
+
+def _get_worker_pool():
+    """
+    The worker pool, sized to the cores and created on first use.
+    
+    Workers are started by a forkserver (or spawned where there is none), so
+    they never inherit the Firestore clients' gRPC threads, the async
+    pipeline's event-loop thread or a lock held at fork time. They build
+    their own generators and rngs on first use.
+    """
+    global _worker_pool, _race_round
+    if _worker_pool is None:
+        import atexit
+        import multiprocessing
+        
+        method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        context = multiprocessing.get_context(method)
+        _race_round = context.Value("q", 0, lock=False)
+        processes = os.cpu_count() or 1
+        _worker_pool = context.Pool(processes, _init_pool_worker, (_race_round,))
+        atexit.register(_worker_pool.terminate)
+        print(f"🏊 Started {processes} pool worker(s) ({method})")
+    return _worker_pool
+
+
+def _init_pool_worker(race_round) -> None:
+    """Pool initializer: mark the process as a worker and keep the shared round counter"""
+    global _in_pool_worker, _race_round
+    _in_pool_worker = True
+    _race_round = race_round
+
+
+def _generate_batch_item(job: Tuple[str, str, Optional[str], Deadline, PuzzleIndex]) -> Dict[str, Any]:
+    """Generate one (game type, date) of a batch; runs in a pool worker or inline"""
+    game_type, date_str, difficulty, deadline, puzzle_index = job
+    start = time.perf_counter()
+    _last_generation.set({})
+    payload, source, canonical_hash, error = _generate_unique_payload(
+        game_type, date_str, puzzle_index, difficulty, deadline=deadline
+    )
+    item = {
+        "gameType": game_type,
+        "date": date_str,
+        "success": payload is not None,
+        "source": source,
+    }
+    if payload is None:
+        item["error"] = error
+    else:
+        item["payload"] = payload
+        item["canonicalHash"] = canonical_hash
+        item.update(_puzzle_stats(game_type, payload, source))
+    item["generateSeconds"] = round(time.perf_counter() - start, 4)
+    return item
+
+
+def _generate_batch(
+    game_types: List[str],
+    dates: List[str],
+    force: bool = False,
+    difficulty: Optional[str] = None,
+    cleanup: Optional[bool] = None,
+    deadline: Optional[Deadline] = None
+) -> Dict[str, Any]:
+    """
+    Generate every (game type, date) combination and store them together.
+    
+    Puzzles are generated in parallel on the worker pool (game types served by the puzzle bank are taken inline, so the
+    bank ledger has a single writer). All new puzzles and their canonical
+    hashes are then stored with batched Firestore commits. With cleanup,
+    each game type's puzzles dated before the range are deleted with their
+    results; the range and any later puzzles (e.g. today's, during a
+    backfill) are kept.
+    
+    Args:
+        game_types: Game types to generate
+        dates: Dates to generate (YYYY-MM-DD), oldest first
+        force: If True, regenerate puzzles that already exist
+        difficulty: Requested difficulty band, or None
+        cleanup: If True, delete the game types' puzzles dated before the
+            range; None cleans up only when the range reaches today, so a
+            backfill of past dates deletes nothing by default
+        deadline: Time limit for the whole batch (none if None); items
+            generated after it expires get the generators' best-so-far puzzles
+    
+    Returns:
+        Dictionary with success status, per-item results and timings
+    """
+    batch_start = time.perf_counter()
+    game_types = list(dict.fromkeys(game_types))
+    if cleanup is None:
+        cleanup = dates[-1] >= datetime.now(timezone.utc).strftime('%Y-%m-%d')
+    deadline = deadline or NO_DEADLINE
+    generation_deadline = deadline.reserve(FIRESTORE_RESERVE_SECONDS)
+    writer = _get_writer()
+    combinations = [(game_type, date_str) for game_type in game_types for date_str in dates]
+    
+    existing = set() if force else writer.existing_puzzle_ids(combinations)
+    
+    # Canonical hashes of earlier puzzles, to reject equivalent ones. The
+    # local index file holds every game type, so it is loaded (and saved) once
+    local_index = PuzzleIndex.load(PUZZLE_INDEX_PATH) if PUZZLE_INDEX_PATH else None
+    indexes = {
+        game_type: local_index if local_index is not None else load_index(writer, game_type)
+        for game_type in game_types
+    }
+    
+    jobs = [
+        (game_type, date_str, difficulty, generation_deadline, indexes[game_type])
+        for game_type, date_str in combinations
+        if f"{game_type}_{date_str}" not in existing
+    ]
+    print(f"🎮 Batch: {len(jobs)} puzzle(s) to generate, {len(existing)} already exist")
+    
+    # Bank-served game types stay in this process; the rest go to the pool
+    bank = _get_puzzle_bank()
+    inline_jobs = [job for job in jobs if bank is not None and bank.has_game_type(job[0])]
+    pool_jobs = [job for job in jobs if bank is None or not bank.has_game_type(job[0])]
+    
+    generate_start = time.perf_counter()
+    items = [_generate_batch_item(job) for job in inline_jobs]
+    processes = min(os.cpu_count() or 1, len(pool_jobs))
+    if processes > 1:
+        # Jobs go out in chunks; pickling sends each index once per chunk
+        chunksize = max(1, len(pool_jobs) // (processes * 4))
+        with _pool_lock:
+            items.extend(_get_worker_pool().imap_unordered(_generate_batch_item, pool_jobs, chunksize))
+    else:
+        items.extend(_generate_batch_item(job) for job in pool_jobs)
+    generate_seconds = time.perf_counter() - generate_start
+    
+    # Reject equivalent puzzles generated for two items of this batch
+    new_hashes: Dict[str, List[int]] = {game_type: [] for game_type in game_types}
+    for item in sorted(items, key=lambda item: (item["gameType"], item["date"])):
+        if not item["success"]:
+            continue
+        if item["canonicalHash"] in new_hashes[item["gameType"]]:
+            item["success"] = False
+            item["error"] = "Equivalent to another puzzle of this batch"
+            del item["payload"]
+            continue
+        new_hashes[item["gameType"]].append(item["canonicalHash"])
+    
+    # Store all new puzzles (and, without a local index, their hashes) in batched commits
+    write_start = time.perf_counter()
+    stored = [item for item in items if item["success"]]
+    writer.write_puzzles(
+        [(item["gameType"], item["date"], item.pop("payload")) for item in stored],
+        None if PUZZLE_INDEX_PATH else new_hashes
+    )
+    if local_index is not None:
+        for hashes in new_hashes.values():
+            for canonical_hash in hashes:
+                local_index.add(canonical_hash)
+        local_index.save(PUZZLE_INDEX_PATH)
+    write_seconds = time.perf_counter() - write_start
+    
+    # Cleanup: delete puzzles older than the range, never the range or later dates
+    cleanup_start = time.perf_counter()
+    deleted = {}
+    cascade_deletes = {}
+    if cleanup:
+        for game_type in game_types:
+            deleted[game_type] = writer.delete_old_puzzles(game_type, dates[-1], before=dates[0])
+            cascade_deletes[game_type] = writer.last_delete
+    cleanup_seconds = time.perf_counter() - cleanup_start
+    
+    for item in stored:
+        item["puzzleId"] = f"{item['gameType']}_{item['date']}"
+        item["payloadVersion"] = writer.payload_version(item["gameType"])
+        item["canonicalHash"] = f"{item['canonicalHash'] & 0xFFFFFFFFFFFFFFFF:016x}"
+    for puzzle_id in sorted(existing):
+        game_type, date_str = puzzle_id.rsplit("_", 1)
+        items.append({
+            "gameType": game_type,
+            "date": date_str,
+            "puzzleId": puzzle_id,
+            "success": True,
+            "alreadyExists": True
+        })
+    items.sort(key=lambda item: (item["gameType"], item["date"]))
+    
+    failed = sum(1 for item in items if not item["success"])
+    return {
+        "success": failed == 0,
+        "message": f"Batch stored {len(stored)} puzzle(s), {len(existing)} already existed, {failed} failed",
+        "generated": len(stored),
+        "alreadyExisted": len(existing),
+        "failed": failed,
+        "deletedOldPuzzles": deleted,
+        "cascadeDelete": cascade_deletes,
+        "workers": max(processes, 1),
+        "timings": {
+            "generateSeconds": round(generate_seconds, 4),
+            "writeSeconds": round(write_seconds, 4),
+            "cleanupSeconds": round(cleanup_seconds, 4),
+            "totalSeconds": round(time.perf_counter() - batch_start, 4)
+        },
+        "deadline": deadline.usage(),
+        "items": items
+    }
+
+
+def _generate_and_store_puzzle(
+    game_type: str,
+    date_str: str,
+    force: bool = False,
+    difficulty: Optional[str] = None,
+    deadline: Optional[Deadline] = None
+) -> Dict[str, Any]:
     """
     Generate and store a puzzle in Firestore.
     
@@ -124,106 +526,613 @@ def _generate_and_store_puzzle(game_type: str, date_str: str, force: bool = Fals
         game_type: Game type string
         date_str: Date string
         force: If True, regenerate even if puzzle exists
+        difficulty: Requested difficulty band; the generator picks one if None
+        deadline: Request deadline (none if None); generation stops
+            FIRESTORE_RESERVE_SECONDS before it
     
     Returns:
         Dictionary with success status and details
     """
-    writer = FirestoreWriter(db)
+    metrics.start(game_type, date_str)
+    _last_generation.set({})
+    deadline = deadline or NO_DEADLINE
+    writer = _get_writer()
     
     # Check if puzzle already exists (unless forcing)
-    if not force and writer.puzzle_exists(game_type, date_str):
-        return {
-            "success": True,
-            "puzzleId": f"{game_type}_{date_str}",
-            "message": "Puzzle already exists (not regenerated). Use --force to regenerate.",
-            "alreadyExists": True
-        }
+    if not force:
+        with metrics.span("existsCheck"):
+            exists = writer.puzzle_exists(game_type, date_str)
+        if exists:
+            return _finish_request(deadline, {
+                "success": True,
+                "puzzleId": f"{game_type}_{date_str}",
+                "message": "Puzzle already exists (not regenerated). Use --force to regenerate.",
+                "alreadyExists": True
+            })
     
     print(f"🎮 Generating {game_type} puzzle for {date_str}...")
     
-    # Generate with retry logic (up to 3 attempts)
-    generator = GENERATORS[game_type]
-    validator = VALIDATORS.get(game_type)  # ZIP doesn't have a validator
-    max_attempts = 5  # More attempts to get valid puzzle
-    payload = None
+    # Canonical hashes of earlier puzzles, to reject equivalent ones
+    with metrics.span("indexLoad"):
+        puzzle_index = load_index(writer, game_type, PUZZLE_INDEX_PATH)
     
-    for attempt in range(1, max_attempts + 1):
-        try:
-            print(f"   Attempt {attempt}/{max_attempts}...")
-            payload = generator.generate_payload(date_str)
-            print(f"✅ Payload generated")
-            
-            # Validate payload if validator exists
-            if validator:
-                is_valid, error_msg = validator.validate_payload(payload)
-                
-                if is_valid:
-                    print(f"✅ Payload validated")
-                    break
-                else:
-                    print(f"❌ Validation failed: {error_msg}")
-                    if attempt < max_attempts:
-                        print(f"   Retrying with new generation...")
-                        continue
-                    else:
-                        return {
-                            "success": False,
-                            "error": f"Validation failed after {max_attempts} attempts: {error_msg}"
-                        }
-            else:
-                # No validator - basic structure check passed
-                print(f"✅ Basic structure validated")
-                break
-        except Exception as e:
-            print(f"❌ Generation failed: {e}")
-            if attempt < max_attempts:
-                print(f"   Retrying...")
-                continue
-            else:
-                return {
-                    "success": False,
-                    "error": f"Failed to generate puzzle after {max_attempts} attempts: {str(e)}"
-                }
+    with metrics.span("generation"):
+        payload, source, canonical_hash, error = _generate_unique_payload(
+            game_type, date_str, puzzle_index, difficulty,
+            deadline=deadline.reserve(FIRESTORE_RESERVE_SECONDS)
+        )
+    if payload is None:
+        return _finish_request(deadline, {
+            "success": False,
+            "error": error
+        })
     
     print(f"✅ Payload validated")
     
     # 3. Delete old puzzles for this game type (keep only today's puzzle)
     # This also deletes all associated user results to maintain data consistency
-    deleted_count = writer.delete_old_puzzles(game_type, date_str)
+    with metrics.span("cascadeDelete"):
+        deleted_count = writer.delete_old_puzzles(game_type, date_str)
     
     # 4. Write new puzzle to Firestore
-    puzzle_id = writer.write_puzzle(game_type, date_str, payload)
+    with metrics.span("write"):
+        puzzle_id = writer.write_puzzle(game_type, date_str, payload)
+    
+    # 5. Record its canonical hash so equivalent puzzles are never reused
+    with metrics.span("indexUpdate"):
+        if PUZZLE_INDEX_PATH:
+            puzzle_index.add(canonical_hash)
+            puzzle_index.save(PUZZLE_INDEX_PATH)
+        else:
+            writer.add_puzzle_hash(game_type, canonical_hash)
     
     # Build success message with appropriate stats
     result_data = {
         "success": True,
         "puzzleId": puzzle_id,
         "message": "Puzzle generated and stored successfully (old puzzles and results cleaned up)",
-        "deletedOldPuzzles": deleted_count
+        "deletedOldPuzzles": deleted_count,
+        "cascadeDelete": writer.last_delete,
+        "source": source,
+        "payloadVersion": writer.payload_version(game_type),
+        "canonicalHash": f"{canonical_hash & 0xFFFFFFFFFFFFFFFF:016x}"
+    }
+    result_data.update(_puzzle_stats(game_type, payload, source))
+    
+    return _finish_request(deadline, result_data)
+
+
+def _finish_request(deadline: Deadline, result: Dict[str, Any]) -> Dict[str, Any]:
+    """Add the deadline budget used and (if instrumentation is on) the request's metrics"""
+    result["deadline"] = deadline.usage()
+    request_metrics = metrics.finish()
+    if request_metrics is not None:
+        result["metrics"] = request_metrics
+    return result
+
+
+def _run_async(coro):
+    """Run a coroutine on the instance's event loop thread and wait for its result"""
+    import asyncio
+    
+    global _async_loop
+    with _async_loop_lock:
+        if _async_loop is None:
+            _async_loop = asyncio.new_event_loop()
+            threading.Thread(target=_async_loop.run_forever, name="async-pipeline", daemon=True).start()
+    return asyncio.run_coroutine_threadsafe(coro, _async_loop).result()
+
+
+def _get_async_db():
+    """Async Firestore client, created on first use"""
+    global _async_db
+    if _async_db is None:
+        from firebase_admin import firestore_async
+        _init_firebase()
+        _async_db = firestore_async.client()
+    return _async_db
+
+
+async def _generate_and_store_puzzle_async(
+    game_type: str,
+    date_str: str,
+    force: bool = False,
+    difficulty: Optional[str] = None,
+    deadline: Optional[Deadline] = None
+) -> Dict[str, Any]:
+    """
+    Async variant of _generate_and_store_puzzle() with the same result.
+    
+    Generation runs in an executor so Firestore I/O overlaps it: the first
+    candidate is generated speculatively while the existence check and the
+    duplicate index read are in flight, and old puzzles are deleted
+    concurrently with the write and the hash update. Speculation is skipped
+    when the puzzle bank serves the game type, so an existing puzzle never
+    consumes a bank entry.
+    
+    Returns:
+        Dictionary with success status and details
+    """
+    import asyncio
+    import itertools
+    from async_firestore_writer import AsyncFirestoreWriter
+    
+    metrics.start(game_type, date_str)
+    _last_generation.set({})
+    deadline = deadline or NO_DEADLINE
+    writer = AsyncFirestoreWriter(_get_async_db(), PAYLOAD_VERSIONS)
+    loop = asyncio.get_running_loop()
+    generation_deadline = deadline.reserve(FIRESTORE_RESERVE_SECONDS)
+    candidates = _payload_candidates(game_type, date_str, difficulty, generation_deadline)
+    
+    bank = _get_puzzle_bank()
+    speculative = None
+    if bank is None or not bank.has_game_type(game_type):
+        speculative = _in_executor(loop, next, candidates)
+    
+    exists, puzzle_index = await asyncio.gather(
+        _timed("existsCheck", writer.puzzle_exists(game_type, date_str)) if not force else _resolved(False),
+        _timed("indexLoad", _load_index_async(writer, game_type, loop)),
+    )
+    if exists:
+        # Discard the speculative candidate: expiring its deadline makes the
+        # generator return early, and waiting for it keeps it from running on
+        # after the response (cancelling an executor future does not stop a
+        # running thread)
+        if speculative is not None:
+            generation_deadline.expire()
+            await asyncio.wait([speculative])
+        return _finish_request(deadline, {
+            "success": True,
+            "puzzleId": f"{game_type}_{date_str}",
+            "message": "Puzzle already exists (not regenerated). Use --force to regenerate.",
+            "alreadyExists": True
+        })
+    
+    print(f"🎮 Generating {game_type} puzzle for {date_str}...")
+    
+    with metrics.span("generationWait"):
+        if speculative is not None:
+            candidates = itertools.chain([await speculative], candidates)
+        payload, source, canonical_hash, error = await _in_executor(
+            loop, _generate_unique_payload, game_type, date_str, puzzle_index, difficulty, candidates,
+            generation_deadline
+        )
+    if payload is None:
+        return _finish_request(deadline, {
+            "success": False,
+            "error": error
+        })
+    
+    # Delete old puzzles (never today's) while the new one and its hash are
+    # written. The local index file is only saved once the write succeeded
+    record_hash = _resolved(None) if PUZZLE_INDEX_PATH else writer.add_puzzle_hash(game_type, canonical_hash)
+    deleted_count, puzzle_id, _ = await asyncio.gather(
+        _timed("cascadeDelete", writer.delete_old_puzzles(game_type, date_str)),
+        _timed("write", writer.write_puzzle(game_type, date_str, payload)),
+        _timed("indexUpdate", record_hash),
+    )
+    if PUZZLE_INDEX_PATH:
+        puzzle_index.add(canonical_hash)
+        await _timed("indexUpdate", _in_executor(loop, puzzle_index.save, PUZZLE_INDEX_PATH))
+    
+    result_data = {
+        "success": True,
+        "puzzleId": puzzle_id,
+        "message": "Puzzle generated and stored successfully (old puzzles and results cleaned up)",
+        "deletedOldPuzzles": deleted_count,
+        "cascadeDelete": writer.last_delete,
+        "source": source,
+        "payloadVersion": writer.payload_version(game_type),
+        "canonicalHash": f"{canonical_hash & 0xFFFFFFFFFFFFFFFF:016x}"
     }
+    result_data.update(_puzzle_stats(game_type, payload, source))
+    
+    return _finish_request(deadline, result_data)
+
+
+def _in_executor(loop, func, *args):
+    """loop.run_in_executor() in a copy of the current context, so the thread
+    records into the request's metrics and _last_generation"""
+    return loop.run_in_executor(None, functools.partial(contextvars.copy_context().run, func, *args))
+
+
+async def _timed(name: str, awaitable):
+    """Await inside a metrics span, so concurrent steps are timed separately"""
+    with metrics.span(name):
+        return await awaitable
+
+
+async def _load_index_async(writer: "AsyncFirestoreWriter", game_type: str, loop) -> PuzzleIndex:
+    """Async load_index(): local file (read in an executor) if PUZZLE_INDEX_PATH
+    is set, else Firestore"""
+    if PUZZLE_INDEX_PATH:
+        return await _in_executor(loop, PuzzleIndex.load, PUZZLE_INDEX_PATH)
+    return PuzzleIndex(await writer.get_puzzle_hashes(game_type))
+
+
+async def _resolved(value):
+    """Awaitable that returns value, for optional steps inside asyncio.gather()"""
+    return value
+
+
+def _generate_unique_payload(
+    game_type: str,
+    date_str: str,
+    puzzle_index: PuzzleIndex,
+    difficulty: Optional[str] = None,
+    candidates: Optional[Iterator[Tuple[Optional[Dict[str, Any]], str, Optional[str]]]] = None,
+    deadline: Optional[Deadline] = None
+) -> Tuple[Optional[Dict[str, Any]], str, Optional[int], Optional[str]]:
+    """
+    Get a validated payload that is not equivalent to any puzzle in the index.
+    
+    Args:
+        candidates: Candidate stream to draw from (see _payload_candidates),
+            e.g. one whose first candidate was generated speculatively
+        deadline: Generation deadline; no duplicate is regenerated after it
+    
+    Returns:
+        (payload, source, canonical_hash, error) - payload is None on failure
+    """
+    deadline = deadline or NO_DEADLINE
+    if candidates is None:
+        candidates = _payload_candidates(game_type, date_str, difficulty, deadline)
+    
+    for attempt in range(1, MAX_DUPLICATE_ATTEMPTS + 1):
+        payload, source, error = next(candidates)
+        if payload is None:
+            return None, source, None, error
+        
+        canonical_hash = puzzle_hash(game_type, payload)
+        if canonical_hash not in puzzle_index:
+            return payload, source, canonical_hash, None
+        metrics.count("duplicateRetries")
+        if deadline.expired():
+            return None, source, None, f"Deadline reached after {attempt} duplicate(s) of earlier puzzles"
+        print(f"♻️  Equivalent puzzle was already used ({attempt}/{MAX_DUPLICATE_ATTEMPTS}), regenerating...")
+    
+    return None, source, None, f"Only generated duplicates of earlier puzzles after {MAX_DUPLICATE_ATTEMPTS} attempts"
+
+
+def _payload_candidates(
+    game_type: str,
+    date_str: str,
+    difficulty: Optional[str] = None,
+    deadline: Optional[Deadline] = None
+) -> Iterator[Tuple[Optional[Dict[str, Any]], str, Optional[str]]]:
+    """Endless stream of _next_payload() results for one puzzle"""
+    # In seeded mode every attempt draws its seed from one per-date sequence
+    seed_rng = None
+    if PUZZLE_SEED_SALT is not None:
+        seed_rng = random.Random(derive_seed(game_type, date_str, PUZZLE_SEED_SALT))
+    
+    while True:
+        yield _next_payload(game_type, date_str, seed_rng, difficulty, deadline)
+
+
+def _generation_stats() -> Dict[str, Any]:
+    """The current request's _last_generation dict (a new one outside a request)"""
+    stats = _last_generation.get(None)
+    if stats is None:
+        stats = {}
+        _last_generation.set(stats)
+    return stats
+
+
+def _puzzle_stats(game_type: str, payload: Dict[str, Any], source: str) -> Dict[str, Any]:
+    """Seed and game-specific stats of a generated payload for the response"""
+    stats: Dict[str, Any] = {}
+    if "seed" in payload:
+        stats["seed"] = payload["seed"]
+    if source == "generator":
+        # Winning attempt, wall time, solver nodes, deadlineHit and ZIP grade
+        stats.update(_generation_stats())
     
-    # Add game-specific stats
-    if game_type == "MINI_SUDOKU_6X6":
-        result_data["givens"] = sum(1 for row in payload["initialBoard"] for cell in row if cell != 0)
+    if game_type in ("MINI_SUDOKU_6X6", "SUDOKU_9X9"):
+        stats["givens"] = sum(1 for row in payload["initialBoard"] for cell in row if cell != 0)
+        stats["difficulty"] = payload["difficulty"]
+        stats["difficultyScore"] = payload["difficultyScore"]
     elif game_type == "ZIP":
-        result_data["dots"] = len(payload.get("dots", []))
+        stats["dots"] = len(payload.get("dots", []))
+        if "difficulty" in payload:
+            stats["difficulty"] = payload["difficulty"]
+            stats["difficultyScore"] = payload["difficultyScore"]
     
-    return result_data
+    return stats
+
+
+def _next_payload(
+    game_type: str,
+    date_str: str,
+    seed_rng: Optional[random.Random] = None,
+    difficulty: Optional[str] = None,
+    deadline: Optional[Deadline] = None
+) -> Tuple[Optional[Dict[str, Any]], str, Optional[str]]:
+    """
+    Get the next candidate payload, from the puzzle bank if possible.
+    
+    Args:
+        seed_rng: Per-date seed sequence in seeded mode, None otherwise
+        difficulty: Requested difficulty band, or None
+        deadline: Generation deadline, or None for no limit
+    
+    Returns:
+        (payload, source, error) where source is "bank" or "generator"
+    """
+    # Serve from the pre-generated bank when one is configured
+    bank = _get_puzzle_bank()
+    if bank is not None and bank.has_game_type(game_type):
+        try:
+            payload = bank.take(game_type, date_str, difficulty)
+        except OSError as e:
+            # Read-only deploy without a writable PUZZLE_BANK_LEDGER
+            print(f"⚠️  Puzzle bank ledger not writable ({e}), generating online...")
+        else:
+            if payload is not None:
+                metrics.count("bankHits")
+                print(f"🏦 Served puzzle from bank: {PUZZLE_BANK_PATH}")
+                return payload, "bank", None
+            print(f"⚠️  Puzzle bank has no unused {game_type} puzzles, generating online...")
+    
+    payload, error = _generate_validated_payload(game_type, date_str, seed_rng, difficulty, deadline)
+    return payload, "generator", error
+
+
+def _generate_validated_payload(
+    game_type: str,
+    date_str: str,
+    seed_rng: Optional[random.Random] = None,
+    difficulty: Optional[str] = None,
+    deadline: Optional[Deadline] = None
+) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Generate a payload, retrying until it passes validation.
+    
+    Attempts run one after another, or with PARALLEL_CANDIDATES > 1 on a
+    multi-core instance, raced in a process pool. The winning attempt and
+    wall time are kept in _last_generation for the response.
+    
+    Seeded attempts are not raced: the stored puzzle must be the lowest
+    valid attempt, so a race would wait on attempt 1 anyway and only add
+    the pool round trip (0.29 s vs 0.14 s measured for 6x6 Sudoku).
+    
+    Args:
+        seed_rng: Per-date seed sequence; each attempt generates from its next
+            seed and records it in the payload as "seed" (hex)
+        difficulty: Requested difficulty band, or None for the generator's pick
+        deadline: Generation deadline; each attempt returns its best puzzle
+            so far once it expires, and no retry starts after it
+    
+    Returns:
+        (payload, None) on success, (None, error_message) on failure
+    """
+    max_attempts = 5  # More attempts to get valid puzzle
+    deadline = deadline or NO_DEADLINE
+    start = time.perf_counter()
+    generation_stats = _generation_stats()
+    generation_stats.clear()
+    
+    if PARALLEL_CANDIDATES > 1 and seed_rng is None and not _in_pool_worker and (os.cpu_count() or 1) > 1:
+        payload, error, attempt, attempt_stats = _race_candidates(
+            game_type, date_str, difficulty, max_attempts, deadline
+        )
+    else:
+        payload, error, attempt, attempt_stats = None, None, 0, {}
+        for attempt in range(1, max_attempts + 1):
+            if attempt > 1 and deadline.expired():
+                print(f"⏰ Deadline reached, not retrying")
+                attempt -= 1
+                break
+            print(f"   Attempt {attempt}/{max_attempts}...")
+            seed = seed_rng.getrandbits(64) if seed_rng is not None else None
+            payload, error, attempt_stats = _run_attempt(game_type, date_str, seed, difficulty, deadline)
+            if payload is not None:
+                break
+            if attempt < max_attempts:
+                print(f"   Retrying with new generation...")
+    
+    if payload is None:
+        return None, f"No valid puzzle after {attempt} attempts: {error}"
+    
+    generation_stats.update(attempt_stats)
+    generation_stats["winningAttempt"] = attempt
+    generation_stats["generationWallSeconds"] = round(time.perf_counter() - start, 4)
+    return payload, None
+
+
+def _run_attempt(
+    game_type: str,
+    date_str: str,
+    seed: Optional[int],
+    difficulty: Optional[str],
+    deadline: Deadline = NO_DEADLINE
+) -> Tuple[Optional[Dict[str, Any]], Optional[str], Dict[str, Any]]:
+    """
+    Generate and validate one candidate payload.
+    
+    The game type's generator and validator are shared by every request in
+    the process, so the attempt holds the game type's lock and copies the
+    generator's stats before releasing it.
+    
+    Args:
+        seed: Seed for this attempt in seeded mode, None for fresh randomness
+        deadline: Passed to the generator, which stops improving the puzzle
+            once it expires
+    
+    Returns:
+        (payload, None, stats) if it is valid, (None, error_message, stats)
+        otherwise; stats holds solverNodes, deadlineHit and the ZIP grade
+    """
+    with _generator_locks[game_type]:
+        return _run_attempt_locked(game_type, date_str, seed, difficulty, deadline)
+
+
+def _run_attempt_locked(
+    game_type: str,
+    date_str: str,
+    seed: Optional[int],
+    difficulty: Optional[str],
+    deadline: Deadline
+) -> Tuple[Optional[Dict[str, Any]], Optional[str], Dict[str, Any]]:
+    """_run_attempt with the game type's lock held"""
+    generator = GENERATORS[game_type]
+    validator = VALIDATORS.get(game_type)
+    metrics.count("attempts")
+    try:
+        with metrics.span("generationAttempt"):
+            if seed is not None:
+                payload = generator.generate_payload(
+                    date_str, difficulty=difficulty, rng=random.Random(seed), deadline=deadline
+                )
+                # A puzzle cut short by a time limit depends on timing, so its
+                # seed would not reproduce it; record the seed only otherwise
+                timed_out = getattr(generator, "last_deadline_hit", False) or getattr(generator, "last_timed_out", False)
+                if not timed_out:
+                    payload["seed"] = f"{seed:016x}"
+            else:
+                payload = generator.generate_payload(date_str, difficulty=difficulty, deadline=deadline)
+        stats: Dict[str, Any] = {
+            "solverNodes": getattr(generator, "last_solver_nodes", 0),
+            "deadlineHit": getattr(generator, "last_deadline_hit", False),
+        }
+        stats.update(getattr(generator, "last_grade", None) or {})
+        missed_difficulty = getattr(generator, "last_missed_difficulty", None)
+        if missed_difficulty is not None:
+            # No attempt reached the requested band; the payload names the band it is in
+            stats["missedDifficulty"] = missed_difficulty
+            metrics.count("difficultyMisses")
+        metrics.count("solverNodes", stats["solverNodes"])
+        for path_source, count in getattr(generator, "last_path_sources", {}).items():
+            metrics.count(path_source, count)
+        if stats["deadlineHit"]:
+            metrics.count("deadlineDegraded")
+            print(f"⏰ Deadline reached, using the best puzzle found so far")
+        print(f"✅ Payload generated")
+    except Exception as e:
+        metrics.count("generationErrors")
+        print(f"❌ Generation failed: {e}")
+        return None, f"Generation failed: {e}", {}
+    
+    # Validate payload if validator exists
+    if validator:
+        with metrics.span("validation"):
+            is_valid, error_msg = validator.validate_payload(payload)
+        if not is_valid:
+            metrics.count("validationFailures")
+            print(f"❌ Validation failed: {error_msg}")
+            return None, f"Validation failed: {error_msg}", stats
+        print(f"✅ Payload validated")
+    else:
+        # No validator - basic structure check passed
+        print(f"✅ Basic structure validated")
+    return payload, None, stats
+
+
+class _RaceDeadline(Deadline):
+    """Deadline of a raced candidate that also expires once its round is decided"""
+    
+    __slots__ = ("round",)
+    
+    def __init__(self, deadline: Deadline, race_round: int):
+        super().__init__(start=deadline.start)
+        self.at = deadline.at
+        self.round = race_round
+    
+    def remaining(self) -> float:
+        return super().remaining() if _race_round.value == self.round else -1.0
+    
+    def expired(self) -> bool:
+        return _race_round.value != self.round or super().expired()
+
+
+def _run_candidate(job: Tuple[str, str, Optional[str], int, Deadline, int]) -> Dict[str, Any]:
+    """Pool worker: run one raced attempt and return it with its generator stats"""
+    game_type, date_str, difficulty, attempt, deadline, race_round = job
+    payload, error, stats = _run_attempt(
+        game_type, date_str, None, difficulty, _RaceDeadline(deadline, race_round)
+    )
+    return {"attempt": attempt, "payload": payload, "error": error, "stats": stats}
+
+
+def _race_candidates(
+    game_type: str,
+    date_str: str,
+    difficulty: Optional[str],
+    max_attempts: int,
+    deadline: Deadline = NO_DEADLINE
+) -> Tuple[Optional[Dict[str, Any]], Optional[str], int, Dict[str, Any]]:
+    """
+    Race attempts on the worker pool; the first valid one wins.
+    
+    Rounds of PARALLEL_CANDIDATES attempts run until one is valid or
+    max_attempts have run. Once a round is decided its candidates that are
+    still running see their deadline expire, so they stop at the
+    generator's next deadline check and free their worker. No new round
+    starts after the deadline. Seeded mode never races (see
+    _generate_validated_payload).
+    
+    Returns:
+        (payload, error, attempt, stats) - the winning attempt and its
+        generator stats, or on failure the number of attempts that ran
+    """
+    error = None
+    attempt = 1
+    while attempt <= max_attempts:
+        if attempt > 1 and deadline.expired():
+            print(f"⏰ Deadline reached, not starting another round")
+            break
+        count = min(PARALLEL_CANDIDATES, max_attempts - attempt + 1)
+        processes = min(count, PARALLEL_CANDIDATES, os.cpu_count() or 1)
+        print(f"   Racing attempts {attempt}-{attempt + count - 1}/{max_attempts} on {processes} worker(s)...")
+        
+        finished: Dict[int, Dict[str, Any]] = {}
+        winner = None
+        with _pool_lock:
+            pool = _get_worker_pool()
+            _race_round.value += 1
+            jobs = [
+                (game_type, date_str, difficulty, attempt + i, deadline, _race_round.value)
+                for i in range(count)
+            ]
+            try:
+                for result in pool.imap_unordered(_run_candidate, jobs):
+                    finished[result["attempt"]] = result
+                    if result["payload"] is not None:
+                        winner = result
+                        break
+            finally:
+                # Cancel the round's remaining candidates
+                _race_round.value += 1
+        
+        # Candidates ran in the workers, so count them here
+        metrics.count("attempts", len(finished))
+        metrics.count("solverNodes", sum(result["stats"].get("solverNodes", 0) for result in finished.values()))
+        
+        if winner is not None:
+            _generation_stats()["candidates"] = len(finished)
+            print(f"🏁 Attempt {winner['attempt']} won the race")
+            return winner["payload"], None, winner["attempt"], winner["stats"]
+        
+        error = finished[max(finished)]["error"]
+        attempt += count
+    
+    return None, error, attempt - 1, {}
 
 
 def main_cli():
     """Command-line interface for local testing"""
     import argparse
-    from dotenv import load_dotenv
-    
-    # Load environment variables
-    load_dotenv()
     
     parser = argparse.ArgumentParser(description='Generate BrainBurst puzzles')
     parser.add_argument('--test', action='store_true', help='Generate a test puzzle')
     parser.add_argument('--game-type', default='MINI_SUDOKU_6X6', help='Game type')
     parser.add_argument('--date', help='Date (YYYY-MM-DD), defaults to today')
     parser.add_argument('--force', action='store_true', help='Force regeneration even if puzzle exists')
+    parser.add_argument('--difficulty', choices=DIFFICULTIES, help='Difficulty band, random if omitted')
+    parser.add_argument('--end-date', help='Batch mode: generate every date from --date to this one')
+    parser.add_argument('--game-types', help='Batch mode: comma-separated game types (default: all)')
+    parser.add_argument('--async-pipeline', action='store_true', help='Use the async Firestore pipeline')
     
     args = parser.parse_args()
     
@@ -233,10 +1142,27 @@ def main_cli():
         date_str = args.date
     
     print(f"\n🚀 BrainBurst Puzzle Generator")
+    
+    if args.end_date or args.game_types:
+        game_types = args.game_types.split(',') if args.game_types else list(GENERATORS)
+        dates = _date_range(date_str, args.end_date or date_str)
+        print(f"📅 Dates: {dates[0]} to {dates[-1]}")
+        print(f"🎮 Game Types: {', '.join(game_types)}\n")
+        result = _generate_batch(game_types, dates, force=args.force, difficulty=args.difficulty)
+        print(f"\n📊 Result:")
+        print(json.dumps(result, indent=2))
+        print(f"\n{'✅' if result['success'] else '❌'} {result['message']}")
+        return
+    
     print(f"📅 Date: {date_str}")
     print(f"🎮 Game Type: {args.game_type}\n")
     
-    result = _generate_and_store_puzzle(args.game_type, date_str, force=args.force)
+    if args.async_pipeline or ASYNC_PIPELINE:
+        result = _run_async(_generate_and_store_puzzle_async(
+            args.game_type, date_str, force=args.force, difficulty=args.difficulty
+        ))
+    else:
+        result = _generate_and_store_puzzle(args.game_type, date_str, force=args.force, difficulty=args.difficulty)
     
     print(f"\n📊 Result:")
     print(json.dumps(result, indent=2))
@@ -0,0 +1,138 @@
+"""
+Versioned payload encodings for the puzzles collection.
+
+Version 1 is the original JSON payload. Version 2 is a compact form of the
+same data that clients parse much faster:
+
+    Sudoku: {"size": 6, "blockRows": 2, "blockCols": 3,
+             "initial": "100203...", "solution": "143256...",
+             "difficulty": "hard", "difficultyScore": 24, "seed": "..."}
+        Boards are row-major digit strings, 0 = empty. Boards larger than
+        9×9 use A-Z for 10 and up.
+
+    ZIP: {"size": 6, "start": 0, "path": "RRRRRDLLLLLD...",
+          "dots": [0, 7, 35], "walls": "1a04", "difficulty": "hard",
+          "difficultyScore": 140}
+        start is the first cell of the solution path (row * size + col),
+        path its steps as U/R/D/L, dots the cells of dots 1..n in order and
+        walls a hex bitmask over interior edges (see generators.puzzle_encoding).
+        Rectangular grids carry "rows" and "cols" instead of "size" and
+        number cells row * cols + col.
+
+The version is stored next to payloadJson as payloadVersion; documents
+without the field are version 1.
+"""
+from typing import Any, Dict, List
+
+from generators.puzzle_encoding import (
+    DIRECTION_LETTERS, mask_to_walls, moves_to_path, path_to_moves, walls_to_mask, zip_dimensions
+)
+
+LEGACY_PAYLOAD_VERSION = 1
+COMPACT_PAYLOAD_VERSION = 2
+
+DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_DIGIT_VALUES = {ch: value for value, ch in enumerate(DIGITS)}
+_MOVE_CODES = {letter: move for move, letter in enumerate(DIRECTION_LETTERS)}
+
+
+def encode_payload(payload: Dict[str, Any], version: int) -> Dict[str, Any]:
+    """Convert a generator payload to the given payload version"""
+    if version == LEGACY_PAYLOAD_VERSION:
+        return payload
+    if version != COMPACT_PAYLOAD_VERSION:
+        raise ValueError(f"Unknown payload version: {version}")
+    if "initialBoard" in payload:
+        return _encode_sudoku(payload)
+    return _encode_zip(payload)
+
+
+def decode_payload(data: Dict[str, Any], version: int) -> Dict[str, Any]:
+    """Convert a stored payload of the given version back to the generator format"""
+    if version == LEGACY_PAYLOAD_VERSION:
+        return data
+    if version != COMPACT_PAYLOAD_VERSION:
+        raise ValueError(f"Unknown payload version: {version}")
+    if "initial" in data:
+        return _decode_sudoku(data)
+    return _decode_zip(data)
+
+
+def board_to_string(board: List[List[int]]) -> str:
+    """Row-major digit string of a board (0 = empty, A-Z for 10 and up)"""
+    return "".join(DIGITS[cell] for row in board for cell in row)
+
+
+def string_to_board(digits: str, size: int) -> List[List[int]]:
+    """Inverse of board_to_string()"""
+    return [
+        list(map(_DIGIT_VALUES.__getitem__, digits[r * size:(r + 1) * size]))
+        for r in range(size)
+    ]
+
+
+def _encode_sudoku(payload: Dict[str, Any]) -> Dict[str, Any]:
+    encoded = {
+        "size": payload["size"],
+        "blockRows": payload["blockRows"],
+        "blockCols": payload["blockCols"],
+        "initial": board_to_string(payload["initialBoard"]),
+        "solution": board_to_string(payload["solutionBoard"]),
+    }
+    for key in ("difficulty", "difficultyScore", "seed"):
+        if key in payload:
+            encoded[key] = payload[key]
+    return encoded
+
+
+def _decode_sudoku(data: Dict[str, Any]) -> Dict[str, Any]:
+    size = data["size"]
+    payload = {
+        "size": size,
+        "blockRows": data["blockRows"],
+        "blockCols": data["blockCols"],
+        "initialBoard": string_to_board(data["initial"], size),
+        "solutionBoard": string_to_board(data["solution"], size),
+    }
+    for key in ("difficulty", "difficultyScore", "seed"):
+        if key in data:
+            payload[key] = data[key]
+    return payload
+
+
+def _encode_zip(payload: Dict[str, Any]) -> Dict[str, Any]:
+    rows, cols = zip_dimensions(payload)
+    path = [(cell["row"], cell["col"]) for cell in payload["solution"]]
+    dots = sorted(payload["dots"], key=lambda dot: dot["index"])
+    encoded = {"size": rows} if rows == cols else {"rows": rows, "cols": cols}
+    encoded.update({
+        "start": path[0][0] * cols + path[0][1],
+        "path": "".join(DIRECTION_LETTERS[move] for move in path_to_moves(path)),
+        "dots": [dot["row"] * cols + dot["col"] for dot in dots],
+    })
+    if payload.get("walls"):
+        encoded["walls"] = f"{walls_to_mask(payload['walls'], rows, cols):x}"
+    for key in ("difficulty", "difficultyScore", "seed"):
+        if key in payload:
+            encoded[key] = payload[key]
+    return encoded
+
+
+def _decode_zip(data: Dict[str, Any]) -> Dict[str, Any]:
+    rows, cols = zip_dimensions(data)
+    start = divmod(data["start"], cols)
+    path = moves_to_path(start, list(map(_MOVE_CODES.__getitem__, data["path"])))
+    payload = {"size": rows} if rows == cols else {"rows": rows, "cols": cols}
+    payload.update({
+        "dots": [
+            {"row": cell // cols, "col": cell % cols, "index": i + 1}
+            for i, cell in enumerate(data["dots"])
+        ],
+        "solution": [{"row": row, "col": col} for row, col in path],
+    })
+    if "walls" in data:
+        payload["walls"] = mask_to_walls(int(data["walls"], 16), rows, cols)
+    for key in ("difficulty", "difficultyScore", "seed"):
+        if key in data:
+            payload[key] = data[key]
+    return payload
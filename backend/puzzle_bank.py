@@ -0,0 +1,354 @@
+"""
+Offline puzzle bank - pre-generated puzzles in a compact, memory-mapped file.
+
+File layout (little-endian):
+    header   : magic "BBPB", version u16, section count u16
+    sections : one fixed-size entry per (game type, difficulty) - game type,
+               difficulty, board size, block rows/cols, record kind,
+               record size, entry count and byte offset of the records
+    records  : fixed-size records, so entry i of a section is a single
+               slice at offset + i * record_size
+
+Record kinds:
+    Sudoku : difficulty score u16, initial board and solution board as
+             one nibble per cell
+    ZIP    : difficulty score u16, start cell u8, path steps as 2-bit
+             directions, dot count u8, dot cells u8 × MAX_ZIP_DOTS, wall
+             bitmask over interior edges
+
+Records are filed under the difficulty their score falls in, which can be
+below the band a job asked for when the generator missed it.
+
+Consumed entries are tracked in a ledger file next to the bank (one bit per
+entry) so a puzzle is never served twice from the same ledger.
+
+Usage:
+    python puzzle_bank.py --output puzzles.bank --count 365
+"""
+import mmap
+import os
+import random
+import struct
+import time
+from datetime import date
+from multiprocessing import Pool
+from typing import Any, Dict, List, Optional, Tuple
+
+from generators.puzzle_encoding import (
+    moves_to_path,
+    pack_moves,
+    pack_nibbles,
+    path_to_moves,
+    unpack_moves,
+    unpack_nibbles,
+    wall_edge_count,
+    walls_to_mask,
+    mask_to_walls,
+)
+
+MAGIC = b"BBPB"
+VERSION = 2
+HEADER = struct.Struct("<4sHH")
+SECTION = struct.Struct("<16s8sBBBBHHIQ")
+
+KIND_SUDOKU = 0
+KIND_ZIP = 1
+MAX_ZIP_DOTS = 16
+
+# Game types the bank can hold: (kind, size, block_rows, block_cols, difficulties)
+BANK_GAME_TYPES = {
+    "MINI_SUDOKU_6X6": (KIND_SUDOKU, 6, 2, 3, ["medium", "hard", "expert"]),
+    "SUDOKU_9X9": (KIND_SUDOKU, 9, 3, 3, ["medium", "hard", "expert"]),
+    "ZIP": (KIND_ZIP, 6, 0, 0, ["medium", "hard", "expert"]),
+}
+
+
+def _record_size(kind: int, size: int) -> int:
+    cells = size * size
+    if kind == KIND_SUDOKU:
+        return 2 + 2 * ((cells + 1) // 2)
+    return 2 + 1 + (2 * (cells - 1) + 7) // 8 + 1 + MAX_ZIP_DOTS + (wall_edge_count(size, size) + 7) // 8
+
+
+def encode_record(kind: int, size: int, payload: Dict[str, Any]) -> bytes:
+    """Pack one generated payload into its fixed-size bank record"""
+    if kind == KIND_SUDOKU:
+        initial = [cell for row in payload["initialBoard"] for cell in row]
+        solution = [cell for row in payload["solutionBoard"] for cell in row]
+        return (
+            struct.pack("<H", payload.get("difficultyScore", 0))
+            + pack_nibbles(initial)
+            + pack_nibbles(solution)
+        )
+
+    path = [(cell["row"], cell["col"]) for cell in payload["solution"]]
+    dots = [dot["row"] * size + dot["col"] for dot in payload["dots"]]
+    wall_bytes = (wall_edge_count(size, size) + 7) // 8
+    walls = walls_to_mask(payload.get("walls", []), size, size)
+    return (
+        struct.pack("<H", payload.get("difficultyScore", 0))
+        + bytes([path[0][0] * size + path[0][1]])
+        + pack_moves(path_to_moves(path))
+        + bytes([len(dots)])
+        + bytes(dots + [0] * (MAX_ZIP_DOTS - len(dots)))
+        + walls.to_bytes(wall_bytes, "little")
+    )
+
+
+def decode_record(kind: int, size: int, block_rows: int, block_cols: int, difficulty: str, data: bytes) -> Dict[str, Any]:
+    """Rebuild the generator payload from a bank record"""
+    cells = size * size
+    if kind == KIND_SUDOKU:
+        score, = struct.unpack_from("<H", data)
+        board_bytes = (cells + 1) // 2
+        initial = unpack_nibbles(data[2:2 + board_bytes], cells)
+        solution = unpack_nibbles(data[2 + board_bytes:2 + 2 * board_bytes], cells)
+        return {
+            "size": size,
+            "blockRows": block_rows,
+            "blockCols": block_cols,
+            "initialBoard": [initial[r * size:(r + 1) * size] for r in range(size)],
+            "solutionBoard": [solution[r * size:(r + 1) * size] for r in range(size)],
+            "difficulty": difficulty,
+            "difficultyScore": score,
+        }
+
+    score, = struct.unpack_from("<H", data)
+    move_bytes = (2 * (cells - 1) + 7) // 8
+    start = divmod(data[2], size)
+    path = moves_to_path(start, unpack_moves(data[3:3 + move_bytes], cells - 1))
+    offset = 3 + move_bytes
+    dot_count = data[offset]
+    dot_cells = data[offset + 1:offset + 1 + dot_count]
+    walls = mask_to_walls(int.from_bytes(data[offset + 1 + MAX_ZIP_DOTS:], "little"), size, size)
+
+    payload = {
+        "size": size,
+        "dots": [
+            {"row": cell // size, "col": cell % size, "index": i + 1}
+            for i, cell in enumerate(dot_cells)
+        ],
+        "solution": [{"row": r, "col": c} for r, c in path],
+    }
+    if walls:
+        payload["walls"] = walls
+    payload["difficulty"] = difficulty
+    payload["difficultyScore"] = score
+    return payload
+
+
+class PuzzleBank:
+    """Read-only, memory-mapped view of a puzzle bank file"""
+
+    def __init__(self, path: str, ledger_path: Optional[str] = None):
+        """
+        Args:
+            path: Bank file written by write_bank()
+            ledger_path: Consumed-entry ledger (defaults to path + ".consumed")
+        """
+        self.path = path
+        self.ledger_path = ledger_path or path + ".consumed"
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, section_count = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Not a version {VERSION} puzzle bank: {path}")
+
+        # (game_type, difficulty) -> (kind, size, block_rows, block_cols, record_size, count, offset, ledger_offset)
+        self.sections: Dict[Tuple[str, str], Tuple[int, ...]] = {}
+        ledger_offset = 0
+        for i in range(section_count):
+            (game_type, difficulty, size, block_rows, block_cols, kind,
+             record_size, _, count, offset) = SECTION.unpack_from(self._map, HEADER.size + i * SECTION.size)
+            key = (game_type.rstrip(b"\0").decode(), difficulty.rstrip(b"\0").decode())
+            self.sections[key] = (kind, size, block_rows, block_cols, record_size, count, offset, ledger_offset)
+            ledger_offset += (count + 7) // 8
+
+        self._ledger = self._load_ledger(ledger_offset)
+
+    def close(self) -> None:
+        self._map.close()
+        self._file.close()
+
+    def has_game_type(self, game_type: str) -> bool:
+        return any(key[0] == game_type for key in self.sections)
+
+    def get(self, game_type: str, difficulty: str, index: int) -> Dict[str, Any]:
+        """Decode entry index of a section with a single slice of the mapped file"""
+        kind, size, block_rows, block_cols, record_size, count, offset, _ = self.sections[(game_type, difficulty)]
+        if not 0 <= index < count:
+            raise IndexError(f"{game_type}/{difficulty} has {count} entries, asked for {index}")
+        start = offset + index * record_size
+        return decode_record(kind, size, block_rows, block_cols, difficulty, self._map[start:start + record_size])
+
+    def take(self, game_type: str, date_str: str, difficulty: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Serve an unused puzzle for a date and mark it consumed.
+
+        The starting slot is derived from the date, so different days map to
+        different entries even on instances that do not share a ledger.
+
+        Returns:
+            The payload, or None if the bank has no unused entry left
+
+        Raises:
+            OSError: If the ledger cannot be written; the entry stays unused
+        """
+        difficulties = sorted(d for g, d in self.sections if g == game_type)
+        if not difficulties:
+            return None
+        day = date.fromisoformat(date_str).toordinal()
+        if difficulty is None:
+            difficulty = difficulties[day % len(difficulties)]
+        if (game_type, difficulty) not in self.sections:
+            return None
+
+        count = self.sections[(game_type, difficulty)][5]
+        ledger_offset = self.sections[(game_type, difficulty)][7]
+        for probe in range(count):
+            index = (day + probe) % count
+            byte, bit = ledger_offset + index // 8, 1 << (index % 8)
+            if not self._ledger[byte] & bit:
+                self._ledger[byte] |= bit
+                try:
+                    self._save_ledger()
+                except OSError:
+                    self._ledger[byte] &= ~bit
+                    raise
+                return self.get(game_type, difficulty, index)
+        return None
+
+    def remaining(self, game_type: str, difficulty: str) -> int:
+        """Number of entries of a section not yet consumed"""
+        _, _, _, _, _, count, _, ledger_offset = self.sections[(game_type, difficulty)]
+        used = sum(
+            1 for index in range(count)
+            if self._ledger[ledger_offset + index // 8] >> (index % 8) & 1
+        )
+        return count - used
+
+    def _load_ledger(self, size: int) -> bytearray:
+        if os.path.exists(self.ledger_path):
+            with open(self.ledger_path, "rb") as f:
+                data = bytearray(f.read())
+            if len(data) == size:
+                return data
+        return bytearray(size)
+
+    def _save_ledger(self) -> None:
+        tmp_path = self.ledger_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(self._ledger)
+        os.replace(tmp_path, self.ledger_path)
+
+
+def write_bank(path: str, sections: Dict[Tuple[str, str], List[bytes]]) -> None:
+    """Write records grouped by (game_type, difficulty) into a bank file"""
+    keys = sorted(sections)
+    offset = HEADER.size + SECTION.size * len(keys)
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(keys)))
+        for game_type, difficulty in keys:
+            kind, size, block_rows, block_cols, _ = BANK_GAME_TYPES[game_type]
+            record_size = _record_size(kind, size)
+            count = len(sections[(game_type, difficulty)])
+            f.write(SECTION.pack(
+                game_type.encode(), difficulty.encode(), size, block_rows, block_cols, kind,
+                record_size, 0, count, offset
+            ))
+            offset += record_size * count
+        for key in keys:
+            for record in sections[key]:
+                f.write(record)
+
+
+_worker_generators: Dict[str, Any] = {}
+
+
+def _generate_record(job: Tuple[str, str, int]) -> Tuple[str, str, Optional[bytes]]:
+    """Pool worker: generate and validate one puzzle, return its packed record"""
+    from generators import SudokuGenerator, ZipGenerator
+    from validators import SudokuValidator, ZipValidator
+
+    game_type, difficulty, seed = job
+    kind, size, block_rows, block_cols, _ = BANK_GAME_TYPES[game_type]
+
+    if game_type not in _worker_generators:
+        if kind == KIND_SUDOKU:
+            _worker_generators[game_type] = (
+                SudokuGenerator(size=size, block_rows=block_rows, block_cols=block_cols),
+                SudokuValidator(size=size, block_rows=block_rows, block_cols=block_cols),
+            )
+        else:
+            _worker_generators[game_type] = (ZipGenerator(rows=size), ZipValidator(rows=size))
+    generator, validator = _worker_generators[game_type]
+
+    payload = generator.generate_payload("bank", difficulty=difficulty, rng=random.Random(seed))
+
+    if validator:
+        is_valid, _ = validator.validate_payload(payload)
+        if not is_valid:
+            return game_type, difficulty, None
+    # File the record under the band its score is in, not the one asked for
+    return game_type, payload["difficulty"], encode_record(kind, size, payload)
+
+
+def build_bank(
+    path: str,
+    game_types: List[str],
+    count: int,
+    processes: Optional[int] = None,
+    seed: int = 0
+) -> Dict[Tuple[str, str], int]:
+    """
+    Generate count puzzles per game type and difficulty across all cores.
+
+    Returns:
+        Number of records written per (game_type, difficulty)
+    """
+    jobs = []
+    for game_type in game_types:
+        for difficulty in BANK_GAME_TYPES[game_type][4]:
+            jobs.extend((game_type, difficulty, seed * 1_000_003 + len(jobs) + i) for i in range(count))
+
+    sections: Dict[Tuple[str, str], List[bytes]] = {}
+    with Pool(processes=processes) as pool:
+        for game_type, difficulty, record in pool.imap_unordered(_generate_record, jobs, chunksize=8):
+            if record is not None:
+                sections.setdefault((game_type, difficulty), []).append(record)
+
+    write_bank(path, sections)
+    return {key: len(records) for key, records in sections.items()}
+
+
+def main_cli():
+    """Command-line interface for building a puzzle bank"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Pre-generate BrainBurst puzzles into a bank file')
+    parser.add_argument('--output', default='puzzles.bank', help='Bank file to write')
+    parser.add_argument('--game-type', action='append', choices=sorted(BANK_GAME_TYPES),
+                        help='Game type to include (repeatable, defaults to all)')
+    parser.add_argument('--count', type=int, default=365, help='Puzzles per game type and difficulty')
+    parser.add_argument('--processes', type=int, help='Worker processes (defaults to all cores)')
+    parser.add_argument('--seed', type=int, default=0, help='Base seed for generation')
+
+    args = parser.parse_args()
+    game_types = args.game_type or sorted(BANK_GAME_TYPES)
+
+    print(f"\n🏦 BrainBurst Puzzle Bank Builder")
+    print(f"🎮 Game Types: {', '.join(game_types)}")
+    print(f"🔢 Puzzles per difficulty: {args.count}\n")
+
+    start = time.time()
+    counts = build_bank(args.output, game_types, args.count, args.processes, args.seed)
+
+    for (game_type, difficulty), written in sorted(counts.items()):
+        print(f"   {game_type}/{difficulty}: {written} puzzles")
+    size_kb = os.path.getsize(args.output) / 1024
+    print(f"\n✅ Wrote {args.output} ({size_kb:.1f} KB) in {time.time() - start:.1f}s")
+
+
+if __name__ == '__main__':
+    main_cli()
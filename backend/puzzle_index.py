@@ -0,0 +1,183 @@
+"""
+Canonical forms and a compact hash index for detecting equivalent puzzles.
+
+Two Sudoku puzzles are equivalent when one maps to the other by permuting
+bands, rows inside a band, stacks, columns inside a stack, transposing
+(square blocks only) and relabeling digits. Two ZIP puzzles are equivalent
+when one maps to the other by one of the 8 grid symmetries, optionally
+with the path and dot order reversed.
+
+Every puzzle is reduced to the lexicographically smallest member of its
+equivalence class and hashed to a signed 64-bit integer, so the index of
+a year of daily puzzles is a few kilobytes.
+"""
+import hashlib
+import itertools
+import os
+import struct
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from generators.puzzle_encoding import zip_dimensions
+
+
+def canonical_sudoku(board: Sequence[Sequence[int]], block_rows: int, block_cols: int) -> bytes:
+    """
+    Canonical form of a Sudoku board (0 = empty) under its symmetry group.
+
+    Builds the smallest board row by row, keeping only the transformations
+    that tie for the smallest prefix so far. Digits are relabeled in order
+    of first appearance, so relabeling is covered without enumerating it.
+    """
+    size = len(board)
+    views = [[list(row) for row in board]]
+    if block_rows == block_cols:
+        views.append([list(col) for col in zip(*board)])
+
+    stacks = size // block_cols
+    col_perms = [
+        [stack * block_cols + i for stack, inner in zip(stack_order, inners) for i in inner]
+        for stack_order in itertools.permutations(range(stacks))
+        for inners in itertools.product(itertools.permutations(range(block_cols)), repeat=stacks)
+    ]
+
+    # (view, column permutation, rows used so far, digit labels)
+    states = [(view, perm, (), {}) for view in views for perm in col_perms]
+    canonical: List[int] = []
+
+    for _ in range(size):
+        best = None
+        next_states = []
+        for view, perm, used, labels in states:
+            for row in _next_rows(used, size, block_rows):
+                new_labels = dict(labels)
+                encoded = []
+                for c in perm:
+                    digit = view[row][c]
+                    if digit:
+                        if digit not in new_labels:
+                            new_labels[digit] = len(new_labels) + 1
+                        digit = new_labels[digit]
+                    encoded.append(digit)
+                if best is None or encoded < best:
+                    best = encoded
+                    next_states = [(view, perm, used + (row,), new_labels)]
+                elif encoded == best:
+                    next_states.append((view, perm, used + (row,), new_labels))
+        canonical.extend(best)
+        states = next_states
+
+    return bytes([size, block_rows, block_cols]) + bytes(canonical)
+
+
+def _next_rows(used: Tuple[int, ...], size: int, block_rows: int) -> List[int]:
+    """Rows that may come next: the rest of the current band, or any row of an unused band"""
+    if len(used) % block_rows:
+        band = used[-1] // block_rows
+        return [r for r in range(band * block_rows, (band + 1) * block_rows) if r not in used]
+    used_bands = {r // block_rows for r in used}
+    return [r for r in range(size) if r // block_rows not in used_bands]
+
+
+def canonical_zip(payload: Dict[str, Any]) -> bytes:
+    """Canonical form of a ZIP payload (dots, walls, path) under its symmetry group"""
+    rows, cols = zip_dimensions(payload)
+    dots = [(dot["row"], dot["col"]) for dot in sorted(payload["dots"], key=lambda d: d["index"])]
+    path = [(cell["row"], cell["col"]) for cell in payload.get("solution", [])]
+    walls = []
+    for wall in payload.get("walls", []):
+        row, col, side = wall["row"], wall["col"], wall["side"]
+        dr, dc = {"TOP": (-1, 0), "RIGHT": (0, 1), "BOTTOM": (1, 0), "LEFT": (0, -1)}[side]
+        walls.append(((row, col), (row + dr, col + dc)))
+
+    last_row, last_col = rows - 1, cols - 1
+    transforms = [
+        lambda r, c: (r, c),
+        lambda r, c: (last_row - r, last_col - c),
+        lambda r, c: (r, last_col - c),
+        lambda r, c: (last_row - r, c),
+    ]
+    if rows == cols:
+        # Square grids also have the quarter turns and diagonal flips
+        transforms += [
+            lambda r, c: (c, last_row - r),
+            lambda r, c: (last_col - c, r),
+            lambda r, c: (c, r),
+            lambda r, c: (last_col - c, last_row - r),
+        ]
+
+    best = None
+    for transform in transforms:
+        cells = lambda points: [cols * r + c for r, c in (transform(*p) for p in points)]
+        mapped_walls = sorted(tuple(sorted(cells(edge))) for edge in walls)
+        for reverse in (False, True):
+            mapped_dots = cells(reversed(dots) if reverse else dots)
+            mapped_path = cells(reversed(path) if reverse else path)
+            key = (mapped_dots, mapped_walls, mapped_path)
+            if best is None or key < best:
+                best = key
+
+    mapped_dots, mapped_walls, mapped_path = best
+    # Square grids keep their original single-byte header, so existing hashes stay valid
+    header = bytes([rows]) if rows == cols else bytes([0, rows, cols])
+    return (
+        header + bytes([len(mapped_dots)]) + bytes(mapped_dots)
+        + bytes([len(mapped_walls)]) + bytes(cell for edge in mapped_walls for cell in edge)
+        + bytes(mapped_path)
+    )
+
+
+def puzzle_hash(game_type: str, payload: Dict[str, Any]) -> int:
+    """Signed 64-bit hash of a payload's canonical form (fits a Firestore integer)"""
+    if "initialBoard" in payload:
+        canonical = canonical_sudoku(payload["initialBoard"], payload["blockRows"], payload["blockCols"])
+    else:
+        canonical = canonical_zip(payload)
+    digest = hashlib.blake2b(game_type.encode() + b"\0" + canonical, digest_size=8).digest()
+    return int.from_bytes(digest, "little", signed=True)
+
+
+class PuzzleIndex:
+    """Set of canonical puzzle hashes, stored as packed 8-byte integers"""
+
+    def __init__(self, hashes: Iterable[int] = ()):
+        self._hashes = set(hashes)
+
+    def __contains__(self, puzzle_hash: int) -> bool:
+        return puzzle_hash in self._hashes
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+    def add(self, puzzle_hash: int) -> None:
+        self._hashes.add(puzzle_hash)
+
+    def hashes(self) -> List[int]:
+        return sorted(self._hashes)
+
+    def to_bytes(self) -> bytes:
+        return struct.pack(f"<{len(self._hashes)}q", *self.hashes())
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "PuzzleIndex":
+        return cls(struct.unpack(f"<{len(data) // 8}q", data))
+
+    @classmethod
+    def load(cls, path: str) -> "PuzzleIndex":
+        """Read an index file, or start empty if it does not exist yet"""
+        if not os.path.exists(path):
+            return cls()
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+    def save(self, path: str) -> None:
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(self.to_bytes())
+        os.replace(tmp_path, path)
+
+
+def load_index(writer, game_type: str, path: Optional[str] = None) -> PuzzleIndex:
+    """Load the index for a game type from a local file if given, else from Firestore"""
+    if path:
+        return PuzzleIndex.load(path)
+    return PuzzleIndex(writer.get_puzzle_hashes(game_type))
@@ -0,0 +1,38 @@
+"""Registry of lazily built objects (generators, validators) keyed by game type"""
+import threading
+from typing import Any, Callable, Dict, Iterator, List, Mapping
+
+
+class LazyRegistry(Mapping):
+    """
+    Read-only mapping whose values are built by a factory on first access.
+
+    Lookups, membership tests and iteration over the keys never call a
+    factory, so a request only builds the objects it actually uses. Values
+    are built under a lock, so concurrent first lookups share one instance.
+    """
+
+    def __init__(self, factories: Dict[str, Callable[[], Any]]):
+        self._factories = dict(factories)
+        self._instances: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._instances:
+            with self._lock:
+                if key not in self._instances:
+                    self._instances[key] = self._factories[key]()
+        return self._instances[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._factories
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._factories)
+
+    def __len__(self) -> int:
+        return len(self._factories)
+
+    def created(self) -> List[Any]:
+        """The values built so far"""
+        return list(self._instances.values())
@@ -1,9 +1,22 @@
 """Puzzle validators package"""
-from .sudoku_validator import SudokuValidator
-
-__all__ = ['SudokuValidator']
-
+import importlib
 
+# Names are imported from their modules on first access (see generators/__init__.py)
+_EXPORTS = {
+    'SudokuValidator': '.sudoku_validator',
+    'BATCH_VALID': '.sudoku_validator',
+    'BATCH_ERROR_MESSAGES': '.sudoku_validator',
+    'ZipValidator': '.zip_validator',
+    'ZIP_BATCH_VALID': '.zip_validator',
+    'ZIP_BATCH_ERROR_MESSAGES': '.zip_validator',
+}
 
+__all__ = list(_EXPORTS)
 
 
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -1,14 +1,38 @@
-"""Sudoku 6×6 puzzle validator"""
+"""Sudoku puzzle validator (6×6 by default)"""
 from typing import List, Tuple
 
+from generators.sudoku_solver import create_solver
+
+# Per-board result codes of SudokuValidator.validate_batch(), in check order
+BATCH_VALID = 0
+BATCH_INITIAL_STRUCTURE = 1
+BATCH_SOLUTION_STRUCTURE = 2
+BATCH_SOLUTION_ROW = 3
+BATCH_SOLUTION_COLUMN = 4
+BATCH_SOLUTION_BLOCK = 5
+BATCH_INITIAL_MISMATCH = 6
+BATCH_GIVENS_COUNT = 7
+
+BATCH_ERROR_MESSAGES = {
+    BATCH_VALID: "Valid",
+    BATCH_INITIAL_STRUCTURE: "initialBoard has invalid structure",
+    BATCH_SOLUTION_STRUCTURE: "solutionBoard has invalid structure",
+    BATCH_SOLUTION_ROW: "solutionBoard is invalid: a row is invalid",
+    BATCH_SOLUTION_COLUMN: "solutionBoard is invalid: a column is invalid",
+    BATCH_SOLUTION_BLOCK: "solutionBoard is invalid: a block is invalid",
+    BATCH_INITIAL_MISMATCH: "initialBoard does not match solutionBoard",
+    BATCH_GIVENS_COUNT: "Invalid number of givens",
+}
+
 
 class SudokuValidator:
-    """Validates 6×6 Sudoku puzzles with 2×3 blocks"""
+    """Validates Sudoku puzzles with rectangular blocks (6×6 with 2×3 blocks by default)"""
     
     def __init__(self, size: int = 6, block_rows: int = 2, block_cols: int = 3):
         self.size = size
         self.block_rows = block_rows
         self.block_cols = block_cols
+        self.solver = create_solver(size, block_rows, block_cols)
     
     def validate_payload(self, payload: dict) -> Tuple[bool, str]:
         """
@@ -51,14 +75,79 @@ class SudokuValidator:
         
         # Check initial board has reasonable number of givens
         # Allow range for Easy (24-28), Medium (18-22), Hard (12-16)
+        # (ranges are for 6×6 and scale with board area)
         givens = sum(1 for row in initial_board for cell in row if cell != 0)
-        if givens < 12 or givens > 28:
-            return False, f"Invalid number of givens: {givens} (expected 12-22 for valid difficulty levels)"
+        min_givens = 12 * self.size * self.size // 36
+        max_givens = 28 * self.size * self.size // 36
+        if givens < min_givens or givens > max_givens:
+            return False, f"Invalid number of givens: {givens} (expected {min_givens}-{max_givens} for valid difficulty levels)"
+        
+        # Check the givens determine exactly one solution
+        if self.solver.count_solutions(initial_board, limit=2) != 1:
+            return False, "initialBoard does not have a unique solution"
         
         return True, "Valid"
     
+    def validate_batch(self, initial, solution):
+        """
+        Validate many boards at once with array operations.
+        
+        Runs the structure, completeness, consistency and givens checks of
+        validate_payload() for every board (the uniqueness check needs a
+        solver per board and is left to validate_payload()).
+        
+        Args:
+            initial: Integer array of shape [N, size, size] (0 = empty)
+            solution: Integer array of shape [N, size, size]
+        
+        Returns:
+            uint8 array of N codes: BATCH_VALID, or the first failed check
+            (see BATCH_ERROR_MESSAGES)
+        """
+        import numpy as np
+        
+        initial = np.asarray(initial)
+        solution = np.asarray(solution)
+        expected_shape = (self.size, self.size)
+        if initial.ndim != 3 or initial.shape[1:] != expected_shape or solution.shape != initial.shape:
+            raise ValueError(
+                f"Expected initial and solution of shape [N, {self.size}, {self.size}], "
+                f"got {initial.shape} and {solution.shape}"
+            )
+        if not (np.issubdtype(initial.dtype, np.integer) and np.issubdtype(solution.dtype, np.integer)):
+            raise ValueError("Boards must be integer arrays")
+        
+        codes = np.zeros(len(initial), dtype=np.uint8)
+        
+        def flag(failed, code):
+            codes[(codes == BATCH_VALID) & failed] = code
+        
+        flag(((initial < 0) | (initial > self.size)).any(axis=(1, 2)), BATCH_INITIAL_STRUCTURE)
+        flag(((solution < 0) | (solution > self.size)).any(axis=(1, 2)), BATCH_SOLUTION_STRUCTURE)
+        
+        # A row, column or block holds each digit exactly once iff the OR of
+        # its digit bits sets bits 1..size (empty cells set bit 0)
+        bits = np.left_shift(1, np.clip(solution, 0, self.size).astype(np.int64))
+        full = (1 << (self.size + 1)) - 2
+        blocks = bits.reshape(
+            len(bits), self.size // self.block_rows, self.block_rows, self.size // self.block_cols, self.block_cols
+        )
+        flag((np.bitwise_or.reduce(bits, axis=2) != full).any(axis=1), BATCH_SOLUTION_ROW)
+        flag((np.bitwise_or.reduce(bits, axis=1) != full).any(axis=1), BATCH_SOLUTION_COLUMN)
+        flag((np.bitwise_or.reduce(blocks, axis=(2, 4)) != full).any(axis=(1, 2)), BATCH_SOLUTION_BLOCK)
+        
+        given = initial != 0
+        flag((given & (initial != solution)).any(axis=(1, 2)), BATCH_INITIAL_MISMATCH)
+        
+        givens = given.sum(axis=(1, 2))
+        min_givens = 12 * self.size * self.size // 36
+        max_givens = 28 * self.size * self.size // 36
+        flag((givens < min_givens) | (givens > max_givens), BATCH_GIVENS_COUNT)
+        
+        return codes
+    
     def _validate_board_structure(self, board: List[List[int]]) -> bool:
-        """Check if board is a valid 6×6 grid with numbers 0-6"""
+        """Check if board is a valid size×size grid with numbers 0-size"""
         if not isinstance(board, list) or len(board) != self.size:
             return False
         
@@ -0,0 +1,252 @@
+"""ZIP puzzle validator (6×6 by default)"""
+from typing import Any, Dict, List, Optional, Tuple
+
+from generators.puzzle_encoding import wall_edge_count, zip_dimensions
+
+_WALL_DIRECTIONS = {"TOP": (-1, 0), "RIGHT": (0, 1), "BOTTOM": (1, 0), "LEFT": (0, -1)}
+
+# Per-puzzle result codes of ZipValidator.validate_batch(), in check order
+ZIP_BATCH_VALID = 0
+ZIP_BATCH_PATH_STRUCTURE = 1
+ZIP_BATCH_PATH_NOT_HAMILTONIAN = 2
+ZIP_BATCH_PATH_NOT_ADJACENT = 3
+ZIP_BATCH_WALL_CROSSED = 4
+ZIP_BATCH_DOT_STRUCTURE = 5
+ZIP_BATCH_DOT_ORDER = 6
+ZIP_BATCH_DOT_ENDS = 7
+
+ZIP_BATCH_ERROR_MESSAGES = {
+    ZIP_BATCH_VALID: "Valid",
+    ZIP_BATCH_PATH_STRUCTURE: "solution has invalid structure",
+    ZIP_BATCH_PATH_NOT_HAMILTONIAN: "solution does not visit every cell exactly once",
+    ZIP_BATCH_PATH_NOT_ADJACENT: "solution steps between non-adjacent cells",
+    ZIP_BATCH_WALL_CROSSED: "solution crosses a wall",
+    ZIP_BATCH_DOT_STRUCTURE: "dots have invalid structure",
+    ZIP_BATCH_DOT_ORDER: "solution does not visit the dots in order",
+    ZIP_BATCH_DOT_ENDS: "first and last dots are not the ends of the solution",
+}
+
+
+class ZipValidator:
+    """Validates ZIP puzzles on a rows × cols grid (6×6 by default)"""
+
+    def __init__(self, rows: int = 6, cols: Optional[int] = None):
+        self.rows = rows
+        self.cols = cols if cols is not None else rows
+        self.cells = self.rows * self.cols
+
+        # Bitmask of grid neighbors per cell (cell = row * cols + col)
+        self._neighbor_masks = []
+        for cell in range(self.cells):
+            row, col = divmod(cell, self.cols)
+            mask = 0
+            for dr, dc in _WALL_DIRECTIONS.values():
+                r, c = row + dr, col + dc
+                if 0 <= r < self.rows and 0 <= c < self.cols:
+                    mask |= 1 << (r * self.cols + c)
+            self._neighbor_masks.append(mask)
+
+    def validate_payload(self, payload: Dict[str, Any]) -> Tuple[bool, str]:
+        """
+        Validate a ZIP payload.
+
+        Returns:
+            (is_valid, error_message) tuple
+        """
+        # Check required fields
+        for field in ("dots", "solution"):
+            if field not in payload:
+                return False, f"Missing required field: {field}"
+
+        # Check dimensions
+        try:
+            rows, cols = zip_dimensions(payload)
+        except KeyError:
+            return False, "Missing required field: size (or rows and cols)"
+        if (rows, cols) != (self.rows, self.cols):
+            return False, f"Invalid size: expected {self.rows}×{self.cols}, got {rows}×{cols}"
+
+        path = self._cells(payload["solution"])
+        if path is None:
+            return False, "solution has invalid structure"
+
+        blocked = self._blocked_edges(payload.get("walls", []))
+        if blocked is None:
+            return False, "walls have invalid structure"
+
+        # Validate the solution is a Hamiltonian path that respects walls
+        is_valid, msg = self._validate_path(path, blocked)
+        if not is_valid:
+            return False, f"solution is invalid: {msg}"
+
+        # Validate the dots lie on the path in index order, from end to end
+        return self._validate_dots(payload["dots"], path)
+
+    def validate_batch(self, paths, dots, walls=None):
+        """
+        Validate many puzzles at once with array operations.
+
+        Runs the path, wall and dot checks of validate_payload() for every
+        puzzle. Cells are numbered row * cols + col.
+
+        Args:
+            paths: Integer array of shape [N, rows * cols], the solution cells in order
+            dots: Integer array of shape [N, K], the cells of dots 1..n in order,
+                padded with -1 after the last dot
+            walls: Optional bool array of shape [N, E] over the interior edges,
+                in the bit order of generators.puzzle_encoding.walls_to_mask()
+
+        Returns:
+            uint8 array of N codes: ZIP_BATCH_VALID, or the first failed check
+            (see ZIP_BATCH_ERROR_MESSAGES)
+        """
+        import numpy as np
+
+        paths = np.asarray(paths)
+        dots = np.asarray(dots)
+        if paths.ndim != 2 or paths.shape[1] != self.cells:
+            raise ValueError(f"Expected paths of shape [N, {self.cells}], got {paths.shape}")
+        if dots.ndim != 2 or len(dots) != len(paths):
+            raise ValueError(f"Expected dots of shape [{len(paths)}, K], got {dots.shape}")
+        if walls is not None:
+            walls = np.asarray(walls, dtype=bool)
+            edges = wall_edge_count(self.rows, self.cols)
+            if walls.shape != (len(paths), edges):
+                raise ValueError(f"Expected walls of shape [{len(paths)}, {edges}], got {walls.shape}")
+        if not (np.issubdtype(paths.dtype, np.integer) and np.issubdtype(dots.dtype, np.integer)):
+            raise ValueError("paths and dots must be integer arrays")
+
+        count = len(paths)
+        codes = np.zeros(count, dtype=np.uint8)
+
+        def flag(failed, code):
+            codes[(codes == ZIP_BATCH_VALID) & failed] = code
+
+        flag(((paths < 0) | (paths >= self.cells)).any(axis=1), ZIP_BATCH_PATH_STRUCTURE)
+        paths = np.clip(paths, 0, self.cells - 1).astype(np.int64)
+
+        # Every cell exactly once: the sorted path is 0 .. cells-1
+        steps = np.arange(self.cells)
+        flag((np.sort(paths, axis=1) != steps).any(axis=1), ZIP_BATCH_PATH_NOT_HAMILTONIAN)
+
+        # Steps move one column within a row, or one row
+        a, b = paths[:, :-1], paths[:, 1:]
+        low = np.minimum(a, b)
+        delta = np.abs(b - a)
+        horizontal = (delta == 1) & (a // self.cols == b // self.cols)
+        vertical = delta == self.cols
+        flag(~(horizontal | vertical).all(axis=1), ZIP_BATCH_PATH_NOT_ADJACENT)
+
+        if walls is not None:
+            # Edge index of each step: RIGHT edges first, then BOTTOM edges
+            right_edges = self.rows * (self.cols - 1)
+            edge = np.where(
+                horizontal,
+                low // self.cols * (self.cols - 1) + low % self.cols,
+                right_edges + np.minimum(low, walls.shape[1] - 1 - right_edges),
+            )
+            crossed = np.take_along_axis(walls, edge, axis=1) & (horizontal | vertical)
+            flag(crossed.any(axis=1), ZIP_BATCH_WALL_CROSSED)
+
+        # Dots: at least two, padding only after the last one, cells in range
+        present = dots >= 0
+        dot_count = present.sum(axis=1)
+        flag(
+            (dot_count < 2)
+            | (present[:, 1:] & ~present[:, :-1]).any(axis=1)
+            | (dots >= self.cells).any(axis=1),
+            ZIP_BATCH_DOT_STRUCTURE,
+        )
+
+        # Step at which the path visits each dot
+        position = np.zeros_like(paths)
+        np.put_along_axis(position, paths, np.broadcast_to(steps, paths.shape), axis=1)
+        dot_steps = np.take_along_axis(position, np.clip(dots, 0, self.cells - 1).astype(np.int64), axis=1)
+        flag((present[:, 1:] & (dot_steps[:, 1:] <= dot_steps[:, :-1])).any(axis=1), ZIP_BATCH_DOT_ORDER)
+
+        last = dot_steps[np.arange(count), np.maximum(dot_count - 1, 0)]
+        flag((dot_steps[:, 0] != 0) | (last != self.cells - 1), ZIP_BATCH_DOT_ENDS)
+
+        return codes
+
+    def _cells(self, solution: Any) -> Optional[List[int]]:
+        """Cell numbers of the solution path, or None if it is malformed"""
+        if not isinstance(solution, list) or len(solution) != self.cells:
+            return None
+
+        cells = []
+        for step in solution:
+            if not isinstance(step, dict):
+                return None
+            row, col = step.get("row"), step.get("col")
+            if not isinstance(row, int) or not isinstance(col, int):
+                return None
+            if not (0 <= row < self.rows and 0 <= col < self.cols):
+                return None
+            cells.append(row * self.cols + col)
+        return cells
+
+    def _blocked_edges(self, walls: Any) -> Optional[set]:
+        """Blocked (cell, cell) pairs in both directions, or None if a wall is malformed"""
+        if not isinstance(walls, list):
+            return None
+
+        blocked = set()
+        for wall in walls:
+            if not isinstance(wall, dict) or wall.get("side") not in _WALL_DIRECTIONS:
+                return None
+            row, col = wall.get("row"), wall.get("col")
+            if not isinstance(row, int) or not isinstance(col, int):
+                return None
+            dr, dc = _WALL_DIRECTIONS[wall["side"]]
+            if not (0 <= row < self.rows and 0 <= col < self.cols
+                    and 0 <= row + dr < self.rows and 0 <= col + dc < self.cols):
+                return None
+            a, b = row * self.cols + col, (row + dr) * self.cols + col + dc
+            blocked.add((a, b))
+            blocked.add((b, a))
+        return blocked
+
+    def _validate_path(self, path: List[int], blocked: set) -> Tuple[bool, str]:
+        """Check the path visits every cell once through open, adjacent edges"""
+        visited = 1 << path[0]
+        for a, b in zip(path, path[1:]):
+            if not self._neighbor_masks[a] >> b & 1:
+                return False, f"cells {divmod(a, self.cols)} and {divmod(b, self.cols)} are not adjacent"
+            if visited >> b & 1:
+                return False, f"cell {divmod(b, self.cols)} is visited twice"
+            if (a, b) in blocked:
+                return False, f"step {divmod(a, self.cols)} -> {divmod(b, self.cols)} crosses a wall"
+            visited |= 1 << b
+        return True, "Valid"
+
+    def _validate_dots(self, dots: Any, path: List[int]) -> Tuple[bool, str]:
+        """Check dots 1..n sit on the path in order, with dots 1 and n at its ends"""
+        if not isinstance(dots, list) or len(dots) < 2:
+            return False, "dots must be a list of at least 2 dots"
+
+        position = [0] * self.cells
+        for step, cell in enumerate(path):
+            position[cell] = step
+
+        steps = {}
+        for dot in dots:
+            if not isinstance(dot, dict):
+                return False, "dots have invalid structure"
+            row, col, index = dot.get("row"), dot.get("col"), dot.get("index")
+            if not all(isinstance(value, int) for value in (row, col, index)):
+                return False, "dots have invalid structure"
+            if not (0 <= row < self.rows and 0 <= col < self.cols):
+                return False, f"dot {index} is outside the grid"
+            steps[index] = position[row * self.cols + col]
+
+        if sorted(steps) != list(range(1, len(dots) + 1)):
+            return False, f"dot indices must be 1..{len(dots)}"
+
+        ordered = [steps[index] for index in range(1, len(dots) + 1)]
+        if any(later <= earlier for earlier, later in zip(ordered, ordered[1:])):
+            return False, "solution does not visit the dots in order"
+        if ordered[0] != 0 or ordered[-1] != self.cells - 1:
+            return False, "first and last dots must be the ends of the solution"
+
+        return True, "Valid"